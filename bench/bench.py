@@ -0,0 +1,360 @@
+# Developed By Nalin Ahuja, nalinahuja
+
+import os
+import sys
+import json
+import time
+import shutil
+import resource
+import tempfile
+import subprocess
+
+# End Imports-------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+# Benchmark Source Directory
+__BENCH_SRC = os.path.dirname(os.path.abspath(__file__))
+
+# AnnexFS Source Directory
+__ANNEXFS_SRC = os.path.join(__BENCH_SRC, "../src")
+
+# Benchmarked Operations
+__OPERATIONS = ("manifest", "transfer_from", "transfer_to", "create", "delete")
+
+# Compared Benchmark Metrics And Noise Floors
+__METRICS = {"wall_seconds": 0.05, "peak_rss_kib": 1024, "manifest_bytes": 1024}
+
+# End Constants-----------------------------------------------------------------------------------------------------------------------------------------------------------
+
+sys.path.insert(0, __ANNEXFS_SRC)
+
+from util import cli
+from util import profile
+
+# End Path Setup----------------------------------------------------------------------------------------------------------------------------------------------------------
+
+def write_file(path, size):
+    # Write File Of Specified Size
+    with open(path, "wb") as file:
+        # Write Data In Chunks
+        for offset in range(0, size, 1 << 24):
+            # Write Chunk
+            file.write(os.urandom(min(1 << 24, size - offset)))
+
+def build_tiny_files(path, scale):
+    # Get Scaled File Count
+    count = max(1, int(1000000 * scale))
+
+    # Iterate Over File Indices
+    for i in range(count):
+        # Form Path To Bucket Directory
+        bucket = os.path.join(path, f"{i // 1000:04d}")
+
+        # Check If File Starts A Bucket
+        if (i % 1000 == 0):
+            # Create Bucket Directory
+            os.makedirs(bucket)
+
+        # Write Tiny File
+        with open(os.path.join(bucket, f"{i:07d}"), "wb") as file:
+            # Write File Index
+            file.write(str(i).encode())
+
+def build_large_files(path, scale):
+    # Create Tree Directory
+    os.makedirs(path)
+
+    # Iterate Over File Indices
+    for i in range(3):
+        # Write Large File
+        write_file(os.path.join(path, f"large{i}"), max(1 << 20, int((2 << 30) * scale)))
+
+def build_deep_nesting(path, scale):
+    # Get Scaled Nesting Depth
+    depth = max(1, int(2000 * scale))
+
+    # Iterate Over Nesting Levels
+    for i in range(depth):
+        # Form Path To Nested Directory
+        path = os.path.join(path, "d")
+
+        # Create Nested Directory
+        os.makedirs(path)
+
+        # Write Level File
+        with open(os.path.join(path, "f"), "wb") as file:
+            # Write Level Index
+            file.write(str(i).encode())
+
+def build_wide_dirs(path, scale):
+    # Create Tree Directory
+    os.makedirs(path)
+
+    # Iterate Over Directory Indices
+    for i in range(max(1, int(100000 * scale))):
+        # Form Path To Wide Entry
+        entry = os.path.join(path, f"{i:06d}")
+
+        # Create Wide Entry Directory
+        os.mkdir(entry)
+
+def build_sparse_files(path, scale):
+    # Create Tree Directory
+    os.makedirs(path)
+
+    # Iterate Over File Indices
+    for i in range(4):
+        # Open Sparse File
+        with open(os.path.join(path, f"sparse{i}"), "wb") as file:
+            # Get Scaled Logical Size
+            size = max(1 << 24, int((4 << 30) * scale))
+
+            # Iterate Over Data Regions
+            for offset in range(0, size, size // 16):
+                # Seek To Data Region
+                file.seek(offset)
+
+                # Write Data Region
+                file.write(os.urandom(4096))
+
+            # Set Logical Size
+            file.truncate(size)
+
+# Benchmark Scenarios
+SCENARIOS = {
+    "tiny_files": build_tiny_files,
+    "large_files": build_large_files,
+    "deep_nesting": build_deep_nesting,
+    "wide_dirs": build_wide_dirs,
+    "sparse_files": build_sparse_files,
+}
+
+# End Scenario Functions--------------------------------------------------------------------------------------------------------------------------------------------------
+
+def run_child(op, path):
+    # Import AnnexFS And Manifest Modules
+    import axfs
+    from util import manifest
+
+    # Declare Source Manifest
+    tree = None
+
+    # Get Starting Counters
+    start_syscalls, start_time = profile.read_io_syscalls(), time.perf_counter()
+
+    # Check If Manifest Walk Is Measured
+    if (op == "manifest"):
+        # Walk Tree Into Manifest
+        tree, err = manifest.build(path), None
+    else:
+        # Perform Operation
+        err = getattr(axfs, op)(path)
+
+        # Reap Trash Left By Operation So Removal Cost Is Measured
+        axfs.reap()
+
+    # Get Ending Counters
+    end_time, end_syscalls = time.perf_counter(), profile.read_io_syscalls()
+
+    # Get Resource Usage
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+
+    # Compute Wall Time
+    wall = end_time - start_time
+
+    # Compute IO Syscall Count
+    syscalls = (end_syscalls - start_syscalls) if not(start_syscalls is None) else None
+
+    # Return Operation Metrics
+    return ({
+        "error": None if (err is None) else str(err),
+        "wall_seconds": wall,
+        "user_seconds": usage.ru_utime,
+        "system_seconds": usage.ru_stime,
+        "io_syscalls": syscalls,
+        "io_syscalls_per_second": (syscalls / wall) if (syscalls and wall > 0) else None,
+        "peak_rss_kib": usage.ru_maxrss,
+        "manifest_entries": None if (tree is None) else len(tree),
+        "manifest_bytes": None if (tree is None) else tree.nbytes(),
+        "copy_methods": dict(axfs.copy_report),
+    })
+
+def run_operation(op, path, env):
+    # Run Operation In Child Interpreter
+    proc = subprocess.run([sys.executable, __file__, "--child", op, path], env = env, capture_output = True, text = True)
+
+    # Verify Child Interpreter Succeeded
+    if (proc.returncode != 0):
+        # Raise Error
+        raise RuntimeError(f"benchmark of {op} failed {cli.RA} {proc.stderr.strip()}")
+
+    # Return Operation Metrics
+    return (json.loads(proc.stdout))
+
+def run_scenario(name, scale, main_dir, env):
+    # Form Path To Scenario Tree
+    tree = os.path.join(main_dir, name)
+
+    # Get Build Start Time
+    start = time.perf_counter()
+
+    # Build Scenario Tree
+    SCENARIOS[name](tree, scale)
+
+    # Initialize Scenario Results
+    results = {"build_seconds": time.perf_counter() - start}
+
+    # Iterate Over Walk And Transfer Operations
+    for op in ("manifest", "transfer_from", "transfer_to"):
+        # Run Transfer Operation
+        results[op] = run_operation(op, tree, env)
+
+    # Form Path To Link
+    link = os.path.join(main_dir, f"{name}.link")
+
+    # Iterate Over Linkage Operations
+    for op in ("create", "delete"):
+        # Run Linkage Operation
+        results[op] = run_operation(op, link, env)
+
+    # Remove Scenario Tree
+    shutil.rmtree(tree)
+
+    # Return Scenario Results
+    return (results)
+
+def compare(results, baseline, threshold):
+    # Initialize Regression List
+    regressions = []
+
+    # Iterate Over Baseline Scenarios
+    for name, base_ops in baseline.get("scenarios", {}).items():
+        # Iterate Over Baseline Operations
+        for op in (__OPERATIONS):
+            # Get Current And Baseline Metrics
+            cur, base = results["scenarios"].get(name, {}).get(op), base_ops.get(op)
+
+            # Verify Both Metrics Exist
+            if (cur is None or base is None):
+                # Continue Loop
+                continue
+
+            # Iterate Over Compared Metrics
+            for metric, floor in __METRICS.items():
+                # Get Current And Baseline Values
+                cur_value, base_value = cur.get(metric), base.get(metric)
+
+                # Verify Both Values Exist And Differ Beyond Noise Floor
+                if (not(cur_value and base_value) or (cur_value - base_value < floor)):
+                    # Continue Loop
+                    continue
+
+                # Check For Regression Beyond Threshold
+                if (cur_value > base_value * (1 + threshold)):
+                    # Append Regression
+                    regressions.append(f"{name}.{op}.{metric}: {base_value:.4g} {cli.RA} {cur_value:.4g} (+{(cur_value / base_value - 1) * 100:.1f}%)")
+
+    # Return Regressions
+    return (regressions)
+
+# End Benchmark Functions-------------------------------------------------------------------------------------------------------------------------------------------------
+
+if (__name__ == "__main__"):
+    # Check If Running As Child Interpreter
+    if (sys.argv[1:2] == ["--child"]):
+        # Print Operation Metrics
+        cli.write(json.dumps(run_child(sys.argv[2], sys.argv[3])))
+
+        # Exit Child Interpreter
+        sys.exit(0)
+
+    # Initialize Argument Parser
+    parser = cli.Parser(prog = "bench")
+
+    # Add Benchmark Arguments
+    parser.add_argument("--scenario", help = "scenario to run (repeatable)", action = "append", choices = tuple(SCENARIOS))
+    parser.add_argument("--scale", help = "scale factor for scenario sizes", type = float, default = 1.0)
+    parser.add_argument("--main-dir", help = "directory on the main disk for synthetic trees", type = str)
+    parser.add_argument("--annex-dir", help = "directory used as temporary annexfs root", type = str)
+    parser.add_argument("--output", help = "write results to json file", type = str)
+    parser.add_argument("--baseline", help = "compare results against baseline json file", type = str)
+    parser.add_argument("--threshold", help = "allowed relative regression over baseline", type = float, default = 0.10)
+    parser.add_argument("--allow-rename", help = "allow main and annex directories on one device", action = "store_true")
+
+    # Parse Arguments
+    args = parser.parse_args()
+
+    # Determine If Main And Annex Directories Share A Device
+    same_device = os.stat(args.main_dir or tempfile.gettempdir()).st_dev == os.stat(args.annex_dir or tempfile.gettempdir()).st_dev
+
+    # Verify Transfers Copy Data Unless Renames Are Allowed
+    if (same_device and not(args.allow_rename)):
+        # Print Error
+        parser.error("main and annex directories share a device so transfers only rename, pass --annex-dir on another device or --allow-rename")
+
+    # Create Temporary Main And Annex Directories
+    main_dir = tempfile.mkdtemp(prefix = "annexfs-main-", dir = args.main_dir)
+    annex_dir = tempfile.mkdtemp(prefix = "annexfs-annex-", dir = args.annex_dir)
+
+    # Form Path To Temporary Configuration
+    config_path = os.path.join(main_dir, "config.yml")
+
+    # Write Temporary Configuration
+    with open(config_path, "w") as file:
+        # Write AnnexFS Root
+        file.write(f"ANNEXFS_ROOT: {json.dumps(annex_dir)}\n")
+
+    # Form Child Environment
+    env = {**os.environ, "ANNEXFS_CONFIG": config_path}
+
+    # Initialize Benchmark Results
+    results = {"created": time.time(), "scale": args.scale, "main_dir": main_dir, "annex_dir": annex_dir, "transfer_method": "rename" if (same_device) else "copy", "scenarios": {}}
+
+    try:
+        # Iterate Over Selected Scenarios
+        for name in (args.scenario or SCENARIOS):
+            # Print Scenario Status
+            cli.write(f"bench: running {name} (scale {args.scale})")
+
+            # Run Scenario
+            results["scenarios"][name] = run_scenario(name, args.scale, main_dir, env)
+
+            # Iterate Over Scenario Operations
+            for op in (__OPERATIONS):
+                # Get Operation Metrics
+                metrics = results["scenarios"][name][op]
+
+                # Print Operation Metrics
+                cli.write(f"{cli.DA} {op:14} {metrics['wall_seconds']:9.3f}s  {metrics['peak_rss_kib']:8d} KiB" + (f"  {metrics['manifest_entries']} entries in {metrics['manifest_bytes']} B" if (metrics.get("manifest_bytes")) else "") + (f"  {cli.RA} {metrics['error']}" if (metrics["error"]) else ""))
+    finally:
+        # Remove Temporary Directories
+        shutil.rmtree(main_dir, ignore_errors = True)
+        shutil.rmtree(annex_dir, ignore_errors = True)
+
+    # Check If Results Should Be Saved
+    if (args.output):
+        # Write Results File
+        with open(args.output, "w") as file:
+            # Write Results As JSON
+            json.dump(results, file, indent = 2)
+
+    # Check If Baseline Is Specified
+    if (args.baseline):
+        # Read Baseline File
+        with open(args.baseline, "r") as file:
+            # Load Baseline Results
+            baseline = json.load(file)
+
+        # Compare Results Against Baseline
+        regressions = compare(results, baseline, args.threshold)
+
+        # Iterate Over Regressions
+        for regression in (regressions):
+            # Print Regression
+            cli.write(f"bench: regression {cli.RA} {regression}", file = sys.stderr)
+
+        # Check If Any Regression Was Found
+        if (regressions):
+            # Exit With Failure
+            sys.exit(1)
+
+# End Main Function-------------------------------------------------------------------------------------------------------------------------------------------------------
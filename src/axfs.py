@@ -1,37 +1,150 @@
 # Developed By Nalin Ahuja, nalinahuja
 
 import os
+import mmap
+import stat
+import time
+import array
+import fcntl
+import errno
+import queue
 import config
 import shutil
+import tarfile
+import threading
+import collections
 
 from util import id
 from util import cli
+from util import dev
 from util import sig
+from util import pool
+from util import digest
+from util import journal
+from util import catalog
+from util import roots
+from util import store
+from util import pack
+from util import manifest
+from util import plan
+from util import lease
+from util import profile
+from util import throttle
+from util import trash
+from util import swap
 
 from util.sig import SignalProtector
+from util.stats import Stats
 
 # End Imports------------------------------------------------------------------------------------------------------------------------------------------------------------
 
-# AnnexFS Root Path
-__ANNEXFS_ROOT = config.data["ANNEXFS_ROOT"]
+# AnnexFS Root Weights
+__ANNEXFS_ROOTS = dict(roots.parse(config.data))
 
-# End Constants----------------------------------------------------------------------------------------------------------------------------------------------------------
+# AnnexFS Root Paths
+__ANNEXFS_ROOT_PATHS = list(__ANNEXFS_ROOTS)
 
-def sanity_checks(func):
-    # Verify AnnexFS Root Path Is Set
-    if (__ANNEXFS_ROOT is None):
-        # Raise Error
-        raise ValueError(f"annexfs root is {cli.U}{__ANNEXFS_ROOT}{cli.N}")
+# AnnexFS Copy Workers
+__ANNEXFS_JOBS = config.data.get("ANNEXFS_JOBS")
 
-    # Verify AnnexFS Root Exists
-    elif (not(os.path.exists(__ANNEXFS_ROOT))):
-        # Raise Error
-        raise FileNotFoundError(f"annexfs root {cli.U}{__ANNEXFS_ROOT}{cli.N} does not exist")
+# AnnexFS Deduplication Default
+__ANNEXFS_DEDUP = config.data.get("ANNEXFS_DEDUP", False)
 
-    # Verify AnnexFS Root Is A Directory
-    elif (not(os.path.isdir(__ANNEXFS_ROOT))):
-        # Raise Error
-        raise NotADirectoryError(f"annexfs root {cli.U}{__ANNEXFS_ROOT}{cli.N} is not a directory")
+# AnnexFS Pack Size Limit
+__ANNEXFS_PACK_SIZE = cli.parse_size(str(config.data.get("ANNEXFS_PACK_SIZE", "1G")))
+
+# Reflink Clone Request Code
+__FICLONE = 0x40049409
+
+# Kernel Copy Chunk Size
+__COPY_CHUNK = 64 * 1024 * 1024
+
+# Buffered Copy Chunk Size
+__BUFFER_CHUNK = 1024 * 1024
+
+# Zero Chunk Digested In Place Of Holes
+__ZERO_CHUNK = bytes(__BUFFER_CHUNK)
+
+# Streaming Copy File Size Threshold
+__STREAM_THRESHOLD = cli.parse_size(str(config.data.get("ANNEXFS_STREAM_THRESHOLD", "1G")))
+
+# Streaming Copy Buffer Size
+__STREAM_BUFFER = cli.parse_size(str(config.data.get("ANNEXFS_STREAM_BUFFER", "16M")))
+
+# Streaming Copy Cache Policy
+__STREAM_CACHE = config.data.get("ANNEXFS_STREAM_CACHE", "drop")
+
+# Streaming Copy Direct IO
+__STREAM_DIRECT = config.data.get("ANNEXFS_STREAM_DIRECT", False)
+
+# Streaming Copy Writeback Interval
+__STREAM_SYNC = 64 * 1024 * 1024
+
+# Direct IO Alignment
+__DIRECT_ALIGN = 4096
+
+# Transfer Verification Modes
+VERIFY_MODES = ("walk", "size", "hash")
+
+# Copy Method Fallback Errors
+__COPY_FALLBACK_ERRORS = (errno.EXDEV, errno.EINVAL, errno.ENOSYS, errno.ENOTTY, errno.EOPNOTSUPP, errno.EBADF)
+
+# Copy Method Report
+copy_report = collections.Counter()
+
+# Copy Method Report Lock
+__COPY_REPORT_LOCK = threading.Lock()
+
+# Active Transfers Per Root
+__ROOT_LOAD = roots.Load()
+
+# Eviction Access Time Granularity
+__EVICT_ATIME_BUCKET = 24 * 60 * 60
+
+# Scrub Read Rate Limit
+__SCRUB_RATE = cli.parse_size(str(config.data.get("ANNEXFS_SCRUB_RATE", "0")))
+
+# Scrub Age In Days Before Entries Are Scrubbed Again
+__SCRUB_AGE = float(config.data.get("ANNEXFS_SCRUB_AGE", 30))
+
+# Trash Reap Mode
+REAP_MODE = config.data.get("ANNEXFS_REAP", "after")
+
+# Transfer Byte Rate Limit
+__BYTE_LIMIT = throttle.Bucket(cli.parse_size(str(config.data.get("ANNEXFS_BWLIMIT", "0"))))
+
+# Transfer File Rate Limit
+__FILE_LIMIT = throttle.Bucket(float(config.data.get("ANNEXFS_FILE_LIMIT", 0)))
+
+# Concurrent Transfer Slots Per Device
+__DEVICE_SLOTS = int(config.data.get("ANNEXFS_DEVICE_SLOTS", 1))
+
+# Entry Metadata File Names
+__ENTRY_META = (digest.NAME, journal.NAME, store.META, pack.INDEX)
+
+# Atomic Swap Temporary Name Suffix
+__SWAP_SUFFIX = ".axfs-swap"
+
+# Replaced Path Temporary Name Suffix
+__SWAP_OLD_SUFFIX = ".axfs-old"
+
+# Seconds A Registered Trash Item May Be Missing Before Its Record Is Stale
+__TRASH_GRACE = 60 * 60
+
+# End Constants----------------------------------------------------------------------------------------------------------------------------------------------------------
+
+def sanity_checks(func):
+    # Iterate Over AnnexFS Root Paths
+    for root in (__ANNEXFS_ROOT_PATHS):
+        # Verify AnnexFS Root Exists
+        if (not(os.path.exists(root))):
+            # Raise Error
+            raise FileNotFoundError(f"annexfs root {cli.U}{root}{cli.N} does not exist")
+
+        # Verify AnnexFS Root Is A Directory
+        elif (not(os.path.isdir(root))):
+            # Raise Error
+            raise NotADirectoryError(f"annexfs root {cli.U}{root}{cli.N} is not a directory")
 
     # Return Callback Function
     return (func)
@@ -97,372 +210,2717 @@ def get_file_size(path):
     # Return File Size
     return (file_stat.st_size)
 
-def get_dir_size(path):
-    # Initialize Directory Size
-    dir_size = 0
+def get_file_meta(path):
+    # Get File Statistics
+    file_stat = os.stat(path)
 
-    # Recurse Through File Tree
-    with os.scandir(path) as ft:
-        # Iterate Over File Tree Entries
-        for entry in (ft):
-            # Process Entry As File
-            if (entry.is_file()):
-                # Get File Statistics
-                file_stat = entry.stat()
+    # Return File Mode And Timestamps
+    return (file_stat.st_mode, file_stat.st_atime_ns, file_stat.st_mtime_ns)
 
-                # Update Directory Size
-                dir_size += file_stat.st_size
+def set_file_meta(path, meta):
+    # Get File Mode And Timestamps
+    mode, atime_ns, mtime_ns = meta
 
-            # Process Entry As Directory
-            elif (entry.is_dir()):
-                # Update Directory Size
-                dir_size += get_dir_size(entry.path)
+    # Set File Mode
+    os.chmod(path, mode)
+
+    # Set File Timestamps
+    os.utime(path, ns = (atime_ns, mtime_ns))
 
+def get_dir_size(path):
     # Return Directory Size
-    return (dir_size)
+    return (get_dir_stats(path)[0])
+
+def get_dir_stats(path):
+    # Initialize Directory Size And File Count
+    dir_size = dir_files = 0
+
+    # Initialize Directory Stack
+    stack = [path]
+
+    # Iterate Until Directory Stack Is Exhausted
+    while (stack):
+        # Scan Next Directory
+        with os.scandir(stack.pop()) as ft:
+            # Iterate Over File Tree Entries
+            for entry in (ft):
+                # Process Entry As File
+                if (entry.is_file()):
+                    # Get File Statistics
+                    file_stat = entry.stat()
+
+                    # Update Directory Size And File Count
+                    dir_size, dir_files = dir_size + file_stat.st_size, dir_files + 1
+
+                # Process Entry As Directory
+                elif (entry.is_dir()):
+                    # Push Subdirectory
+                    stack.append(entry.path)
+
+    # Return Directory Size And File Count
+    return (dir_size, dir_files)
+
+def get_dir_usage(path):
+    # Initialize Directory Usage And Last Access Time
+    dir_usage = dir_atime = 0
+
+    # Initialize Directory Stack
+    stack = [path]
+
+    # Iterate Until Directory Stack Is Exhausted
+    while (stack):
+        # Scan Next Directory
+        with os.scandir(stack.pop()) as ft:
+            # Iterate Over File Tree Entries
+            for entry in (ft):
+                # Process Entry As File
+                if (entry.is_file(follow_symlinks = False)):
+                    # Get File Statistics
+                    file_stat = entry.stat(follow_symlinks = False)
+
+                    # Update Directory Usage And Last Access Time
+                    dir_usage, dir_atime = dir_usage + file_stat.st_blocks * 512, max(dir_atime, file_stat.st_atime)
+
+                # Process Entry As Directory
+                elif (entry.is_dir(follow_symlinks = False)):
+                    # Push Subdirectory
+                    stack.append(entry.path)
+
+    # Return Directory Usage And Last Access Time
+    return (dir_usage, dir_atime)
+
+def get_free_space(path):
+    # Get File System Statistics
+    fs_stat = os.statvfs(path)
+
+    # Return Available And Total Space
+    return (fs_stat.f_bavail * fs_stat.f_frsize, fs_stat.f_blocks * fs_stat.f_frsize)
+
+def is_same_device(path_a, path_b):
+    # Get Path Statistics
+    stat_a = os.stat(path_a)
+    stat_b = os.stat(path_b)
+
+    # Return Device Equality
+    return (stat_a.st_dev == stat_b.st_dev)
+
+def rename_path(src_path, dst_path):
+    try:
+        # Rename Source Path To Destination Path
+        os.rename(src_path, dst_path)
+    except OSError as e:
+        # Verify Error Is A Cross Device Link
+        if (e.errno != errno.EXDEV):
+            # Raise Error
+            raise e
 
-# End File Functions-----------------------------------------------------------------------------------------------------------------------------------------------------
+        # Return Failure
+        return (False)
 
-@sanity_checks
-def create(link_path):
-    # Expand Symbolic Link Path
-    link_path = expand_path(link_path)
+    # Return Success
+    return (True)
 
-    # Verify Symbolic Link Path Does Not Exist
-    if (os.path.exists(link_path)):
-        # Return Error
-        return (FileExistsError(f"link path {cli.U}{link_path}{cli.N} exists"))
+def resolve_jobs(jobs, *paths):
+    # Check If Worker Count Is Specified
+    if (jobs is None):
+        # Set Worker Count From Configuration
+        jobs = __ANNEXFS_JOBS
 
-    # Get Symbolic Link Directory
-    link_dir = os.path.dirname(link_path)
+    # Check If Worker Count Is Configured
+    if (jobs is None):
+        # Set Worker Count From Devices
+        jobs = dev.default_jobs(*paths)
 
-    # Verify Symbolic Link Directory Exists
-    if (not(os.path.exists(link_dir))):
-        # Return Error
-        return (FileNotFoundError(f"link directory {cli.U}{link_dir}{cli.N} does not exist"))
+    # Verify Worker Count Is Positive
+    if (jobs < 1):
+        # Raise Error
+        raise ValueError(f"worker count {cli.U}{jobs}{cli.N} is not positive")
 
-    # Form Enclosing Path Until Unique
-    while (True):
-        # Form Path To Enclosing Directory
-        enc_path = os.path.join(__ANNEXFS_ROOT, id.generate(link_path))
+    # Return Worker Count
+    return (jobs)
 
-        # Verify Enclosing Path Is Unique
-        if (not(os.path.exists(enc_path))):
-            # Break Loop
-            break
+def set_limits(bwlimit = None, file_limit = None):
+    # Declare Transfer Rate Limit Globals
+    global __BYTE_LIMIT, __FILE_LIMIT
 
-    # Form Path To Destination Directory
-    dst_path = os.path.join(enc_path, os.path.basename(link_path))
+    # Check If Byte Rate Limit Is Specified
+    if (not(bwlimit is None)):
+        # Set Transfer Byte Rate Limit
+        __BYTE_LIMIT = throttle.Bucket(bwlimit)
 
-    try:
-        # Create Destination Directory
-        os.makedirs(dst_path)
+    # Check If File Rate Limit Is Specified
+    if (not(file_limit is None)):
+        # Set Transfer File Rate Limit
+        __FILE_LIMIT = throttle.Bucket(file_limit)
 
-        # Disable Enclosing Directory Writes
-        disable_write_perms(enc_path)
-    except (KeyboardInterrupt, Exception) as e:
-        # Protect Cleanup From SIGINT
-        with SignalProtector(sig.SIGINT):
-            # Verify Enclosing Directory Exists
-            if (os.path.exists(enc_path)):
-                # Enable Enclosing Directory Writes
-                enable_write_perms(enc_path)
+def pace(count = 0, files = 0):
+    # Take Byte Tokens From Transfer Limit
+    __BYTE_LIMIT.consume(count)
 
-                # Delete Enclosing Directory
-                shutil.rmtree(enc_path)
+    # Take File Tokens From Transfer Limit
+    __FILE_LIMIT.consume(files)
 
-        # Determine Error Handling
-        if (isinstance(e, KeyboardInterrupt)):
-            # Raise Interrupt
+def paced(progress):
+    def wrapper(count = 0, files = 0):
+        # Wait For Transfer Limits
+        pace(count, files)
+
+        # Report Progress
+        progress(count, files)
+
+    # Return Paced Progress Callback
+    return (wrapper)
+
+def copy_chunk():
+    # Return Kernel Copy Chunk No Larger Than One Second Of Byte Limit
+    return (__COPY_CHUNK if not(__BYTE_LIMIT.rate) else max(__BUFFER_CHUNK, min(__COPY_CHUNK, int(__BYTE_LIMIT.rate))))
+
+def copy_reflink(src_fd, dst_fd, progress):
+    try:
+        # Clone Source Extents Into Destination
+        fcntl.ioctl(dst_fd, __FICLONE, src_fd)
+    except OSError as e:
+        # Verify Error Permits Fallback
+        if (not(e.errno in __COPY_FALLBACK_ERRORS)):
+            # Raise Error
             raise e
-        else:
-            # Return Exception
-            return (OSError("annexfs could not create new entry"))
 
-    # Protect Symlink Creation From SIGINT
-    with SignalProtector(sig.SIGINT):
-        # Create Symbolic Link To Directory
-        os.symlink(dst_path, link_path)
+        # Return Failure
+        return (False)
+
+    # Report Cloned Bytes
+    progress(os.fstat(src_fd).st_size)
 
     # Return Success
-    return (None)
+    return (True)
 
-@sanity_checks
-def delete(link_path):
-    # Expand Symbolic Link Path
-    link_path = expand_path(link_path)
+def copy_kernel(src_fd, dst_fd, copy_func, progress):
+    # Initialize Copied Byte Count
+    copied = 0
 
-    # Verify Symbolic Link Path Exists
-    if (not(os.path.exists(link_path))):
-        # Return Error
-        return (FileNotFoundError(f"link path {cli.U}{link_path}{cli.N} does not exist"))
+    # Copy Until End Of File
+    while (True):
+        try:
+            # Copy Chunk Within Kernel
+            count = copy_func(src_fd, dst_fd, copy_chunk())
+        except OSError as e:
+            # Verify Error Permits Fallback Before Any Data Is Copied
+            if (copied or not(e.errno in __COPY_FALLBACK_ERRORS)):
+                # Raise Error
+                raise e
 
-    # Get Path To Destination Directory
-    dst_path = os.path.realpath(link_path)
+            # Return Failure
+            return (False)
 
-    # Verify Destination Path Is An Internal Symbolic Link
-    if (not(os.path.islink(link_path) and dst_path.startswith(__ANNEXFS_ROOT))):
-        # Return Error
-        return (ValueError(f"destination path {cli.U}{link_path}{cli.N} is not an internal symbolic link"))
+        # Check For End Of File
+        if (count == 0):
+            # Return Success
+            return (True)
 
-    # Get Path To Enclosing Directory
-    enc_path = os.path.dirname(dst_path)
+        # Update Copied Byte Count
+        copied += count
 
-    # Verify Path To Enclosing Directory Exists
-    if (not(os.path.exists(enc_path))):
-        # Return Error
-        return (FileNotFoundError(f"annexfs has not stored {cli.U}{link_path}{cli.N}"))
+        # Wait For Transfer Byte Limit
+        pace(count)
 
-    try:
-        # Enable Enclosing Directory Writes
-        enable_write_perms(enc_path)
+        # Report Copied Bytes
+        progress(count)
 
-        # Remove Enclosing Directory
-        shutil.rmtree(enc_path)
-    except (KeyboardInterrupt, Exception) as e:
-        # Protect Cleanup From SIGINT
-        with SignalProtector(sig.SIGINT):
-            # Check If Destination Directory Exists
-            if (os.path.exists(dst_path)):
-                # Disable Enclosing Directory Writes
-                disable_write_perms(enc_path)
+def copy_buffered(src_fd, dst_fd, progress, hash = None):
+    # Copy Until End Of File
+    while (True):
+        # Read Chunk From Source
+        chunk = os.read(src_fd, __BUFFER_CHUNK)
+
+        # Check For End Of File
+        if (not(chunk)):
+            # Return Success
+            return (True)
+
+        # Check If Streaming Digest Is Specified
+        if (not(hash is None)):
+            # Update Streaming Digest
+            hash.update(chunk)
+
+        # Initialize Chunk View
+        view = memoryview(chunk)
+
+        # Write Chunk To Destination
+        while (view):
+            # Advance Chunk View
+            view = view[os.write(dst_fd, view):]
+
+        # Wait For Transfer Byte Limit
+        pace(len(chunk))
+
+        # Report Copied Bytes
+        progress(len(chunk))
+
+def copy_range(src_fd, dst_fd, offset, end, progress, hash = None):
+    # Determine If Range Can Be Copied Within Kernel
+    kernel = hash is None
+
+    # Copy Until End Of Range
+    while (offset < end):
+        # Check If Range Is Copied Within Kernel
+        if (kernel):
+            try:
+                # Copy Chunk Within Kernel At Offset
+                count = os.copy_file_range(src_fd, dst_fd, min(copy_chunk(), end - offset), offset, offset)
+            except OSError as e:
+                # Verify Error Permits Fallback
+                if (not(e.errno in __COPY_FALLBACK_ERRORS)):
+                    # Raise Error
+                    raise e
+
+                # Disable Kernel Copy
+                kernel = False
+
+                # Continue Loop
+                continue
+        else:
+            # Read Chunk From Source At Offset
+            chunk = os.pread(src_fd, min(__BUFFER_CHUNK, end - offset), offset)
 
-        # Determine Error Handling
-        if (isinstance(e, KeyboardInterrupt)):
-            # Raise Interrupt
-            raise e
-        elif (os.path.exists(dst_path)):
-            # Return Exception
-            return (OSError("annexfs could not delete existing entry"))
+            # Check If Streaming Digest Is Specified
+            if (not(hash is None)):
+                # Update Streaming Digest
+                hash.update(chunk)
 
-    # Protect Symlink Deletion From SIGINT
-    with SignalProtector(sig.SIGINT):
-        # Remove Symbolic Link
-        os.remove(link_path)
+            # Initialize Write Offset
+            count = 0
 
-    # Return Success
-    return (None)
+            # Write Chunk To Destination At Offset
+            while (count < len(chunk)):
+                # Advance Write Offset
+                count += os.pwrite(dst_fd, chunk[count:], offset + count)
 
-# End Linkage Functions--------------------------------------------------------------------------------------------------------------------------------------------------
+        # Check For Truncated Source
+        if (count == 0):
+            # Return Copied End
+            return (offset)
 
-@sanity_checks
-def transfer_from(src_path):
-    # Expand Source Path
-    src_path = expand_path(src_path)
+        # Update Range Offset
+        offset += count
 
-    # Verify Source Path Exists
-    if (not(os.path.exists(src_path))):
-        # Return Error
-        return (FileNotFoundError(f"source path {cli.U}{src_path}{cli.N} does not exist"))
+        # Wait For Transfer Byte Limit
+        pace(count)
 
-    # Verify Source Path Is Not A Symbolic Link
-    if (os.path.islink(src_path)):
-        # Return Error
-        return (ValueError(f"source path {cli.U}{src_path}{cli.N} is a symbolic link"))
+        # Report Copied Bytes
+        progress(count)
 
-    # Form Enclosing Path Until Unique
-    while (True):
-        # Form Path To Enclosing Directory
-        enc_path = os.path.join(__ANNEXFS_ROOT, id.generate(src_path))
+    # Return Copied End
+    return (offset)
 
-        # Verify Enclosing Path Is Unique
-        if (not(os.path.exists(enc_path))):
+def skip_hole(offset, end, progress, hash = None):
+    # Iterate Over Hole Chunks
+    while (offset < end):
+        # Get Hole Chunk Size
+        count = min(__BUFFER_CHUNK, end - offset)
+
+        # Check If Streaming Digest Is Specified
+        if (not(hash is None)):
+            # Digest Hole As Zeros
+            hash.update(__ZERO_CHUNK[:count])
+
+        # Update Hole Offset
+        offset += count
+
+        # Report Skipped Bytes
+        progress(count)
+
+def copy_sparse(src_fd, dst_fd, progress, hash = None):
+    # Get Source File Size
+    size = os.fstat(src_fd).st_size
+
+    # Initialize Source Offset
+    offset = 0
+
+    # Iterate Over Data Extents
+    while (offset < size):
+        try:
+            # Seek To Next Data Extent
+            data = os.lseek(src_fd, offset, os.SEEK_DATA)
+        except OSError as e:
+            # Check If Source Ends With A Hole
+            if (e.errno == errno.ENXIO):
+                # Set Data Extent To End Of File
+                data = size
+
+            # Check If Holes Cannot Be Found Before Any Data Is Copied
+            elif (offset == 0 and e.errno in __COPY_FALLBACK_ERRORS):
+                # Return Failure
+                return (False)
+            else:
+                # Raise Error
+                raise e
+
+        # Skip Hole Before Data Extent
+        skip_hole(offset, min(data, size), progress, hash)
+
+        # Check If Data Extent Lies Before End Of File
+        if (data >= size):
             # Break Loop
             break
 
-    # Get Source Path Components
-    src_path, src_bname, src_fname = componentize_path(src_path)
+        # Get End Of Data Extent
+        hole = min(os.lseek(src_fd, data, os.SEEK_HOLE), size)
 
-    # Form Path To Destination Directory
-    dst_path = os.path.join(enc_path, src_bname)
+        # Copy Data Extent To Same Offset
+        offset = copy_range(src_fd, dst_fd, data, hole, progress, hash)
+
+        # Check For Truncated Source
+        if (offset < hole):
+            # Break Loop
+            break
+
+    # Set Destination Size Including Trailing Hole
+    os.ftruncate(dst_fd, size)
+
+    # Return Success
+    return (True)
+
+def set_direct(fd, enabled):
+    # Get File Status Flags
+    flags = fcntl.fcntl(fd, fcntl.F_GETFL)
 
     try:
-        # Create Destination Directory
-        os.makedirs(dst_path)
+        # Set Or Clear Direct IO Flag
+        fcntl.fcntl(fd, fcntl.F_SETFL, (flags | os.O_DIRECT) if (enabled) else (flags & ~os.O_DIRECT))
+    except OSError:
+        # Return Failure
+        return (False)
 
-        # Disable Enclosing Directory Writes
-        disable_write_perms(enc_path)
-    except (KeyboardInterrupt, Exception) as e:
-        # Protect Cleanup From SIGINT
-        with SignalProtector(sig.SIGINT):
-            # Verify Enclosing Directory Exists
-            if (os.path.exists(enc_path)):
-                # Enable Enclosing Directory Writes
-                enable_write_perms(enc_path)
+    # Return Success
+    return (True)
 
-                # Delete Enclosing Directory
-                shutil.rmtree(enc_path)
+def drop_cache(fd, offset, length):
+    # Check If Cache Should Be Dropped
+    if (__STREAM_CACHE == "drop" and length > 0):
+        # Advise Kernel To Drop Cached Range
+        os.posix_fadvise(fd, offset, length, os.POSIX_FADV_DONTNEED)
 
-        # Determine Error Handling
-        if (isinstance(e, KeyboardInterrupt)):
-            # Raise Interrupt
-            raise e
-        else:
-            # Return Exception
-            return (OSError("annexfs could not create new entry"))
+def copy_stream(src_fd, dst_fd, progress, hash = None):
+    # Allocate Page Aligned Double Buffers
+    buffers = [mmap.mmap(-1, __STREAM_BUFFER) for i in range(2)]
 
-    # Determine Transfer Type
-    if (not(src_fname is None)):
-        # Form Paths To Source And Destination Files
-        src_file = os.path.join(src_path, src_fname)
-        dst_file = os.path.join(dst_path, src_fname)
+    # Initialize Free And Filled Buffer Queues
+    free, filled = queue.Queue(), queue.Queue()
 
-        try:
-            # Copy Source File To Destination Directory
-            shutil.copy2(src_file, dst_file, follow_symlinks = False)
-        except (KeyboardInterrupt, Exception) as e:
-            # Protect Cleanup From SIGINT
-            with SignalProtector(sig.SIGINT):
-                # Enable Enclosing Directory Writes
-                enable_write_perms(enc_path)
+    # Iterate Over Buffers
+    for buffer in (buffers):
+        # Mark Buffer As Free
+        free.put(buffer)
 
-                # Delete Enclosing Directory
-                shutil.rmtree(enc_path, onerror = rm_onerror)
+    # Determine Direct IO On Source And Destination
+    direct = __STREAM_DIRECT and set_direct(src_fd, True) and set_direct(dst_fd, True)
 
-            # Determine Error Handling
-            if (isinstance(e, KeyboardInterrupt)):
-                # Raise Interrupt
-                raise e
-            else:
-                # Return Exception
-                return (OSError("annexfs file transfer was terminated due to error"))
+    # Advise Kernel Of Sequential Source Access
+    os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
 
-        # Protect Post Copy Instructions From SIGINT
-        with SignalProtector(sig.SIGINT):
-            # Get Source And Destination File Sizes
-            src_file_size = get_file_size(src_file)
-            dst_file_size = get_file_size(dst_file)
+    def read_ahead():
+        # Initialize Read Offset
+        offset = 0
 
-            # Verify Source And Destination File Sizes Are Equal
-            if (src_file_size != dst_file_size):
-                # Enable Enclosing Directory Writes
-                enable_write_perms(enc_path)
+        try:
+            # Read Until End Of File Or Cancellation
+            while (True):
+                # Get Free Buffer
+                buffer = free.get()
 
-                # Delete Enclosing Directory
-                shutil.rmtree(enc_path, onerror = rm_onerror)
+                # Check For Cancellation
+                if (buffer is None):
+                    # Return From Reader
+                    return
 
-                # Return Error
-                return (OSError("annexfs file transfer was unsuccessful"))
+                # Read Chunk Into Buffer
+                count = os.readv(src_fd, [buffer])
 
-            # Remove Source File
-            os.remove(src_file)
+                # Hand Filled Buffer To Writer
+                filled.put((buffer, count))
 
-            # Create Symbolic Link To File
-            os.symlink(dst_file, src_file)
+                # Drop Cached Source Range
+                drop_cache(src_fd, offset, count)
 
-    else:
-        # Form Paths To Source And Destination Directories
-        src_dir = src_path
-        dst_dir = dst_path
+                # Update Read Offset
+                offset += count
 
-        try:
-            # Copy Files From Source To Destination
-            shutil.copytree(src_dir, dst_dir, dirs_exist_ok = True)
-        except (KeyboardInterrupt, Exception) as e:
-            # Protect Cleanup From SIGINT
-            with SignalProtector(sig.SIGINT):
-                # Enable Enclosing Directory Writes
-                enable_write_perms(enc_path)
+                # Check For End Of File
+                if (count == 0):
+                    # Return From Reader
+                    return
+        except OSError as e:
+            # Hand Error To Writer
+            filled.put((None, e))
 
-                # Delete Enclosing Directory
-                shutil.rmtree(enc_path, onerror = rm_onerror)
+    # Start Read Ahead Thread
+    reader = threading.Thread(target = read_ahead, daemon = True)
+    reader.start()
 
-            # Determine Error Handling
-            if (isinstance(e, KeyboardInterrupt)):
-                # Raise Interrupt
-                raise e
-            else:
-                # Return Exception
-                return (OSError("annexfs directory transfer was terminated due to error"))
+    # Initialize Written And Synchronized Byte Counts
+    written = synced = 0
 
-        # Protect Post Copy Instructions From SIGINT
-        with SignalProtector(sig.SIGINT):
-            # Get Source And Destination Directory Sizes
-            src_dir_size = get_dir_size(src_dir)
-            dst_dir_size = get_dir_size(dst_dir)
+    try:
+        # Write Until End Of File
+        while (True):
+            # Get Filled Buffer
+            buffer, count = filled.get()
+
+            # Check For Reader Error
+            if (buffer is None):
+                # Raise Error
+                raise count
+
+            # Check For End Of File
+            if (count == 0):
+                # Break Loop
+                break
+
+            # Initialize Chunk View
+            with memoryview(buffer)[:count] as view:
+                # Check If Streaming Digest Is Specified
+                if (not(hash is None)):
+                    # Update Streaming Digest
+                    hash.update(view)
+
+                # Check If Unaligned Tail Is Written With Direct IO
+                if (direct and (count % __DIRECT_ALIGN)):
+                    # Clear Destination Direct IO Flag
+                    direct = not(set_direct(dst_fd, False))
+
+                # Initialize Write Offset
+                done = 0
+
+                # Write Chunk To Destination
+                while (done < count):
+                    # Advance Write Offset
+                    done += os.write(dst_fd, view[done:])
+
+            # Return Buffer To Reader
+            free.put(buffer)
+
+            # Update Written Byte Count
+            written += count
+
+            # Wait For Transfer Byte Limit
+            pace(count)
+
+            # Report Copied Bytes
+            progress(count)
+
+            # Check If Writeback Interval Elapsed
+            if (__STREAM_CACHE == "drop" and written - synced >= __STREAM_SYNC):
+                # Flush Written Range
+                os.fdatasync(dst_fd)
+
+                # Drop Cached Destination Range
+                drop_cache(dst_fd, synced, written - synced)
+
+                # Update Synchronized Byte Count
+                synced = written
+    finally:
+        # Cancel Read Ahead Thread
+        free.put(None)
+
+        # Wait For Read Ahead Thread
+        reader.join()
+
+        # Iterate Over Buffers
+        for buffer in (buffers):
+            # Release Buffer
+            buffer.close()
+
+    # Check If Cache Should Be Dropped
+    if (__STREAM_CACHE == "drop"):
+        # Flush Remaining Written Range
+        os.fdatasync(dst_fd)
+
+        # Drop Cached Destination Range
+        drop_cache(dst_fd, synced, written - synced)
 
+    # Return Success
+    return (True)
+
+def copy_file(src_file, dst_file, verify = None, stats = None, hashed = False):
+    # Declare Copy Method And Source Digest
+    method = src_hash = None
+
+    # Get Progress Callback
+    progress = stats.update if not(stats is None) else (lambda count: None)
+
+    # Wait For Transfer File Limit
+    pace(0, 1)
+
+    # Open Source And Destination Files
+    with open(src_file, "rb") as src, open(dst_file, "wb") as dst:
+        # Get Source And Destination File Descriptors
+        src_fd, dst_fd = src.fileno(), dst.fileno()
+
+        # Get Source File Statistics
+        src_stat = os.fstat(src_fd)
+
+        # Determine If Source File Should Be Streamed
+        large = src_stat.st_size >= __STREAM_THRESHOLD
+
+        # Determine If Source File Has Holes
+        sparse = src_stat.st_blocks * 512 < src_stat.st_size
+
+        # Check If Source Digest Is Required
+        if (verify == "hash" or hashed):
+            # Initialize Source Digest
+            src_hash = digest.new()
+
+            # Perform Hole Preserving Copy With Digest
+            if (sparse and copy_sparse(src_fd, dst_fd, progress, src_hash)):
+                # Set Copy Method
+                method = "sparse"
+
+            # Perform Streaming Copy With Digest
+            elif (large and copy_stream(src_fd, dst_fd, progress, src_hash)):
+                # Set Copy Method
+                method = "stream"
+
+            # Perform Buffered Copy With Digest
+            elif (copy_buffered(src_fd, dst_fd, progress, src_hash)):
+                # Set Copy Method
+                method = "buffered"
+
+        # Attempt Reflink Clone
+        elif (copy_reflink(src_fd, dst_fd, progress)):
+            # Set Copy Method
+            method = "reflink"
+
+        # Perform Hole Preserving Copy
+        elif (sparse and copy_sparse(src_fd, dst_fd, progress)):
+            # Set Copy Method
+            method = "sparse"
+
+        # Perform Streaming Copy
+        elif (large and copy_stream(src_fd, dst_fd, progress)):
+            # Set Copy Method
+            method = "stream"
+
+        # Attempt Kernel Range Copy
+        elif (copy_kernel(src_fd, dst_fd, lambda i, o, n: os.copy_file_range(i, o, n), progress)):
+            # Set Copy Method
+            method = "copy_file_range"
+
+        # Attempt Kernel Send File
+        elif (copy_kernel(src_fd, dst_fd, lambda i, o, n: os.sendfile(o, i, None, n), progress)):
+            # Set Copy Method
+            method = "sendfile"
+
+        # Perform Buffered Copy
+        elif (copy_buffered(src_fd, dst_fd, progress)):
+            # Set Copy Method
+            method = "buffered"
+
+        # Check If Sizes Should Be Verified
+        if (verify == "size"):
             # Verify Source And Destination File Sizes Are Equal
-            if (src_dir_size != dst_dir_size):
-                # Enable Enclosing Directory Writes
-                enable_write_perms(enc_path)
+            if (os.fstat(src_fd).st_size != os.fstat(dst_fd).st_size):
+                # Raise Error
+                raise OSError(f"size of {cli.U}{dst_file}{cli.N} does not match source")
+
+    # Check If Source Digest Was Computed During Copy
+    if (not(src_hash is None)):
+        # Get Source Hex Digest
+        src_hash = src_hash.hexdigest()
+
+    # Check If Digests Should Be Verified
+    if (verify == "hash"):
+        # Verify Source And Destination Digests Are Equal
+        if (src_hash != digest.file_digest(dst_file)):
+            # Raise Error
+            raise OSError(f"digest of {cli.U}{dst_file}{cli.N} does not match source")
+
+    # Copy File Metadata
+    shutil.copystat(src_file, dst_file)
+
+    # Protect Copy Report Update
+    with __COPY_REPORT_LOCK:
+        # Update Copy Report
+        copy_report[method] += 1
+
+    # Return Copy Method And Source Digest
+    return (method, src_hash)
+
+def link_blob(blob_path, dst_file):
+    # Open Blob And Destination Files
+    with open(blob_path, "rb") as src, open(dst_file, "wb") as dst:
+        # Attempt Reflink Clone Of Blob
+        if (copy_reflink(src.fileno(), dst.fileno(), lambda count: None)):
+            # Return Copy Method
+            return ("dedup-reflink")
+
+    # Remove Unused Destination File
+    os.remove(dst_file)
+
+    # Hardlink Destination File To Blob
+    os.link(blob_path, dst_file)
+
+    # Return Copy Method
+    return ("dedup-hardlink")
+
+def blob_sizes(root_path):
+    # Open AnnexFS Catalog
+    with catalog.Catalog(root_path) as ctlg:
+        # Return Sizes Of Stored Blobs
+        return (ctlg.blob_sizes())
+
+def copy_dedup(src_file, dst_file, src_stat, verify, stats, sizes = None):
+    def copy_blob(tmp_path):
+        # Copy Source File To Temporary Blob While Computing Its Digest
+        return (copy_file(src_file, tmp_path, verify, stats, hashed = True)[1])
+
+    # Get AnnexFS Root Of Destination File
+    root_path = owner_root(dst_file)
+
+    # Get Sizes Of Stored Blobs Unless Already Known
+    sizes = blob_sizes(root_path) if (sizes is None) else sizes
+
+    # Initialize Path To Blob
+    blob_path = None
+
+    # Check If Source File Size Matches A Stored Blob
+    if (src_stat.st_size in sizes):
+        # Hash Source File Without Copying It
+        src_hash = digest.file_digest(src_file)
+
+        # Check If Blob Of Source Digest Is Stored
+        if (os.path.exists(store.blob(root_path, src_hash))):
+            # Set Path To Stored Blob
+            blob_path = store.blob(root_path, src_hash)
+
+            # Report Deduplicated Bytes
+            stats.update(src_stat.st_size)
+
+    # Check If Source File Must Be Stored
+    if (blob_path is None):
+        # Store Source File As Blob At Its Content Address
+        blob_path, src_hash, _ = store.put(root_path, copy_blob)
+
+        # Record Size Of Stored Blob
+        sizes.add(src_stat.st_size)
+
+    # Link Destination File To Blob
+    method = link_blob(blob_path, dst_file)
+
+    # Check If Destination File Is Independent Of Blob
+    if (method == "dedup-reflink"):
+        # Copy File Metadata
+        shutil.copystat(src_file, dst_file)
+
+    # Protect Copy Report Update
+    with __COPY_REPORT_LOCK:
+        # Update Copy Report
+        copy_report[method] += 1
+
+    # Return Source Digest
+    return (src_hash)
+
+def copy_journaled(src_file, dst_file, src_stat, rel_path, jrnl, verify, stats, dedup = False, sizes = None):
+    # Check If Journal Records File As Complete
+    if (not(jrnl is None) and jrnl.is_complete(rel_path, src_stat, dst_file)):
+        # Verify Journal Holds Required Digest
+        if (not(verify == "hash" or dedup) or (rel_path in jrnl.digests)):
+            # Report Skipped File
+            stats.update(src_stat.st_size, 1)
+
+            # Return Source File Size
+            return (src_stat.st_size)
+
+    # Check If File Should Be Deduplicated
+    if (dedup):
+        # Store Source File And Link Destination File To Blob
+        src_hash = copy_dedup(src_file, dst_file, src_stat, verify, stats, sizes)
+    else:
+        # Copy Source File To Destination File
+        method, src_hash = copy_file(src_file, dst_file, verify, stats)
 
-                # Delete Enclosing Directory
-                shutil.rmtree(enc_path, onerror = rm_onerror)
+    # Check If Journal Is Specified
+    if (not(jrnl is None)):
+        # Record Completed File
+        jrnl.record(rel_path, src_stat, src_hash)
 
-                # Return Error
-                return (OSError("annexfs directory transfer was unsuccessful"))
+    # Report Copied File
+    stats.update(0, 1)
 
-            # Remove Source Directory
-            shutil.rmtree(src_dir, onerror = rm_onerror)
+    # Return Source File Size
+    return (src_stat.st_size)
 
-            # Create Symbolic Link To Directory
-            os.symlink(dst_dir, src_dir)
+def link_journaled(leader_file, dst_file, src_stat, rel_path, leader_rel, jrnl, stats):
+    # Check If Journal Records Link As Complete
+    if (not(jrnl is None) and jrnl.is_complete(rel_path, src_stat, dst_file) and os.path.samefile(leader_file, dst_file)):
+        # Report Skipped File
+        stats.update(src_stat.st_size, 1)
 
-    # Return Success
+        # Return Source File Size
+        return (src_stat.st_size)
+
+    # Check If Stale Destination File Exists
+    if (os.path.lexists(dst_file)):
+        # Remove Stale Destination File
+        os.remove(dst_file)
+
+    # Wait For Transfer File Limit
+    pace(0, 1)
+
+    # Hardlink Destination File To Copied Group Leader
+    os.link(leader_file, dst_file)
+
+    # Check If Journal Is Specified
+    if (not(jrnl is None)):
+        # Record Completed File With Digest Of Group Leader
+        jrnl.record(rel_path, src_stat, jrnl.digests.get(leader_rel))
+
+    # Report Linked File
+    stats.update(src_stat.st_size, 1)
+
+    # Protect Copy Report Update
+    with __COPY_REPORT_LOCK:
+        # Update Copy Report
+        copy_report["hardlink"] += 1
+
+    # Return Source File Size
+    return (src_stat.st_size)
+
+def copy_tree(src_dir, dst_dir, jobs, jrnl, verify, stats, dedup = False, tree = None, links = True):
+    # Walk Source Directory Tree Into Manifest Unless Already Walked
+    tree = manifest.build(src_dir) if (tree is None) else tree
+
+    # Get Directory Indices
+    dir_list = array.array("i", tree.dirs())
+
+    # Iterate Over Directory Indices
+    for i in (dir_list):
+        # Create Destination Directory
+        os.makedirs(os.path.join(dst_dir, tree.rel(i)), exist_ok = True)
+
+    # Set Expected Transfer Totals
+    stats.expect(tree.size, tree.files)
+
+    # Initialize Hardlink Group Leaders And Followers
+    leaders, followers = {}, []
+
+    # Get Sizes Of Stored Blobs If Files Are Deduplicated
+    sizes = blob_sizes(owner_root(dst_dir)) if (dedup) else None
+
+    def file_args():
+        # Iterate Over File Indices And Relative Paths
+        for (i, rel_path) in (tree.regular()):
+            # Form Path To Source File
+            src_file = os.path.join(src_dir, rel_path)
+
+            # Check If Hardlinks Are Preserved And File Has Several Links
+            if (links and (tree.flags[i] & manifest.HARDLINK)):
+                # Form Hardlink Group Key
+                key = (os.stat(src_file).st_dev, tree.inodes[i])
+
+                # Check If Hardlink Group Has A Leader
+                if (key in leaders):
+                    # Append Hardlink Follower
+                    followers.append((i, rel_path, leaders[key]))
+
+                    # Continue Loop
+                    continue
+
+                # Set File As Hardlink Group Leader
+                leaders[key] = rel_path
+
+            # Yield File Copy Arguments
+            yield (src_file, os.path.join(dst_dir, rel_path), tree.stat(i), rel_path, jrnl, verify, stats, dedup, sizes)
+
+    # Copy Files Across Worker Pool
+    tree_size = sum(pool.execute(copy_journaled, file_args(), jobs))
+
+    # Iterate Over Hardlink Followers
+    for (i, rel_path, leader_rel) in (followers):
+        # Link Follower To Copied Group Leader
+        tree_size += link_journaled(os.path.join(dst_dir, leader_rel), os.path.join(dst_dir, rel_path), tree.stat(i), rel_path, leader_rel, jrnl, stats)
+
+    # Iterate Over Directory Indices In Reverse
+    for i in reversed(dir_list):
+        # Copy Directory Metadata
+        shutil.copystat(tree.path(i), os.path.join(dst_dir, tree.rel(i)))
+
+    # Return Tree Size, File Count, And Manifest
+    return (tree_size, tree.files, tree)
+
+def pack_tree(src_dir, dst_dir, enc_path, mode, verify, stats, tree = None):
+    # Walk Source Directory Tree Into Manifest Unless Already Walked
+    tree = manifest.build(src_dir) if (tree is None) else tree
+
+    # Iterate Over Stale Packs
+    for pack_path in (pack.packs(dst_dir)):
+        # Remove Stale Pack
+        os.remove(pack_path)
+
+    # Set Expected Transfer Totals
+    stats.expect(tree.size, tree.files)
+
+    # Initialize Packed Tree Size
+    tree_size = 0
+
+    # Get Progress Callback Paced By Transfer Limits
+    progress = paced(stats.update)
+
+    # Open Pack Writer
+    with pack.Writer(enc_path, dst_dir, __ANNEXFS_PACK_SIZE, mode) as writer:
+        # Iterate Over Manifest Entries
+        for i in range(len(tree)):
+            # Add Member To Pack
+            size = writer.add(tree.path(i), tree.rel(i), progress, digest.new() if (verify == "hash") else None)
+
+            # Check If Member Is A File
+            if (not(tree.is_dir(i))):
+                # Update Packed Tree Size
+                tree_size += size
+
+                # Report Packed File
+                progress(0, 1)
+
+    # Return Tree Size, File Count, And Manifest
+    return (tree_size, tree.files, tree)
+
+def verify_pack(tree, enc_path, dst_dir, verify):
+    # Check If Packed Digests Should Be Verified
+    if (verify == "hash"):
+        # Return Digest Verification Result
+        return (pack.verify(enc_path, dst_dir, digest.new))
+
+    # Read Pack Index
+    records = pack.read_index(enc_path)
+
+    # Verify Packed Size Matches Tree Size
+    if (tree.size != sum(record["size"] for record in (records))):
+        # Return Failure
+        return (False)
+
+    # Return File Count Verification Result
+    return ((verify != "walk") or (len(records) == sum(1 for i in range(len(tree)) if (stat.S_ISREG(tree.modes[i])))))
+
+def sync_file(src_file, dst_file, src_stat, rel_path, digests, verify, delta_hash, stats):
+    try:
+        # Get Destination File Statistics
+        dst_stat = os.stat(dst_file)
+    except FileNotFoundError:
+        # Reset Destination File Statistics
+        dst_stat = None
+
+    # Get Recorded Destination Digest
+    hex_digest = digests.get(rel_path)
+
+    # Determine If Destination File Is Unchanged By Size And Modification Time
+    unchanged = not(dst_stat is None) and (dst_stat.st_size == src_stat.st_size) and (dst_stat.st_mtime_ns == src_stat.st_mtime_ns)
+
+    # Check If Destination File Should Be Compared By Digest
+    if (not(unchanged or dst_stat is None) and delta_hash and (dst_stat.st_size == src_stat.st_size)):
+        # Get Recorded Or Computed Destination Digest
+        hex_digest = hex_digest or digest.file_digest(dst_file)
+
+        # Determine If Destination File Is Unchanged By Digest
+        unchanged = (hex_digest == digest.file_digest(src_file))
+
+        # Check If Destination File Is Unchanged
+        if (unchanged):
+            # Copy File Metadata
+            shutil.copystat(src_file, dst_file)
+
+    # Check If Destination File Is Unchanged
+    if (unchanged):
+        # Check If Destination Digest Is Required
+        if ((verify == "hash") and (hex_digest is None)):
+            # Compute Destination Digest
+            hex_digest = digest.file_digest(dst_file)
+
+        # Report Skipped File
+        stats.update(src_stat.st_size, 1)
+
+        # Return Relative Path, Source File Size, And Digest
+        return (rel_path, src_stat.st_size, hex_digest)
+
+    # Check If Destination File Exists
+    if (not(dst_stat is None)):
+        # Remove Stale Destination File
+        os.remove(dst_file)
+
+    # Copy Source File To Destination File
+    method, src_hash = copy_file(src_file, dst_file, verify, stats)
+
+    # Report Copied File
+    stats.update(0, 1)
+
+    # Return Relative Path, Source File Size, And Digest
+    return (rel_path, src_stat.st_size, src_hash)
+
+def prune_tree(tree, dst_dir):
+    # Verify Destination Directory Exists
+    if (not(os.path.isdir(dst_dir))):
+        # Return
+        return
+
+    # Walk Destination Directory Tree Into Manifest Of Entry Types Without Following Links
+    dst_tree = manifest.build(dst_dir, follow = False, types = True)
+
+    # Get Child Ranges Of Source And Destination Directories
+    src_children, dst_children = tree.children(), dst_tree.children()
+
+    # Initialize Stack Of Matched Source And Destination Directory Indices
+    stack = [(0, 0)]
+
+    # Iterate Until Matched Directories Are Exhausted
+    while (stack):
+        # Pop Next Matched Directory Indices
+        src_index, dst_index = stack.pop()
+
+        # Get Source Child Index Range
+        i, src_end = src_children.get(src_index, (0, 0))
+
+        # Iterate Over Destination Children In Name Order
+        for j in range(*dst_children.get(dst_index, (0, 0))):
+            # Get Destination Child Name
+            name = dst_tree.name(j)
+
+            # Iterate Over Source Children Named Before Destination Child
+            while ((i < src_end) and (tree.name(i) < name)):
+                # Move To Next Source Child
+                i += 1
+
+            # Check If Source Holds Child Of Same Type That Is Not A Destination Link
+            if ((i < src_end) and (tree.name(i) == name) and (tree.is_dir(i) == dst_tree.is_dir(j)) and not(dst_tree.flags[j] & manifest.LINK)):
+                # Check If Child Is A Directory
+                if (dst_tree.is_dir(j)):
+                    # Push Matched Child Directories
+                    stack.append((i, j))
+
+                # Continue Loop
+                continue
+
+            # Form Path To Destination Child
+            dst_path = dst_tree.path(j)
+
+            # Check If Destination Child Is A Directory
+            if (dst_tree.is_dir(j)):
+                # Move Deleted Directory To Trash
+                discard_path(dst_path, owner_root(dst_path))
+            else:
+                # Remove Deleted File Or Link
+                os.remove(dst_path)
+
+def sync_tree(src_dir, dst_dir, jobs, digests, verify, delta_hash, stats, tree = None):
+    # Walk Source Directory Tree Into Manifest Unless Already Walked
+    tree = manifest.build(src_dir) if (tree is None) else tree
+
+    # Get Directory Indices
+    dir_list = array.array("i", tree.dirs())
+
+    # Remove Destination Entries Deleted From Source Or Changed In Type
+    prune_tree(tree, dst_dir)
+
+    # Iterate Over Directory Indices
+    for i in (dir_list):
+        # Create Destination Directory
+        os.makedirs(os.path.join(dst_dir, tree.rel(i)), exist_ok = True)
+
+    # Set Expected Transfer Totals
+    stats.expect(tree.size, tree.files)
+
+    # Form File Synchronization Arguments From Manifest
+    file_args = ((os.path.join(src_dir, rel_path), os.path.join(dst_dir, rel_path), tree.stat(i), rel_path, digests, verify, delta_hash, stats) for (i, rel_path) in (tree.regular()))
+
+    # Initialize Synchronized Digests
+    tree_digests = {}
+
+    # Initialize Synchronized Tree Size
+    tree_size = 0
+
+    # Synchronize Files Across Worker Pool
+    for (rel_file, size, hex_digest) in pool.execute(sync_file, file_args, jobs):
+        # Update Synchronized Tree Size
+        tree_size += size
+
+        # Check If Digest Is Known And Written To Entry
+        if (not(hex_digest is None) and (verify == "hash")):
+            # Record File Digest
+            tree_digests[rel_file] = hex_digest
+
+    # Iterate Over Directory Indices In Reverse
+    for i in reversed(dir_list):
+        # Copy Directory Metadata
+        shutil.copystat(tree.path(i), os.path.join(dst_dir, tree.rel(i)))
+
+    # Return Tree Size, File Count, Digests, And Manifest
+    return (tree_size, tree.files, tree_digests, tree)
+
+def trash_dirs(path, root):
+    # Check If Path Resides On AnnexFS Root Device
+    if (is_same_device(path, root)):
+        # Return Root Trash Directory
+        return ([os.path.join(root, trash.NAME)])
+
+    # Initialize Sibling Trash Directory
+    trash_paths = [os.path.join(os.path.dirname(path), trash.NAME)]
+
+    # Get Mount Point Of Path
+    mount_path = trash.mount_point(path)
+
+    # Check If Mount Point Is Owned And Writable By User
+    if (trash.is_owned(mount_path)):
+        # Append Mount Point Trash Directory
+        trash_paths.append(os.path.join(mount_path, trash.NAME))
+
+    # Return Trash Directories
+    return (trash_paths)
+
+def discard_path(path, root):
+    # Check If Directory Must Be Made Writable To Change Parents
+    if (os.path.isdir(path) and not(os.path.islink(path)) and not(os.access(path, os.W_OK))):
+        # Enable Directory Writes
+        enable_write_perms(path)
+
+    # Iterate Over Trash Directories On Device Of Path
+    for trash_path in (trash_dirs(path, root)):
+        # Form Path To Trash Item
+        item_path = os.path.join(trash_path, id.generate(path))
+
+        # Open AnnexFS Catalog
+        with catalog.Catalog(root) as ctlg:
+            # Register Trash Item Before Moving Path
+            ctlg.add_trash(item_path)
+
+        try:
+            # Create Trash Directory
+            os.makedirs(trash_path, exist_ok = True)
+
+            # Move Path Into Trash Directory
+            os.rename(path, item_path)
+
+            # Return Path To Trash Item
+            return (item_path)
+        except OSError:
+            # Open AnnexFS Catalog
+            with catalog.Catalog(root) as ctlg:
+                # Unregister Trash Item
+                ctlg.remove_trash(item_path)
+
+    # Check If Path Is A Directory
+    if (os.path.isdir(path) and not(os.path.islink(path))):
+        # Remove Directory Synchronously
+        manifest.build(path, follow = False).remove(rm_onerror, resolve_jobs(None, path))
+    else:
+        # Remove File Synchronously
+        os.remove(path)
+
+    # Return No Trash Item
+    return (None)
+
+def reap_item(item_path, jobs, stats, totals):
+    # Check If Trash Item Is A Directory
+    if (os.path.isdir(item_path) and not(os.path.islink(item_path))):
+        # Enable Trash Item Writes
+        enable_write_perms(item_path)
+
+        # Walk Trash Item Into Manifest Without Following Links
+        tree = manifest.build(item_path, follow = False)
+
+        # Update Expected Reap Totals
+        totals[0], totals[1] = totals[0] + tree.size, totals[1] + tree.files
+
+        # Set Expected Reap Totals
+        stats.expect(*totals)
+
+        # Return Removed Entry Count
+        return (tree.remove(rm_onerror, resolve_jobs(jobs, item_path), stats.update))
+
+    # Check If Trash Item Exists
+    if (os.path.lexists(item_path)):
+        # Remove Trash Item
+        os.remove(item_path)
+
+        # Report Removed File
+        stats.update(0, 1)
+
+        # Return Removed Entry Count
+        return (1)
+
+    # Return Nothing Removed
+    return (0)
+
+def place_root(need_bytes = 0, need_inodes = 0):
+    # Check If A Single Root Is Configured
+    if (len(__ANNEXFS_ROOT_PATHS) == 1):
+        # Return Single Root
+        return (__ANNEXFS_ROOT_PATHS[0])
+
+    # Get Roots With Room For Required Space And Inodes Or All Roots If None Have Room
+    candidates = [root for root in (__ANNEXFS_ROOT_PATHS) if (plan.has_room(root, need_bytes, need_inodes))] or __ANNEXFS_ROOT_PATHS
+
+    # Return Root With Most Weighted Free Space Per Active Transfer
+    return (max(candidates, key = lambda root: __ANNEXFS_ROOTS[root] * get_free_space(root)[0] / (1 + __ROOT_LOAD.count(root))))
+
+def owner_root(path):
+    # Return AnnexFS Root Containing Path
+    return (roots.owner(__ANNEXFS_ROOT_PATHS, path))
+
+def registry_roots():
+    # Initialize Registry Roots Per Device
+    registries = {}
+
+    # Iterate Over AnnexFS Root Paths
+    for root in (__ANNEXFS_ROOT_PATHS):
+        # Set First Root On Device As Its Registry
+        registries.setdefault(plan.device_key(root), root)
+
+    # Return Registry Roots Per Device
+    return (registries)
+
+def device_lease(root, op, path, stats):
+    # Get Device Of Root
+    device = plan.device_key(root)
+
+    # Return Lease On Device Reporting Wait As Queue Phase
+    return (lease.Lease(registry_roots()[device], device, __DEVICE_SLOTS, op, path, lambda waiting: stats.phase("queue" if (waiting) else "copy")))
+
+def new_entry(root, path):
+    # Form Enclosing Path Until Unique
+    while (True):
+        # Form Path To Enclosing Directory
+        enc_path = os.path.join(root, id.generate(path))
+
+        # Verify Enclosing Path Is Unique
+        if (not(os.path.exists(enc_path))):
+            # Return Path To Enclosing Directory
+            return (enc_path)
+
+def catalog_add(enc_path, link_path, type, size, files, state = "linked", digests = None):
+    # Open AnnexFS Catalog
+    with catalog.Catalog(os.path.dirname(enc_path)) as ctlg:
+        # Check If Entry References Blobs
+        if (not(digests is None)):
+            # Acquire Blob References
+            ctlg.acquire((hex_digest, os.stat(store.blob(os.path.dirname(enc_path), hex_digest)).st_size, refs) for hex_digest, refs in collections.Counter(digests.values()).items())
+
+        # Add Entry Record
+        ctlg.add(os.path.basename(enc_path), link_path, type, size, files, state, not(digests is None))
+
+def catalog_shadow(enc_path):
+    # Open AnnexFS Catalog
+    with catalog.Catalog(os.path.dirname(enc_path)) as ctlg:
+        # Mark Entry Record As Shadow
+        ctlg.set_state(os.path.basename(enc_path), "shadow")
+
+def read_digests(enc_path, bname):
+    # Return Entry Digests Relative To Entry Basename
+    return ({os.path.relpath(rel_path, bname): hex_digest for rel_path, hex_digest in digest.read(enc_path).items()})
+
+def find_shadow(src_path):
+    # Iterate Over AnnexFS Root Paths
+    for root in (__ANNEXFS_ROOT_PATHS):
+        # Open AnnexFS Catalog
+        with catalog.Catalog(root) as ctlg:
+            # Get Shadow Entry Record
+            entry = ctlg.lookup(src_path, "shadow")
+
+        # Verify Shadow Entry Exists
+        if (not(entry is None)):
+            # Break Loop
+            break
+    else:
+        # Return Not Found
+        return (None)
+
+    # Form Path To Enclosing Directory
+    enc_path = os.path.join(root, entry["uuid"])
+
+    # Form Path To Shadow Entry
+    shadow_path = entry_target(enc_path, entry)
+
+    # Verify Shadow Entry Exists
+    if (not(os.path.lexists(shadow_path))):
+        # Remove Stale Entry From Catalog
+        catalog_remove(enc_path)
+
+        # Return Not Found
+        return (None)
+
+    # Verify Shadow Entry Type Matches Source Path
+    if (os.path.isdir(src_path) != (entry["type"] == "dir")):
+        # Return Not Found
+        return (None)
+
+    # Return Path To Enclosing Directory
+    return (enc_path)
+
+def entry_target(enc_path, entry):
+    # Get Link Path Of Entry
+    link_path = entry["link_path"]
+
+    # Return Path Linked By Entry
+    return (os.path.join(enc_path, os.path.basename(os.path.dirname(link_path)), os.path.basename(link_path)) if (entry["type"] == "file") else os.path.join(enc_path, os.path.basename(link_path)))
+
+def catalog_remove(enc_path, digests = None):
+    # Open AnnexFS Catalog
+    with catalog.Catalog(os.path.dirname(enc_path)) as ctlg:
+        # Check If Entry References Blobs
+        if (not(digests is None)):
+            # Iterate Over Unreferenced Blobs
+            for hex_digest in (ctlg.release(collections.Counter(digests.values()).items())):
+                # Remove Unreferenced Blob
+                store.remove(os.path.dirname(enc_path), hex_digest)
+
+        # Remove Entry Record
+        ctlg.remove(os.path.basename(enc_path))
+
+def blob_digests(enc_path):
+    # Open AnnexFS Catalog
+    with catalog.Catalog(os.path.dirname(enc_path)) as ctlg:
+        # Get Entry Record
+        entry = ctlg.get(os.path.basename(enc_path))
+
+    # Return Referenced Blob Digests If Entry Is Deduplicated
+    return (digest.read(enc_path) if (not(entry is None) and entry["dedup"]) else None)
+
+def plan_method(entry_plan):
+    # Check If Transfer Is Resumed
+    if (not(entry_plan.jrnl is None)):
+        # Return Resume Method
+        return ("resume")
+
+    # Check If Shadow Entry Is Synchronized
+    elif (not(entry_plan.shadow_path is None)):
+        # Return Synchronization Method
+        return ("sync")
+
+    # Check If Source Path Is Packed
+    elif (entry_plan.pack_mode):
+        # Return Pack Method
+        return ("pack")
+
+    # Check If Source Path Is Deduplicated
+    elif (entry_plan.dedup):
+        # Return Deduplication Method
+        return ("dedup")
+
+    # Return Rename Method If Source Path And AnnexFS Root Share A Device
+    return ("rename" if (is_same_device(componentize_path(entry_plan.src_path)[0], entry_plan.root())) else "copy")
+
+def plan_mode(entry_plan):
+    # Return Throughput History Mode Of Transfer
+    return ("dedup" if (entry_plan.dedup) else f"pack-{entry_plan.pack_mode}" if (entry_plan.pack_mode) else "copy")
+
+def measure_plan(entry_plan):
+    # Get Block Size, Available Space, And Available Inodes Of Root
+    block, entry_plan.free_bytes, entry_plan.free_inodes = plan.capacity(entry_plan.root())
+
+    # Get Source Path Components
+    src_dir, src_bname, src_fname = componentize_path(entry_plan.src_path)
+
+    # Check If Source Path Is A Directory
+    if (src_fname is None):
+        # Check If Source Directory Is Not Walked
+        if (entry_plan.tree is None):
+            # Walk Source Directory Tree Into Manifest
+            entry_plan.tree = manifest.build(entry_plan.src_path)
+
+        # Get Source Manifest
+        tree = entry_plan.tree
+
+        # Set Source Size, File Count, Directory Count, And Largest Files
+        entry_plan.size, entry_plan.files, entry_plan.dirs, entry_plan.largest = tree.size, tree.files, len(tree) - tree.files, plan.largest(tree)
+
+        # Get Required Space And Inodes Of Pack Files Or Copied Tree
+        need_bytes, need_inodes = plan.packed(tree, block, __ANNEXFS_PACK_SIZE) if (entry_plan.pack_mode) else plan.footprint(tree, block)
+
+        # Form Path To Destination Entry
+        dst_entry = os.path.join(entry_plan.enc_path, src_bname)
+    else:
+        # Get Source File Statistics
+        src_stat = os.stat(entry_plan.src_path)
+
+        # Set Source Size, File Count, And Largest Files
+        entry_plan.size, entry_plan.files, entry_plan.dirs, entry_plan.largest = src_stat.st_size, 1, 0, [(src_fname, src_stat.st_size)]
+
+        # Get Required Space And Inodes Of Copied File
+        need_bytes, need_inodes = plan.allocated(src_stat.st_size, src_stat.st_blocks, block), 1
+
+        # Form Path To Destination Entry
+        dst_entry = os.path.join(entry_plan.enc_path, src_bname, src_fname)
+
+    # Check If Transfer Reuses Destination Entry
+    if (entry_plan.method in ("resume", "sync")):
+        # Check If Destination Entry Is A Directory
+        if (os.path.isdir(dst_entry)):
+            # Get Space And Inodes Held By Destination Directory
+            have_bytes, have_inodes = plan.footprint(manifest.build(dst_entry, follow = False), block)
+
+        # Check If Destination Entry Is A File
+        elif (os.path.isfile(dst_entry)):
+            # Get Destination File Statistics
+            dst_stat = os.stat(dst_entry)
+
+            # Get Space And Inodes Held By Destination File
+            have_bytes, have_inodes = plan.allocated(dst_stat.st_size, dst_stat.st_blocks, block), 1
+        else:
+            # Set Nothing Held By Destination Entry
+            have_bytes = have_inodes = 0
+
+        # Discount Space And Inodes Already Held By Destination Entry
+        need_bytes, need_inodes = max(0, need_bytes - have_bytes), max(0, need_inodes - have_inodes)
+
+    # Check If New Entry Is Created
+    elif (entry_plan.method != "rename"):
+        # Add Inodes Of Entry Metadata
+        need_inodes += plan.META_INODES
+
+    # Set Required Space And Inodes Unless Source Path Is Renamed
+    entry_plan.need_bytes, entry_plan.need_inodes = (0, 0) if (entry_plan.method == "rename") else (need_bytes, need_inodes)
+
+    # Set Requirement Exactness Unless Deduplication Or Compression Bound It From Above
+    entry_plan.exact = not(entry_plan.dedup or (entry_plan.pack_mode and entry_plan.pack_mode != "none"))
+
+    # Check If Source Path Is Renamed
+    if (entry_plan.method == "rename"):
+        # Set Immediate Duration
+        entry_plan.rate, entry_plan.seconds = None, 0
+    else:
+        # Open AnnexFS Catalog
+        with catalog.Catalog(entry_plan.root()) as ctlg:
+            # Get Throughput History Of Source Device
+            rates = ctlg.throughput(plan.device_key(entry_plan.src_path), plan_mode(entry_plan))
+
+        # Estimate Duration From Throughput History
+        entry_plan.rate, entry_plan.seconds = plan.estimate(entry_plan.need_bytes, entry_plan.need_inodes, rates)
+
+def check_plan(entry_plan):
+    # Check If Requirements Are Only An Upper Bound Or Fit On Root
+    if (not(entry_plan.exact) or entry_plan.fits()):
+        # Return Success
+        return (None)
+
+    # Check If Space Is Insufficient
+    if (entry_plan.need_bytes > entry_plan.free_bytes):
+        # Return Error
+        return (OSError(f"annexfs root {cli.U}{entry_plan.root()}{cli.N} has {cli.size(entry_plan.free_bytes)} free but transfer needs {cli.size(entry_plan.need_bytes)}"))
+
+    # Return Error
+    return (OSError(f"annexfs root {cli.U}{entry_plan.root()}{cli.N} has {entry_plan.free_inodes} inode(s) free but transfer needs {entry_plan.need_inodes}"))
+
+def record_throughput(entry_plan, size, files, seconds):
+    # Verify Copy Ran Long Enough To Be Measured
+    if (seconds < plan.SAMPLE_SECONDS or not(size and files)):
+        # Return
+        return
+
+    # Open AnnexFS Catalog
+    with catalog.Catalog(entry_plan.root()) as ctlg:
+        # Record Throughput Of Source Device
+        ctlg.record_throughput(plan.device_key(entry_plan.src_path), plan_mode(entry_plan), size / seconds, files / seconds)
+
+def prepare_transfer(src_path, dedup, pack_mode, walk):
+    # Expand Source Path
+    src_path = expand_path(src_path)
+
+    # Verify Source Path Exists
+    if (not(os.path.exists(src_path))):
+        # Return Error
+        return (None, FileNotFoundError(f"source path {cli.U}{src_path}{cli.N} does not exist"))
+
+    # Verify Source Path Is Not A Symbolic Link
+    if (os.path.islink(src_path)):
+        # Return Error
+        return (None, ValueError(f"source path {cli.U}{src_path}{cli.N} is a symbolic link"))
+
+    # Check If Source Path Should Be Packed
+    if (not(pack_mode is None)):
+        # Verify Pack Mode Is Supported
+        if (not(pack_mode in pack.MODES)):
+            # Return Error
+            return (None, ValueError(f"pack mode {cli.U}{pack_mode}{cli.N} is not supported"))
+
+        # Verify Source Path Is A Directory
+        if (not(os.path.isdir(src_path))):
+            # Return Error
+            return (None, ValueError(f"source path {cli.U}{src_path}{cli.N} is not a directory and cannot be packed"))
+
+        # Verify Deduplication Is Not Requested
+        if (dedup):
+            # Return Error
+            return (None, ValueError("annexfs cannot deduplicate packed entries"))
+
+    # Find Incomplete Transfer Journal
+    jrnl = journal.find(__ANNEXFS_ROOT_PATHS, src_path)
+
+    # Verify Incomplete Transfer Is Not Selective
+    if (not(jrnl is None) and jrnl.select):
+        # Return Error
+        return (None, ValueError(f"source path {cli.U}{src_path}{cli.N} has an incomplete selective transfer, rerun it with the same selection to resume"))
+
+    # Determine Transfer Resumption
+    resumed = not(jrnl is None)
+
+    # Find Shadow Entry Of Source Path
+    shadow_path = None if (resumed) else find_shadow(src_path)
+
+    # Determine Delta Synchronization
+    shadow = not(shadow_path is None)
+
+    # Check If Transfer Is Resumed
+    if (resumed):
+        # Get Path To Enclosing Directory
+        enc_path = os.path.dirname(jrnl.path)
+    elif (shadow):
+        # Get Path To Enclosing Directory
+        enc_path = shadow_path
+    else:
+        # Form Path To Enclosing Directory On Placed Root
+        enc_path = new_entry(place_root(), src_path)
+
+    # Initialize Transfer Plan
+    entry_plan = plan.Plan(src_path, enc_path, None)
+
+    # Set Planned Journal And Shadow Entry
+    entry_plan.jrnl, entry_plan.shadow_path = jrnl, shadow_path
+
+    # Determine Pack Mode From Journal Or Shadow Entry
+    entry_plan.pack_mode = jrnl.pack if (resumed) else None if (shadow) else pack_mode
+
+    # Determine Deduplication From Journal, Shadow Entry, Pack Mode, Or Configuration
+    entry_plan.dedup = jrnl.dedup if (resumed) else False if (shadow or entry_plan.pack_mode) else __ANNEXFS_DEDUP if (dedup is None) else dedup
+
+    # Determine Transfer Method
+    entry_plan.method = plan_method(entry_plan)
+
+    # Check If Renamed Source Path Need Not Be Walked
+    if (not(walk) and entry_plan.method == "rename"):
+        # Return Transfer Plan
+        return (entry_plan, None)
+
+    # Measure Source Path Against Root
+    measure_plan(entry_plan)
+
+    # Check If New Entry Does Not Fit On Placed Root
+    if (not(resumed or shadow or entry_plan.fits())):
+        # Get Root With Room For Transfer
+        root = place_root(entry_plan.need_bytes, entry_plan.need_inodes)
+
+        # Check If Another Root Was Placed
+        if (root != entry_plan.root()):
+            # Form Path To Enclosing Directory On Placed Root
+            entry_plan.enc_path = new_entry(root, src_path)
+
+            # Determine Transfer Method On Placed Root
+            entry_plan.method = plan_method(entry_plan)
+
+            # Measure Source Path Against Placed Root
+            measure_plan(entry_plan)
+
+    # Return Transfer Plan
+    return (entry_plan, None)
+
+def find_selected(link_dir):
+    # Iterate Over AnnexFS Root Paths
+    for root in (__ANNEXFS_ROOT_PATHS):
+        # Open AnnexFS Catalog
+        with catalog.Catalog(root) as ctlg:
+            # Get Entry Record Of Link Directory
+            entry = ctlg.lookup(link_dir)
+
+        # Check If Entry Holds Selected Files Of Link Directory
+        if (not(entry is None) and (entry["type"] == "select")):
+            # Return Path To Enclosing Directory
+            return (os.path.join(root, entry["uuid"]))
+
+    # Return Not Found
+    return (None)
+
+def entry_of(target):
+    # Get AnnexFS Root Of Target
+    root = owner_root(target)
+
+    # Form Path To Enclosing Directory Of Target
+    enc_path = os.path.join(root, os.path.relpath(target, root).split(os.sep)[0])
+
+    # Open AnnexFS Catalog
+    with catalog.Catalog(root) as ctlg:
+        # Get Entry Record
+        entry = ctlg.get(os.path.basename(enc_path))
+
+    # Return Path To Enclosing Directory And Entry Record
+    return (enc_path, entry)
+
+def measure_selection(entry_plan):
+    # Get Block Size, Available Space, And Available Inodes Of Root
+    block, entry_plan.free_bytes, entry_plan.free_inodes = plan.capacity(entry_plan.root())
+
+    # Get Selected Manifest
+    tree = entry_plan.tree
+
+    # Set Selected Size, File Count, Directory Count, And Largest Files
+    entry_plan.size, entry_plan.files, entry_plan.dirs, entry_plan.largest = tree.size, tree.files, len(tree) - tree.files, plan.largest(tree)
+
+    # Get Required Space And Inodes Of Selected Files
+    need_bytes, need_inodes = plan.footprint(tree, block)
+
+    # Form Path To Destination Directory
+    dst_dir = os.path.join(entry_plan.enc_path, os.path.basename(entry_plan.src_path))
+
+    # Check If Entry Already Holds Files Of Link Directory
+    if (os.path.isdir(dst_dir)):
+        # Iterate Over Selected Files
+        for (i, rel_path) in (tree.regular()):
+            # Form Path To Destination File
+            dst_file = os.path.join(dst_dir, rel_path)
+
+            # Check If Destination File Was Already Copied
+            if (os.path.isfile(dst_file)):
+                # Get Destination File Statistics
+                dst_stat = os.stat(dst_file)
+
+                # Discount Space And Inode Held By Destination File
+                need_bytes, need_inodes = max(0, need_bytes - plan.allocated(dst_stat.st_size, dst_stat.st_blocks, block)), max(0, need_inodes - 1)
+    else:
+        # Add Inodes Of Entry Metadata
+        need_inodes += plan.META_INODES
+
+    # Set Required Space And Inodes Unless Selected Files Are Renamed
+    entry_plan.need_bytes, entry_plan.need_inodes = (0, 0) if (entry_plan.method == "rename") else (need_bytes, need_inodes)
+
+    # Check If Selected Files Are Renamed
+    if (entry_plan.method == "rename"):
+        # Set Immediate Duration
+        entry_plan.rate, entry_plan.seconds = None, 0
+    else:
+        # Open AnnexFS Catalog
+        with catalog.Catalog(entry_plan.root()) as ctlg:
+            # Get Throughput History Of Source Device
+            rates = ctlg.throughput(plan.device_key(entry_plan.src_path), plan_mode(entry_plan))
+
+        # Estimate Duration From Throughput History
+        entry_plan.rate, entry_plan.seconds = plan.estimate(entry_plan.need_bytes, entry_plan.need_inodes, rates)
+
+def prepare_selection(src_path, select, dedup, pack_mode):
+    # Verify Selected Files Are Not Deduplicated Or Packed
+    if (dedup or pack_mode):
+        # Return Error
+        return (None, ValueError("annexfs cannot deduplicate or pack selected files"))
+
+    # Expand Source Path
+    src_path = expand_path(src_path)
+
+    # Verify Source Path Exists
+    if (not(os.path.exists(src_path))):
+        # Return Error
+        return (None, FileNotFoundError(f"source path {cli.U}{src_path}{cli.N} does not exist"))
+
+    # Verify Source Path Is A Directory
+    if (os.path.islink(src_path) or not(os.path.isdir(src_path))):
+        # Return Error
+        return (None, ValueError(f"source path {cli.U}{src_path}{cli.N} is not a directory and cannot be selectively transferred"))
+
+    # Find Incomplete Transfer Journal
+    jrnl = journal.find(__ANNEXFS_ROOT_PATHS, src_path)
+
+    # Verify Incomplete Transfer Is Selective
+    if (not(jrnl is None) and not(jrnl.select)):
+        # Return Error
+        return (None, ValueError(f"source path {cli.U}{src_path}{cli.N} has an incomplete transfer, rerun it without selection to resume"))
+
+    # Walk Source Directory Without Following Links
+    tree = manifest.build(src_path, follow = False)
+
+    # Get Indices Of Selected Files
+    indices = select.select(tree)
+
+    # Verify Files Were Selected
+    if (not(indices)):
+        # Return Error
+        return (None, FileNotFoundError(f"no files under {cli.U}{src_path}{cli.N} match selection"))
+
+    # Get Enclosing Directory Of Resumed Transfer Or Existing Entry
+    enc_path = os.path.dirname(jrnl.path) if not(jrnl is None) else find_selected(src_path)
+
+    # Initialize Transfer Plan On Existing Entry Or Placed Root
+    entry_plan = plan.Plan(src_path, new_entry(place_root(), src_path) if (enc_path is None) else enc_path, None)
+
+    # Set Planned Journal And Selected Manifest
+    entry_plan.jrnl, entry_plan.tree = jrnl, tree.subset(indices)
+
+    # Determine Transfer Method
+    entry_plan.method = plan_method(entry_plan)
+
+    # Measure Selected Files Against Root
+    measure_selection(entry_plan)
+
+    # Check If New Entry Does Not Fit On Placed Root
+    if (enc_path is None and not(entry_plan.fits())):
+        # Get Root With Room For Selected Files
+        root = place_root(entry_plan.need_bytes, entry_plan.need_inodes)
+
+        # Check If Another Root Was Placed
+        if (root != entry_plan.root()):
+            # Form Path To Enclosing Directory On Placed Root
+            entry_plan.enc_path = new_entry(root, src_path)
+
+            # Determine Transfer Method On Placed Root
+            entry_plan.method = plan_method(entry_plan)
+
+            # Measure Selected Files Against Placed Root
+            measure_selection(entry_plan)
+
+    # Return Transfer Plan
+    return (entry_plan, None)
+
+def swap_path(path, suffix = __SWAP_SUFFIX):
+    # Return Temporary Path Beside Path For Atomic Swap
+    return (os.path.join(os.path.dirname(path), f".{os.path.basename(path)}{suffix}"))
+
+def clear_swap(path, root):
+    # Form Temporary Path Beside Path
+    tmp_path = swap_path(path)
+
+    # Check If Interrupted Swap Left Temporary Path Behind
+    if (os.path.lexists(tmp_path)):
+        # Move Temporary Path To Trash
+        discard_path(tmp_path, root)
+
+    # Return Temporary Path
+    return (tmp_path)
+
+def link_path(target, path):
+    # Form Temporary Link Path
+    tmp_link = swap_path(path)
+
+    # Check If Interrupted Swap Left Link Or File Behind
+    if (os.path.lexists(tmp_link) and not(os.path.isdir(tmp_link) and not(os.path.islink(tmp_link)))):
+        # Remove Stale Temporary Path
+        os.remove(tmp_link)
+
+    # Create Temporary Link To Target
+    os.symlink(target, tmp_link)
+
+    # Replace Path With Link
+    os.replace(tmp_link, path)
+
+def exchange_path(new_path, path):
+    # Check If Paths Were Exchanged Atomically
+    if (swap.exchange(new_path, path)):
+        # Return Path Holding Replaced Content
+        return (new_path)
+
+    # Check If Neither Path Is A Directory
+    if (not(any(os.path.isdir(p) and not(os.path.islink(p)) for p in (new_path, path)))):
+        # Replace Path With New Path
+        os.replace(new_path, path)
+
+        # Return No Replaced Content
+        return (None)
+
+    # Form Path Holding Replaced Content
+    old_path = swap_path(path, __SWAP_OLD_SUFFIX)
+
+    # Move Path Aside
+    os.rename(path, old_path)
+
+    try:
+        # Rename New Path Into Place
+        os.rename(new_path, path)
+    except BaseException:
+        # Move Path Back
+        os.rename(old_path, path)
+
+        # Raise Error
+        raise
+
+    # Return Path Holding Replaced Content
+    return (old_path)
+
+def rename_linked(src_entry, dst_entry):
+    # Check If Destination Entry Was Created As A Directory
+    if (os.path.isdir(dst_entry) and not(os.path.islink(dst_entry))):
+        # Remove Empty Destination Directory
+        os.rmdir(dst_entry)
+
+    # Create Link To Destination Entry In Its Own Place
+    os.symlink(dst_entry, dst_entry)
+
+    try:
+        # Exchange Source Entry With Link
+        exchanged = swap.exchange(src_entry, dst_entry)
+    except OSError as e:
+        # Remove Link
+        os.remove(dst_entry)
+
+        # Verify Error Is A Cross Device Link
+        if (e.errno != errno.EXDEV):
+            # Raise Error
+            raise e
+
+        # Return Failure
+        return (False)
+
+    # Check If Source Entry Was Exchanged
+    if (exchanged):
+        # Return Success
+        return (True)
+
+    # Remove Link
+    os.remove(dst_entry)
+
+    # Verify Source Entry Was Renamed Into Destination Entry
+    if (not(rename_path(src_entry, dst_entry))):
+        # Return Failure
+        return (False)
+
+    # Create Symbolic Link To Destination Entry
+    link_path(dst_entry, src_entry)
+
+    # Return Success
+    return (True)
+
+def link_selected(src_file, dst_file, src_stat, renamed):
+    # Check If Selected File Is Renamed
+    if (renamed):
+        # Rename Selected File Into Entry
+        os.rename(src_file, dst_file)
+    else:
+        # Get Current Source File Statistics
+        cur_stat = os.lstat(src_file)
+
+        # Verify Source File Is Unchanged Since Walk And Was Copied Whole
+        if (not(stat.S_ISREG(cur_stat.st_mode)) or ((cur_stat.st_size, cur_stat.st_mtime_ns) != (src_stat.st_size, src_stat.st_mtime_ns)) or (get_file_size(dst_file) != src_stat.st_size)):
+            # Remove Stale Copy
+            os.remove(dst_file)
+
+            # Return Failure
+            return (False)
+
+    # Replace Source File With Link
+    link_path(dst_file, src_file)
+
+    # Return Success
+    return (True)
+
+def restore_file(src_file, dst_file, renamed, verify, stats):
+    # Check If Selected File Is Renamed
+    if (renamed):
+        # Rename Selected File Over Its Link
+        os.rename(src_file, dst_file)
+
+        # Get Restored File Size
+        size = get_file_size(dst_file)
+
+        # Report Restored File
+        stats.update(size, 1)
+
+        # Return Restored File Size
+        return (size)
+
+    # Form Temporary File Path
+    tmp_file = swap_path(dst_file)
+
+    try:
+        # Copy Selected File Beside Its Link
+        copy_file(src_file, tmp_file, verify, stats)
+
+        # Verify Source And Temporary File Sizes Are Equal
+        if ((verify == "walk") and (get_file_size(src_file) != get_file_size(tmp_file))):
+            # Raise Error
+            raise OSError(f"size of {cli.U}{dst_file}{cli.N} does not match source")
+
+        # Replace Link With Copied File
+        os.replace(tmp_file, dst_file)
+    except (KeyboardInterrupt, Exception):
+        # Check If Temporary File Exists
+        if (os.path.exists(tmp_file)):
+            # Remove Temporary File
+            os.remove(tmp_file)
+
+        # Raise Error
+        raise
+
+    # Report Restored File
+    stats.update(0, 1)
+
+    # Return Restored File Size
+    return (get_file_size(dst_file))
+
+# End File Functions-----------------------------------------------------------------------------------------------------------------------------------------------------
+
+@sanity_checks
+@profile.traced
+def create(link_path):
+    # Expand Symbolic Link Path
+    link_path = expand_path(link_path)
+
+    # Verify Symbolic Link Path Does Not Exist
+    if (os.path.exists(link_path)):
+        # Return Error
+        return (FileExistsError(f"link path {cli.U}{link_path}{cli.N} exists"))
+
+    # Get Symbolic Link Directory
+    link_dir = os.path.dirname(link_path)
+
+    # Verify Symbolic Link Directory Exists
+    if (not(os.path.exists(link_dir))):
+        # Return Error
+        return (FileNotFoundError(f"link directory {cli.U}{link_dir}{cli.N} does not exist"))
+
+    # Form Path To Enclosing Directory On Placed Root
+    enc_path = new_entry(place_root(), link_path)
+
+    # Form Path To Destination Directory
+    dst_path = os.path.join(enc_path, os.path.basename(link_path))
+
+    try:
+        # Create Destination Directory
+        os.makedirs(dst_path)
+
+        # Disable Enclosing Directory Writes
+        disable_write_perms(enc_path)
+    except (KeyboardInterrupt, Exception) as e:
+        # Protect Cleanup From SIGINT
+        with SignalProtector(sig.SIGINT):
+            # Verify Enclosing Directory Exists
+            if (os.path.exists(enc_path)):
+                # Enable Enclosing Directory Writes
+                enable_write_perms(enc_path)
+
+                # Move Enclosing Directory To Trash
+                discard_path(enc_path, os.path.dirname(enc_path))
+
+        # Determine Error Handling
+        if (isinstance(e, KeyboardInterrupt)):
+            # Raise Interrupt
+            raise e
+        else:
+            # Return Exception
+            return (OSError("annexfs could not create new entry"))
+
+    # Protect Symlink Creation From SIGINT
+    with SignalProtector(sig.SIGINT):
+        # Create Symbolic Link To Directory
+        os.symlink(dst_path, link_path)
+
+        # Record Entry In Catalog
+        catalog_add(enc_path, link_path, "dir", 0, 0)
+
+    # Return Success
+    return (None)
+
+@sanity_checks
+@profile.traced
+def delete(link_path):
+    # Expand Symbolic Link Path
+    link_path = expand_path(link_path)
+
+    # Verify Symbolic Link Path Exists
+    if (not(os.path.exists(link_path))):
+        # Return Error
+        return (FileNotFoundError(f"link path {cli.U}{link_path}{cli.N} does not exist"))
+
+    # Get Path To Destination Directory
+    dst_path = os.path.realpath(link_path)
+
+    # Verify Destination Path Is An Internal Symbolic Link
+    if (not(os.path.islink(link_path) and owner_root(dst_path))):
+        # Return Error
+        return (ValueError(f"destination path {cli.U}{link_path}{cli.N} is not an internal symbolic link"))
+
+    # Get Entry Record Of Destination Path
+    entry = entry_of(dst_path)[1]
+
+    # Verify Destination Path Is Not A Selected File
+    if (not(entry is None) and (entry["type"] == "select")):
+        # Return Error
+        return (ValueError(f"destination path {cli.U}{link_path}{cli.N} is a selected file of {cli.U}{entry['link_path']}{cli.N}, transfer that directory back first"))
+
+    # Get Path To Enclosing Directory
+    enc_path = os.path.dirname(dst_path)
+
+    # Verify Path To Enclosing Directory Exists
+    if (not(os.path.exists(enc_path))):
+        # Return Error
+        return (FileNotFoundError(f"annexfs has not stored {cli.U}{link_path}{cli.N}"))
+
+    # Get Blob Digests Referenced By Entry
+    digests = blob_digests(enc_path)
+
+    try:
+        # Enable Enclosing Directory Writes
+        enable_write_perms(enc_path)
+
+        # Move Enclosing Directory To Trash
+        discard_path(enc_path, os.path.dirname(enc_path))
+    except (KeyboardInterrupt, Exception) as e:
+        # Protect Cleanup From SIGINT
+        with SignalProtector(sig.SIGINT):
+            # Check If Destination Directory Exists
+            if (os.path.exists(dst_path)):
+                # Disable Enclosing Directory Writes
+                disable_write_perms(enc_path)
+
+        # Determine Error Handling
+        if (isinstance(e, KeyboardInterrupt)):
+            # Raise Interrupt
+            raise e
+        elif (os.path.exists(dst_path)):
+            # Return Exception
+            return (OSError("annexfs could not delete existing entry"))
+
+    # Protect Symlink Deletion From SIGINT
+    with SignalProtector(sig.SIGINT):
+        # Remove Symbolic Link
+        os.remove(link_path)
+
+        # Remove Entry From Catalog
+        catalog_remove(enc_path, digests)
+
+    # Return Success
+    return (None)
+
+# End Linkage Functions--------------------------------------------------------------------------------------------------------------------------------------------------
+
+@sanity_checks
+def plan_transfer(src_path, dedup = None, pack_mode = None, select = None):
+    # Check If Files Are Selected
+    if (not(select is None)):
+        # Return Transfer Plan Of Selected Files
+        return (prepare_selection(src_path, select, dedup, pack_mode))
+
+    # Return Transfer Plan Of Source Path
+    return (prepare_transfer(src_path, dedup, pack_mode, walk = True))
+
+@sanity_checks
+@profile.traced
+def transfer_from(src_path, jobs = None, verify = "walk", stats = None, delta_hash = False, dedup = None, pack_mode = None, select = None):
+    # Verify Verification Mode Is Supported
+    if (not(verify in VERIFY_MODES)):
+        # Return Error
+        return (ValueError(f"verification mode {cli.U}{verify}{cli.N} is not supported"))
+
+    # Check If Transfer Statistics Are Specified
+    if (stats is None):
+        # Initialize Transfer Statistics
+        stats = Stats()
+
+    # Check If Files Are Selected
+    if (not(select is None)):
+        # Transfer Selected Files Of Source Directory
+        return (transfer_selected(src_path, select, jobs, verify, stats, dedup, pack_mode))
+
+    # Start Scan Phase
+    stats.phase("scan")
+
+    # Plan Transfer Without Walking Renamed Source Paths
+    entry_plan, err = prepare_transfer(src_path, dedup, pack_mode, walk = False)
+
+    # Verify Transfer Was Planned
+    if (not(err is None)):
+        # Return Error
+        return (err)
+
+    # Verify Transfer Fits On AnnexFS Root Before Copying
+    err = check_plan(entry_plan)
+
+    # Check If Transfer Does Not Fit
+    if (not(err is None)):
+        # Return Error
+        return (err)
+
+    # Get Planned Source Path, Journal, Enclosing Directory, Deduplication State, And Pack Mode
+    src_path, jrnl, enc_path, dedup, pack_mode = entry_plan.src_path, entry_plan.jrnl, entry_plan.enc_path, entry_plan.dedup, entry_plan.pack_mode
+
+    # Determine Transfer Resumption And Delta Synchronization
+    resumed, shadow = not(jrnl is None), not(entry_plan.shadow_path is None)
+
+    # Get Source Path Components
+    src_path, src_bname, src_fname = componentize_path(src_path)
+
+    # Form Path To Destination Directory
+    dst_path = os.path.join(enc_path, src_bname)
+
+    # Form Paths To Source And Destination Entries
+    src_entry = src_path if (src_fname is None) else os.path.join(src_path, src_fname)
+    dst_entry = dst_path if (src_fname is None) else os.path.join(dst_path, src_fname)
+
+    # Start Directory Creation Phase
+    stats.phase("mkdir")
+
+    try:
+        # Check If Transfer Is Not Resumed Or Synchronized
+        if (not(resumed or shadow)):
+            # Create Destination Directory
+            os.makedirs(dst_path)
+
+            # Create Transfer Journal
+            jrnl = journal.Journal(enc_path)
+            jrnl.create(src_entry, dedup, pack_mode)
+
+            # Disable Enclosing Directory Writes
+            disable_write_perms(enc_path)
+    except (KeyboardInterrupt, Exception) as e:
+        # Protect Cleanup From SIGINT
+        with SignalProtector(sig.SIGINT):
+            # Verify Enclosing Directory Exists
+            if (os.path.exists(enc_path)):
+                # Enable Enclosing Directory Writes
+                enable_write_perms(enc_path)
+
+                # Move Enclosing Directory To Trash
+                discard_path(enc_path, os.path.dirname(enc_path))
+
+        # Determine Error Handling
+        if (isinstance(e, KeyboardInterrupt)):
+            # Raise Interrupt
+            raise e
+        else:
+            # Return Exception
+            return (OSError("annexfs could not create new entry"))
+
+    # Verify Transfer Is New And Source Path And AnnexFS Root Share A Device
+    if (not(resumed or shadow or dedup or pack_mode) and is_same_device(src_path, enc_path)):
+        # Start Rename Phase
+        stats.phase("rename")
+
+        # Protect Rename Instructions From SIGINT
+        with SignalProtector(sig.SIGINT):
+            try:
+                # Enable Enclosing Directory Writes
+                enable_write_perms(enc_path)
+
+                # Swap Source Entry Into Enclosing Directory For Symbolic Link To Entry
+                renamed = rename_linked(src_entry, dst_entry)
+
+                # Check If Source Entry Was Renamed
+                if (renamed):
+                    # Remove Transfer Journal
+                    jrnl.remove()
+
+                # Disable Enclosing Directory Writes
+                disable_write_perms(enc_path)
+            except Exception:
+                # Move Enclosing Directory To Trash
+                discard_path(enc_path, os.path.dirname(enc_path))
+
+                # Return Exception
+                return (OSError("annexfs could not rename source path into entry"))
+
+            # Verify Source Entry Was Renamed
+            if (renamed):
+                # Check If Entry Is A File
+                if (not(src_fname is None)):
+                    # Record File Entry In Catalog
+                    catalog_add(enc_path, src_entry, "file", get_file_size(dst_entry), 1)
+                else:
+                    # Record Directory Entry In Catalog
+                    catalog_add(enc_path, src_entry, "dir", *get_dir_stats(dst_entry))
+
+                # Return Success
+                return (None)
+
+    # Determine Transfer Type
+    if (not(src_fname is None)):
+        # Form Paths To Source And Destination Files
+        src_file = os.path.join(src_path, src_fname)
+        dst_file = os.path.join(dst_path, src_fname)
+
+        # Get Source File Statistics
+        src_stat = os.stat(src_file)
+
+        # Start Copy Phase
+        stats.phase("copy")
+
+        try:
+            # Hold Device Lease And Track Active Transfer On Root
+            with device_lease(os.path.dirname(enc_path), "transfer-from", src_file, stats), __ROOT_LOAD.track(os.path.dirname(enc_path)):
+                # Get Copy Start Time
+                copy_start = time.monotonic()
+
+                # Set Expected Transfer Totals
+                stats.expect(src_stat.st_size, 1)
+
+                # Check If Shadow Entry Is Synchronized
+                if (shadow):
+                    # Synchronize Source File To Shadow Entry
+                    _, src_size, hex_digest = sync_file(src_file, dst_file, src_stat, src_fname, read_digests(enc_path, src_bname), verify, delta_hash, stats)
+
+                    # Set Entry Digests
+                    entry_digests = {} if (hex_digest is None) else {src_fname: hex_digest}
+                else:
+                    # Copy Source File To Destination Directory
+                    src_size = copy_journaled(src_file, dst_file, src_stat, src_fname, jrnl, verify, stats, dedup)
+
+                    # Set Entry Digests
+                    entry_digests = jrnl.digests
+        except (KeyboardInterrupt, Exception) as e:
+            # Protect Cleanup From SIGINT
+            with SignalProtector(sig.SIGINT):
+                # Check If Transfer Journal Exists
+                if (not(jrnl is None)):
+                    # Close Transfer Journal
+                    jrnl.close()
+
+            # Determine Error Handling
+            if (isinstance(e, KeyboardInterrupt)):
+                # Raise Interrupt
+                raise e
+            else:
+                # Return Exception
+                return (OSError("annexfs file transfer was terminated due to error, rerun to resume"))
+
+        # Get Copy Duration
+        copy_seconds = time.monotonic() - copy_start
+
+        # Protect Post Copy Instructions From SIGINT
+        with SignalProtector(sig.SIGINT):
+            # Start Verify Phase
+            stats.phase("verify")
+
+            # Verify Source And Destination File Sizes Are Equal
+            if ((verify == "walk") and (get_file_size(src_file) != get_file_size(dst_file))):
+                # Enable Enclosing Directory Writes
+                enable_write_perms(enc_path)
+
+                # Move Enclosing Directory To Trash
+                discard_path(enc_path, os.path.dirname(enc_path))
+
+                # Remove Entry From Catalog
+                catalog_remove(enc_path)
+
+                # Return Error
+                return (OSError("annexfs file transfer was unsuccessful"))
+
+            # Enable Enclosing Directory Writes
+            enable_write_perms(enc_path)
+
+            # Check If Digests Should Be Stored
+            if (verify == "hash" or dedup):
+                # Write Entry Digests
+                digest.write(enc_path, {os.path.join(src_bname, rel_path): hex_digest for rel_path, hex_digest in entry_digests.items()})
+
+            # Check If Shadow Entry Was Synchronized
+            elif (shadow):
+                # Remove Stale Entry Digests
+                digest.remove(enc_path)
+
+            # Check If Entry Is Deduplicated
+            if (dedup):
+                # Write Source Metadata Of Files Sharing Blobs
+                store.write_meta(enc_path, {rel_path: get_file_meta(os.path.join(src_path, rel_path)) for rel_path in (entry_digests)})
+
+            # Check If Transfer Journal Exists
+            if (not(jrnl is None)):
+                # Remove Transfer Journal
+                jrnl.remove()
+
+            # Disable Enclosing Directory Writes
+            disable_write_perms(enc_path)
+
+            # Check If Transfer Copied A New Entry
+            if (not(resumed or shadow)):
+                # Record Copy Throughput Of Source Device
+                record_throughput(entry_plan, src_size, 1, copy_seconds)
+
+            # Start Symlink Swap Phase
+            stats.phase("link")
+
+            # Replace Source File With Symbolic Link To File
+            link_path(dst_file, src_file)
+
+            # Record File Entry In Catalog
+            catalog_add(enc_path, src_file, "file", src_size, 1, digests = entry_digests if (dedup) else None)
+
+    else:
+        # Form Paths To Source And Destination Directories
+        src_dir = src_path
+        dst_dir = dst_path
+
+        # Start Copy Phase
+        stats.phase("copy")
+
+        try:
+            # Hold Device Lease And Track Active Transfer On Root
+            with device_lease(os.path.dirname(enc_path), "transfer-from", src_dir, stats), __ROOT_LOAD.track(os.path.dirname(enc_path)):
+                # Get Copy Start Time
+                copy_start = time.monotonic()
+
+                # Check If Shadow Entry Is Synchronized
+                if (shadow):
+                    # Synchronize Files From Source To Shadow Entry
+                    src_size, src_files, entry_digests, tree = sync_tree(src_dir, dst_dir, resolve_jobs(jobs, src_dir, dst_dir), read_digests(enc_path, src_bname), verify, delta_hash, stats, entry_plan.tree)
+
+                # Check If Source Directory Is Packed
+                elif (pack_mode):
+                    # Pack Files From Source Into Destination
+                    src_size, src_files, tree = pack_tree(src_dir, dst_dir, enc_path, pack_mode, verify, stats, entry_plan.tree)
+
+                    # Set Entry Digests Held By Pack Index
+                    entry_digests = {}
+                else:
+                    # Copy Files From Source To Destination
+                    src_size, src_files, tree = copy_tree(src_dir, dst_dir, resolve_jobs(jobs, src_dir, dst_dir), jrnl, verify, stats, dedup, entry_plan.tree)
+
+                    # Set Entry Digests
+                    entry_digests = jrnl.digests
+        except (KeyboardInterrupt, Exception) as e:
+            # Protect Cleanup From SIGINT
+            with SignalProtector(sig.SIGINT):
+                # Check If Transfer Journal Exists
+                if (not(jrnl is None)):
+                    # Close Transfer Journal
+                    jrnl.close()
+
+            # Determine Error Handling
+            if (isinstance(e, KeyboardInterrupt)):
+                # Raise Interrupt
+                raise e
+            else:
+                # Return Exception
+                return (OSError("annexfs directory transfer was terminated due to error, rerun to resume"))
+
+        # Get Copy Duration
+        copy_seconds = time.monotonic() - copy_start
+
+        # Protect Post Copy Instructions From SIGINT
+        with SignalProtector(sig.SIGINT):
+            # Start Verify Phase
+            stats.phase("verify")
+
+            # Verify Source Tree Is Unchanged Since Walk And Destination Files Or Packed Members Match Manifest
+            if (not(tree.unchanged()) or ((verify == "walk") and not(pack_mode) and not(tree.verify(dst_dir))) or (pack_mode and not(verify_pack(tree, enc_path, dst_dir, verify)))):
+                # Enable Enclosing Directory Writes
+                enable_write_perms(enc_path)
+
+                # Move Enclosing Directory To Trash
+                discard_path(enc_path, os.path.dirname(enc_path))
+
+                # Remove Entry From Catalog
+                catalog_remove(enc_path)
+
+                # Return Error
+                return (OSError("annexfs directory transfer was unsuccessful"))
+
+            # Enable Enclosing Directory Writes
+            enable_write_perms(enc_path)
+
+            # Check If Digests Should Be Stored Outside Pack Index
+            if ((verify == "hash" or dedup) and not(pack_mode)):
+                # Write Entry Digests
+                digest.write(enc_path, {os.path.join(src_bname, rel_path): hex_digest for rel_path, hex_digest in entry_digests.items()})
+
+            # Check If Shadow Entry Was Synchronized
+            elif (shadow):
+                # Remove Stale Entry Digests
+                digest.remove(enc_path)
+
+            # Check If Entry Is Deduplicated
+            if (dedup):
+                # Write Source Metadata Of Files Sharing Blobs
+                store.write_meta(enc_path, {rel_path: get_file_meta(os.path.join(src_path, rel_path)) for rel_path in (entry_digests)})
+
+            # Check If Transfer Journal Exists
+            if (not(jrnl is None)):
+                # Remove Transfer Journal
+                jrnl.remove()
+
+            # Disable Enclosing Directory Writes
+            disable_write_perms(enc_path)
+
+            # Check If Transfer Copied A New Entry
+            if (not(resumed or shadow)):
+                # Record Copy Throughput Of Source Device
+                record_throughput(entry_plan, src_size, src_files, copy_seconds)
+
+            # Start Symlink Swap Phase
+            stats.phase("link")
+
+            # Form Temporary Link Path Clear Of Interrupted Swaps
+            tmp_link = clear_swap(src_dir, os.path.dirname(enc_path))
+
+            # Create Temporary Link To Directory
+            os.symlink(dst_dir, tmp_link)
+
+            # Swap Source Directory For Symbolic Link To Directory
+            old_path = exchange_path(tmp_link, src_dir)
+
+            # Start Source Removal Phase
+            stats.phase("remove")
+
+            # Move Source Directory To Trash
+            discard_path(old_path, os.path.dirname(enc_path))
+
+            # Record Directory Entry In Catalog
+            catalog_add(enc_path, src_dir, "pack" if (pack_mode) else "dir", src_size, src_files, digests = entry_digests if (dedup) else None)
+
+    # Return Success
     return (None)
 
 @sanity_checks
-def transfer_to(dst_path):
+@profile.traced
+def transfer_to(dst_path, jobs = None, verify = "walk", stats = None, keep_shadow = False):
+    # Verify Verification Mode Is Supported
+    if (not(verify in VERIFY_MODES)):
+        # Return Error
+        return (ValueError(f"verification mode {cli.U}{verify}{cli.N} is not supported"))
+
+    # Check If Transfer Statistics Are Specified
+    if (stats is None):
+        # Initialize Transfer Statistics
+        stats = Stats()
+
     # Expand Destination Path
     dst_path = expand_path(dst_path)
 
-    # Verify Destination Path Exists
-    if (not(os.path.exists(dst_path))):
+    # Verify Destination Path Exists
+    if (not(os.path.exists(dst_path))):
+        # Return Error
+        return (FileNotFoundError(f"destination path {cli.U}{dst_path}{cli.N} does not exist"))
+
+    # Check If Destination Path Is A Directory
+    if (os.path.isdir(dst_path) and not(os.path.islink(dst_path))):
+        # Find Entry Holding Selected Files Of Destination Directory
+        enc_path = find_selected(dst_path)
+
+        # Check If Destination Directory Has Selected Files
+        if (not(enc_path is None)):
+            # Restore Selected Files To Destination Directory
+            return (restore_selected(dst_path, enc_path, jobs, verify, stats, keep_shadow))
+
+    # Get Path To Source Directory
+    src_path = os.path.realpath(dst_path)
+
+    # Verify Destination Path Is An Internal Symbolic Link
+    if (not(os.path.islink(dst_path) and owner_root(src_path))):
+        # Return Error
+        return (ValueError(f"destination path {cli.U}{dst_path}{cli.N} is not an internal symbolic link"))
+
+    # Get Entry Record Of Source Path
+    entry = entry_of(src_path)[1]
+
+    # Verify Source Path Is Not A Selected File
+    if (not(entry is None) and (entry["type"] == "select")):
+        # Return Error
+        return (ValueError(f"destination path {cli.U}{dst_path}{cli.N} is a selected file of {cli.U}{entry['link_path']}{cli.N}, transfer that directory instead"))
+
+    # Get Source Path Components
+    src_path, src_bname, src_fname = componentize_path(src_path)
+
+    # Get Path To Enclosing Directory
+    enc_path = os.path.dirname(src_path)
+
+    # Verify Path To Enclosing Directory Exists
+    if (not(os.path.exists(enc_path))):
+        # Return Error
+        return (FileNotFoundError(f"annexfs has not stored {cli.U}{dst_path}{cli.N}"))
+
+    # Get Blob Digests Referenced By Entry
+    digests = blob_digests(enc_path)
+
+    # Determine If Entry Is Packed
+    packed = pack.is_packed(enc_path)
+
+    # Verify Deduplicated Or Packed Entry Is Not Kept As Shadow
+    if (keep_shadow and (packed or not(digests is None))):
+        # Return Error
+        return (ValueError(f"annexfs cannot keep shadow of deduplicated or packed entry {cli.U}{dst_path}{cli.N}"))
+
+    # Verify Shadow Entry Is Not Kept And Enclosing Directory And Destination Path Share A Device
+    if (not(keep_shadow or digests or packed) and is_same_device(enc_path, os.path.dirname(dst_path))):
+        # Form Path To Source Entry
+        src_entry = src_path if (src_fname is None) else os.path.join(src_path, src_fname)
+
+        # Start Rename Phase
+        stats.phase("rename")
+
+        # Protect Rename Instructions From SIGINT
+        with SignalProtector(sig.SIGINT):
+            try:
+                # Enable Enclosing Directory Writes
+                enable_write_perms(enc_path)
+
+                # Swap Symbolic Link For Source Entry
+                old_path, renamed = exchange_path(src_entry, dst_path), True
+            except Exception as e:
+                # Verify Error Is A Cross Device Link
+                if (not(isinstance(e, OSError) and e.errno == errno.EXDEV)):
+                    # Disable Enclosing Directory Writes
+                    disable_write_perms(enc_path)
+
+                    # Return Exception
+                    return (OSError("annexfs could not rename entry to destination path"))
+
+                # Set Source Entry Not Renamed
+                renamed = False
+
+            # Verify Source Entry Was Renamed
+            if (renamed):
+                # Move Enclosing Directory To Trash
+                discard_path(enc_path, os.path.dirname(enc_path))
+
+                # Check If Symbolic Link Was Moved Aside
+                if (not(old_path is None) and os.path.lexists(old_path)):
+                    # Remove Symbolic Link
+                    os.remove(old_path)
+
+                # Remove Entry From Catalog
+                catalog_remove(enc_path)
+
+                # Return Success
+                return (None)
+
+            # Disable Enclosing Directory Writes
+            disable_write_perms(enc_path)
+
+    # Determine Transfer Type
+    if (not(src_fname is None)):
+        # Form Paths To Source And Destination Files
+        src_file = os.path.join(src_path, src_fname)
+        dst_file = dst_path
+
+        # Form Temporary File Path Clear Of Interrupted Swaps
+        tmp_file = clear_swap(dst_file, os.path.dirname(enc_path))
+
+        # Start Copy Phase
+        stats.phase("copy")
+
+        try:
+            # Hold Device Lease And Track Active Transfer On Root
+            with device_lease(os.path.dirname(enc_path), "transfer-to", dst_file, stats), __ROOT_LOAD.track(os.path.dirname(enc_path)):
+                # Set Expected Transfer Totals
+                stats.expect(get_file_size(src_file), 1)
+
+                # Copy Source File Beside Destination
+                copy_file(src_file, tmp_file, verify, stats)
+
+                # Check If Entry Is Deduplicated
+                if (not(digests is None)):
+                    # Restore Source Metadata Of File
+                    set_file_meta(tmp_file, store.read_meta(enc_path)[src_fname])
+
+                # Report Copied File
+                stats.update(0, 1)
+        except (KeyboardInterrupt, Exception) as e:
+            # Protect Cleanup From SIGINT
+            with SignalProtector(sig.SIGINT):
+                # Check If Temporary File Exists
+                if (os.path.exists(tmp_file)):
+                    # Remove Temporary File
+                    os.remove(tmp_file)
+
+            # Determine Error Handling
+            if (isinstance(e, KeyboardInterrupt)):
+                # Raise Interrupt
+                raise e
+            else:
+                # Return Exception
+                return (OSError("annexfs file transfer was terminated due to error"))
+
+        # Protect Post Copy Instructions From SIGINT
+        with SignalProtector(sig.SIGINT):
+            # Start Verify Phase
+            stats.phase("verify")
+
+            # Verify Source And Temporary File Sizes Are Equal
+            if ((verify == "walk") and (get_file_size(src_file) != get_file_size(tmp_file))):
+                # Remove Temporary File
+                os.remove(tmp_file)
+
+                # Return Error
+                return (OSError("annexfs file transfer was unsuccessful"))
+
+            # Start Symlink Swap Phase
+            stats.phase("link")
+
+            # Replace Symbolic Link With File
+            os.replace(tmp_file, dst_file)
+
+    else:
+        # Form Paths To Source And Destination Directories
+        src_dir = src_path
+        dst_dir = dst_path
+
+        # Form Temporary Directory Path Clear Of Interrupted Swaps
+        tmp_dir = clear_swap(dst_dir, os.path.dirname(enc_path))
+
+        # Start Copy Phase
+        stats.phase("copy")
+
+        try:
+            # Hold Device Lease And Track Active Transfer On Root
+            with device_lease(os.path.dirname(enc_path), "transfer-to", dst_dir, stats), __ROOT_LOAD.track(os.path.dirname(enc_path)):
+                # Check If Entry Is Packed
+                if (packed):
+                    # Get Pack Index Records
+                    records = pack.read_index(enc_path)
+
+                    # Set Expected Transfer Totals
+                    stats.expect(sum(record["size"] for record in (records)), len(records))
+
+                    # Create Temporary Directory
+                    os.makedirs(tmp_dir)
+
+                    # Stream Extract Packs Beside Destination
+                    pack.extract_all(src_dir, tmp_dir, paced(stats.update))
+                else:
+                    # Copy Source Directory Beside Destination
+                    tree = copy_tree(src_dir, tmp_dir, resolve_jobs(jobs, src_dir, os.path.dirname(dst_dir)), None, verify, stats, links = (digests is None))[2]
+
+                # Check If Entry Is Deduplicated
+                if (not(digests is None)):
+                    # Iterate Over Source Metadata Of Files
+                    for rel_path, meta in store.read_meta(enc_path).items():
+                        # Restore Source Metadata Of File
+                        set_file_meta(os.path.join(tmp_dir, rel_path), meta)
+        except (KeyboardInterrupt, Exception) as e:
+            # Protect Cleanup From SIGINT
+            with SignalProtector(sig.SIGINT):
+                # Check If Temporary Directory Exists
+                if (os.path.exists(tmp_dir)):
+                    # Move Temporary Directory To Trash
+                    discard_path(tmp_dir, os.path.dirname(enc_path))
+
+            # Determine Error Handling
+            if (isinstance(e, KeyboardInterrupt)):
+                # Raise Interrupt
+                raise e
+            else:
+                # Return Exception
+                return (OSError("annexfs directory transfer was terminated due to error"))
+
+        with SignalProtector(sig.SIGINT):
+            # Start Verify Phase
+            stats.phase("verify")
+
+            # Verify Packed Members And Temporary Directory Sizes Or Temporary Files And Manifest Are Equal
+            if ((verify == "walk") and ((sum(record["size"] for record in pack.read_index(enc_path)) != get_dir_size(tmp_dir)) if (packed) else not(tree.verify(tmp_dir)))):
+                # Move Temporary Directory To Trash
+                discard_path(tmp_dir, os.path.dirname(enc_path))
+
+                # Return Error
+                return (OSError("annexfs directory transfer was unsuccessful"))
+
+            # Start Symlink Swap Phase
+            stats.phase("link")
+
+            # Swap Symbolic Link For Directory
+            old_path = exchange_path(tmp_dir, dst_dir)
+
+            # Remove Symbolic Link
+            os.remove(old_path)
+
+    # Check If Shadow Entry Should Be Kept
+    if (keep_shadow):
+        # Mark Entry As Shadow In Catalog
+        catalog_shadow(enc_path)
+
+        # Return Success
+        return (None)
+
+    # Start Source Removal Phase
+    stats.phase("remove")
+
+    # Enable Enclosing Directory Writes
+    enable_write_perms(enc_path)
+
+    # Move Enclosing Directory To Trash
+    discard_path(enc_path, os.path.dirname(enc_path))
+
+    # Remove Entry From Catalog
+    catalog_remove(enc_path, digests)
+
+    # Return Success
+    return (None)
+
+def transfer_selected(src_path, select, jobs, verify, stats, dedup, pack_mode):
+    # Start Scan Phase
+    stats.phase("scan")
+
+    # Plan Transfer Of Selected Files
+    entry_plan, err = prepare_selection(src_path, select, dedup, pack_mode)
+
+    # Verify Transfer Was Planned
+    if (not(err is None)):
         # Return Error
-        return (FileNotFoundError(f"destination path {cli.U}{dst_path}{cli.N} does not exist"))
+        return (err)
 
-    # Get Path To Source Directory
-    src_path = os.path.realpath(dst_path)
+    # Check If Selected Files Do Not Fit On AnnexFS Root
+    err = check_plan(entry_plan)
 
-    # Verify Destination Path Is An Internal Symbolic Link
-    if (not(os.path.islink(dst_path) and src_path.startswith(__ANNEXFS_ROOT))):
+    # Verify Selected Files Fit
+    if (not(err is None)):
         # Return Error
-        return (ValueError(f"destination path {cli.U}{dst_path}{cli.N} is not an internal symbolic link"))
+        return (err)
 
-    # Get Source Path Components
-    src_path, src_bname, src_fname = componentize_path(src_path)
+    # Get Planned Source Directory, Journal, Enclosing Directory, And Selected Manifest
+    src_path, jrnl, enc_path, tree = entry_plan.src_path, entry_plan.jrnl, entry_plan.enc_path, entry_plan.tree
 
-    # Get Path To Enclosing Directory
-    enc_path = os.path.dirname(src_path)
+    # Determine Transfer Resumption And Selected File Renaming
+    resumed, renamed = not(jrnl is None), entry_plan.method == "rename"
 
-    # Verify Path To Enclosing Directory Exists
-    if (not(os.path.exists(enc_path))):
-        # Return Error
-        return (FileNotFoundError(f"annexfs has not stored {cli.U}{dst_path}{cli.N}"))
+    # Form Path To Destination Directory
+    dst_dir = os.path.join(enc_path, os.path.basename(src_path))
+
+    # Determine If Entry Is Created
+    created = not(os.path.exists(enc_path))
+
+    # Start Directory Creation Phase
+    stats.phase("mkdir")
 
     try:
-        # Remove Symbolic Link
-        os.remove(dst_path)
+        # Check If Entry Is Created
+        if (created):
+            # Create Destination Directory
+            os.makedirs(dst_dir)
+        else:
+            # Enable Enclosing Directory Writes
+            enable_write_perms(enc_path)
+
+        # Check If Selected Files Are Copied By A New Transfer
+        if (not(resumed or renamed)):
+            # Create Transfer Journal
+            jrnl = journal.Journal(enc_path)
+            jrnl.create(src_path, select = True)
+
+        # Disable Enclosing Directory Writes
+        disable_write_perms(enc_path)
     except (KeyboardInterrupt, Exception) as e:
+        # Protect Cleanup From SIGINT
+        with SignalProtector(sig.SIGINT):
+            # Check If Created Enclosing Directory Exists
+            if (created and os.path.exists(enc_path)):
+                # Enable Enclosing Directory Writes
+                enable_write_perms(enc_path)
+
+                # Move Enclosing Directory To Trash
+                discard_path(enc_path, os.path.dirname(enc_path))
+
         # Determine Error Handling
         if (isinstance(e, KeyboardInterrupt)):
             # Raise Interrupt
             raise e
         else:
-            # Check If Symbolic Link Was Removed
-            if (os.path.exists(dst_path)):
-                # Return Error
-                return (OSError("annexfs could not remove symbolic link"))
+            # Return Exception
+            return (OSError("annexfs could not create new entry"))
 
-    # Determine Transfer Type
-    if (not(src_fname is None)):
-        # Form Paths To Source And Destination Files
-        src_file = os.path.join(src_path, src_fname)
-        dst_file = dst_path
+    # Check If Selected Files Are Copied
+    if (not(renamed)):
+        # Start Copy Phase
+        stats.phase("copy")
 
         try:
-            # Copy Source File To Destination
-            shutil.copy2(src_file, dst_file, follow_symlinks = False)
+            # Hold Device Lease And Track Active Transfer On Root
+            with device_lease(os.path.dirname(enc_path), "transfer-from", src_path, stats), __ROOT_LOAD.track(os.path.dirname(enc_path)):
+                # Get Copy Start Time
+                copy_start = time.monotonic()
+
+                # Copy Selected Files From Source To Destination
+                src_size, src_files, _ = copy_tree(src_path, dst_dir, resolve_jobs(jobs, src_path, dst_dir), jrnl, verify, stats, tree = tree, links = False)
         except (KeyboardInterrupt, Exception) as e:
             # Protect Cleanup From SIGINT
             with SignalProtector(sig.SIGINT):
-                # Check If Destination File Exists
-                if (os.path.exists(dst_file)):
-                    # Remove Destination File
-                    os.remove(dst_file)
-
-                # Recreate Symlink To File
-                os.symlink(src_file, dst_file)
+                # Close Transfer Journal
+                jrnl.close()
 
             # Determine Error Handling
             if (isinstance(e, KeyboardInterrupt)):
@@ -470,79 +2928,901 @@ def transfer_to(dst_path):
                 raise e
             else:
                 # Return Exception
-                return (OSError("annexfs file transfer was terminated due to error"))
+                return (OSError("annexfs selective transfer was terminated due to error, rerun to resume"))
 
-        # Protect Post Copy Instructions From SIGINT
-        with SignalProtector(sig.SIGINT):
-            # Get Source And Destination File Sizes
-            src_file_size = get_file_size(src_file)
-            dst_file_size = get_file_size(dst_file)
+        # Get Copy Duration
+        copy_seconds = time.monotonic() - copy_start
+    else:
+        # Iterate Over Selected Directory Indices
+        for i in (tree.dirs()):
+            # Create Destination Directory
+            os.makedirs(os.path.join(dst_dir, tree.rel(i)), exist_ok = True)
 
-            # Verify Source And Destination File Sizes Are Equal
-            if (src_file_size != dst_file_size):
-                # Check If Destination File Exists
-                if (os.path.exists(dst_file)):
-                    # Remove Destination File
-                    os.remove(dst_file)
+        # Set Expected Transfer Totals
+        stats.expect(tree.size, tree.files)
 
-                # Recreate Symlink To File
-                os.symlink(src_file, dst_file)
+    # Protect Link Instructions From SIGINT
+    with SignalProtector(sig.SIGINT):
+        # Start Symlink Swap Phase
+        stats.phase("link")
 
-                # Return Error
-                return (OSError("annexfs file transfer was unsuccessful"))
+        # Record Entry In Catalog Before Links Point Into It
+        catalog_add(enc_path, src_path, "select", *get_dir_stats(dst_dir))
 
-    else:
-        # Form Paths To Source And Destination Directories
-        src_dir = src_path
-        dst_dir = dst_path
+        # Initialize Linked Files
+        linked = []
 
-        try:
-            # Copy Source Directory To Destination
-            shutil.copytree(src_dir, dst_dir, dirs_exist_ok = True)
-        except (KeyboardInterrupt, Exception) as e:
-            # Protect Cleanup From SIGINT
-            with SignalProtector(sig.SIGINT):
-                # Check If Destination Directory Exists
-                if (os.path.exists(dst_dir)):
-                    # Remove Destination Directory
-                    shutil.rmtree(dst_dir, onerror = rm_onerror)
+        # Iterate Over Selected Files
+        for (i, rel_path) in (tree.regular()):
+            # Replace Selected File With Link To Entry
+            if (link_selected(os.path.join(src_path, rel_path), os.path.join(dst_dir, rel_path), tree.stat(i), renamed)):
+                # Append Linked File
+                linked.append(rel_path)
 
-                # Recreate Symlink To File
-                os.symlink(src_dir, dst_dir)
+            # Check If Selected File Was Renamed
+            if (renamed):
+                # Report Renamed File
+                stats.update(tree.sizes[i], 1)
 
-            # Determine Error Handling
-            if (isinstance(e, KeyboardInterrupt)):
-                # Raise Interrupt
-                raise e
-            else:
-                # Return Exception
-                return (OSError("annexfs directory transfer was terminated due to error"))
+        # Enable Enclosing Directory Writes
+        enable_write_perms(enc_path)
 
-        with SignalProtector(sig.SIGINT):
-            # Get Source And Destination Directory Sizes
-            src_dir_size = get_dir_size(src_dir)
-            dst_dir_size = get_dir_size(dst_dir)
+        # Check If Digests Should Be Stored
+        if (verify == "hash" and not(renamed)):
+            # Write Entry Digests Of Linked Files Beside Existing Digests
+            digest.write(enc_path, {**digest.read(enc_path), **{os.path.join(os.path.basename(src_path), rel_path): jrnl.digests[rel_path] for rel_path in (linked) if (rel_path in jrnl.digests)}})
 
-            # Verify Source And Destination File Sizes Are Equal
-            if (src_dir_size != dst_dir_size):
-                # Check If Destination Directory Exists
-                if (os.path.exists(dst_dir)):
-                    # Remove Destination Directory
-                    shutil.rmtree(dst_dir, onerror = rm_onerror)
+        # Check If Transfer Journal Exists
+        if (not(jrnl is None)):
+            # Remove Transfer Journal
+            jrnl.remove()
 
-                # Recreate Symlink To File
-                os.symlink(src_dir, dst_dir)
+        # Disable Enclosing Directory Writes
+        disable_write_perms(enc_path)
 
-                # Return Error
-                return (OSError("annexfs directory transfer was unsuccessful"))
+        # Check If Selected Files Were Copied By A New Transfer
+        if (not(resumed or renamed)):
+            # Record Copy Throughput Of Source Device
+            record_throughput(entry_plan, src_size, src_files, copy_seconds)
 
-    # Enable Enclosing Directory Writes
-    enable_write_perms(enc_path)
+        # Record Entry Totals In Catalog
+        catalog_add(enc_path, src_path, "select", *get_dir_stats(dst_dir))
+
+    # Get Count Of Files Left In Place
+    skipped = tree.files - len(linked)
+
+    # Check If Any Selected File Changed During Transfer
+    if (skipped):
+        # Return Error
+        return (OSError(f"annexfs left {skipped} selected file(s) that changed during transfer in place, rerun to transfer them"))
+
+    # Return Success
+    return (None)
+
+def restore_selected(dst_path, enc_path, jobs, verify, stats, keep_shadow):
+    # Verify Shadow Entry Is Not Kept
+    if (keep_shadow):
+        # Return Error
+        return (ValueError(f"annexfs cannot keep shadow of selected files of {cli.U}{dst_path}{cli.N}"))
+
+    # Form Path To Source Directory
+    src_dir = os.path.join(enc_path, os.path.basename(dst_path))
+
+    # Verify Source Directory Exists
+    if (not(os.path.isdir(src_dir))):
+        # Return Error
+        return (FileNotFoundError(f"annexfs has not stored {cli.U}{dst_path}{cli.N}"))
+
+    # Start Scan Phase
+    stats.phase("scan")
+
+    # Walk Source Directory Without Following Links
+    tree = manifest.build(src_dir, follow = False)
+
+    # Get Selected Files Still Linked From Destination Directory
+    linked = [(i, rel_path) for (i, rel_path) in (tree.regular()) if (os.path.islink(os.path.join(dst_path, rel_path)) and (read_link(os.path.join(dst_path, rel_path)) == os.path.join(src_dir, rel_path)))]
+
+    # Determine If Selected Files Are Renamed
+    renamed = is_same_device(enc_path, dst_path)
+
+    # Start Copy Phase
+    stats.phase("rename" if (renamed) else "copy")
+
+    try:
+        # Hold Device Lease And Track Active Transfer On Root
+        with device_lease(os.path.dirname(enc_path), "transfer-to", dst_path, stats), __ROOT_LOAD.track(os.path.dirname(enc_path)):
+            # Set Expected Transfer Totals
+            stats.expect(sum(tree.sizes[i] for (i, rel_path) in (linked)), len(linked))
+
+            # Restore Selected Files Across Worker Pool
+            sum(pool.execute(restore_file, ((os.path.join(src_dir, rel_path), os.path.join(dst_path, rel_path), renamed, verify, stats) for (i, rel_path) in (linked)), resolve_jobs(jobs, src_dir, dst_path)))
+    except (KeyboardInterrupt, Exception) as e:
+        # Determine Error Handling
+        if (isinstance(e, KeyboardInterrupt)):
+            # Raise Interrupt
+            raise e
+        else:
+            # Return Exception
+            return (OSError("annexfs selective transfer was terminated due to error, rerun to resume"))
+
+    # Protect Entry Removal From SIGINT
+    with SignalProtector(sig.SIGINT):
+        # Start Source Removal Phase
+        stats.phase("remove")
+
+        # Enable Enclosing Directory Writes
+        enable_write_perms(enc_path)
 
-    # Remove Enclosing Directory
-    shutil.rmtree(enc_path)
+        # Move Enclosing Directory To Trash
+        discard_path(enc_path, os.path.dirname(enc_path))
+
+        # Remove Entry From Catalog
+        catalog_remove(enc_path)
 
     # Return Success
     return (None)
 
 # End Transfer Functions-------------------------------------------------------------------------------------------------------------------------------------------------
+
+def rank_candidates(dir_path):
+    # Initialize Candidate List
+    candidates = []
+
+    # Scan Directory Entries
+    with os.scandir(dir_path) as dt:
+        # Iterate Over Directory Entries
+        for entry in (dt):
+            # Process Entry As File
+            if (entry.is_file(follow_symlinks = False)):
+                # Get File Statistics
+                file_stat = entry.stat(follow_symlinks = False)
+
+                # Get File Usage And Last Access Time
+                usage, atime = file_stat.st_blocks * 512, file_stat.st_atime
+
+            # Process Entry As Directory
+            elif (entry.is_dir(follow_symlinks = False)):
+                # Get Directory Usage And Last Access Time
+                usage, atime = get_dir_usage(entry.path)
+
+            else:
+                # Skip Symbolic Links And Special Files
+                continue
+
+            # Verify Entry Occupies Space
+            if (usage > 0):
+                # Append Candidate
+                candidates.append((entry.path, usage, atime))
+
+    # Return Candidates Ranked By Coldest Access Day And Largest Usage
+    return (sorted(candidates, key = lambda candidate: (candidate[2] // __EVICT_ATIME_BUCKET, -candidate[1])))
+
+@sanity_checks
+def evict_until(dir_path, target, dry_run = False, jobs = None, verify = "walk", stats = None):
+    # Initialize Evicted Entry List
+    evicted = []
+
+    # Expand Directory Path
+    dir_path = expand_path(dir_path)
+
+    # Verify Directory Path Is A Directory
+    if (os.path.islink(dir_path) or not(os.path.isdir(dir_path))):
+        # Return Error
+        return (evicted, NotADirectoryError(f"eviction path {cli.U}{dir_path}{cli.N} is not a directory"))
+
+    # Verify Directory Path And AnnexFS Roots Reside On Different Devices
+    if (any(is_same_device(dir_path, root) for root in (__ANNEXFS_ROOT_PATHS))):
+        # Return Error
+        return (evicted, ValueError(f"eviction path {cli.U}{dir_path}{cli.N} shares a device with an annexfs root"))
+
+    # Get Available And Total Space
+    free, total = get_free_space(dir_path)
+
+    try:
+        # Determine Target Free Space
+        target_free = int(total * float(target[:-1]) / 100) if (target.endswith("%")) else cli.parse_size(target)
+    except ValueError:
+        # Return Error
+        return (evicted, ValueError(f"eviction target {cli.U}{target}{cli.N} is not valid"))
+
+    # Verify Target Free Space Is Attainable
+    if (not(0 <= target_free <= total)):
+        # Return Error
+        return (evicted, ValueError(f"eviction target {cli.U}{target}{cli.N} exceeds device size"))
+
+    # Iterate Over Ranked Candidates
+    for (path, usage, atime) in (rank_candidates(dir_path)):
+        # Check If Target Free Space Is Reached
+        if (free >= target_free):
+            # Break Loop
+            break
+
+        # Check If Eviction Is Simulated
+        if (dry_run):
+            # Append Planned Entry
+            evicted.append((path, usage, atime, None))
+
+            # Update Projected Free Space
+            free += usage
+
+            # Continue Loop
+            continue
+
+        # Transfer Candidate To AnnexFS
+        err = transfer_from(path, jobs = jobs, verify = verify, stats = stats)
+
+        # Append Evicted Entry
+        evicted.append((path, usage, atime, err))
+
+        # Get Available Space
+        free, _ = get_free_space(dir_path)
+
+    # Verify Target Free Space Is Reached
+    if (free < target_free):
+        # Return Error
+        return (evicted, OSError(f"annexfs could not free {cli.size(target_free)} under {cli.U}{dir_path}{cli.N}"))
+
+    # Return Evicted Entries
+    return (evicted, None)
+
+# End Eviction Functions-------------------------------------------------------------------------------------------------------------------------------------------------
+
+def get_payload_files(enc_path):
+    # Initialize Payload File Count
+    files = 0
+
+    # Scan Enclosing Directory Entries
+    with os.scandir(enc_path) as et:
+        # Iterate Over Enclosing Directory Entries
+        for entry in (et):
+            # Verify Entry Is Not Entry Metadata
+            if (entry.name in __ENTRY_META):
+                # Continue Loop
+                continue
+
+            # Update Payload File Count
+            files += get_dir_stats(entry.path)[1] if (entry.is_dir(follow_symlinks = False)) else 1
+
+    # Return Payload File Count
+    return (files)
+
+def is_live_pid(pid):
+    try:
+        # Signal Process Existence Check
+        os.kill(int(pid), 0)
+    except ValueError:
+        # Return Not Live
+        return (False)
+    except ProcessLookupError:
+        # Return Not Live
+        return (False)
+    except PermissionError:
+        # Return Live Process Owned By Another User
+        return (True)
+
+    # Return Live
+    return (True)
+
+def read_link(link_path):
+    # Return Normalized Absolute Link Target
+    return (os.path.normpath(os.path.join(os.path.dirname(link_path), os.readlink(link_path))))
+
+def scan_links(scan_dir):
+    # Initialize Directory Stack
+    stack = [scan_dir]
+
+    # Iterate Until Directory Stack Is Exhausted
+    while (stack):
+        # Scan Next Directory
+        with os.scandir(stack.pop()) as dt:
+            # Iterate Over Directory Entries
+            for entry in (dt):
+                # Check If Entry Is A Symbolic Link
+                if (entry.is_symlink()):
+                    # Yield Link Path And Target
+                    yield (entry.path, read_link(entry.path))
+
+                # Check If Entry Is A Directory
+                elif (entry.is_dir(follow_symlinks = False)):
+                    # Push Subdirectory
+                    stack.append(entry.path)
+
+def check_links(scan_dir, repair, report):
+    # Iterate Over Links Under Scan Directory
+    for link_path, target in (scan_links(scan_dir)):
+        # Get AnnexFS Root Of Link Target
+        root = owner_root(target)
+
+        # Verify Link Target Resides Under An AnnexFS Root
+        if (root is None):
+            # Continue Loop
+            continue
+
+        # Get Path To Enclosing Directory And Entry Record Of Target
+        enc_path, entry = entry_of(target)
+
+        # Check If Entry Is Recorded
+        if (not(entry is None)):
+            # Verify Link Path Differs From Entry Link Path Or Selected File Path
+            if ((os.path.join(entry["link_path"], os.path.relpath(target, entry_target(enc_path, entry))) if (entry["type"] == "select") else entry["link_path"]) != link_path):
+                # Report Foreign Link
+                report("foreign", link_path, f"entry {entry['uuid']} is recorded at {entry['link_path']}", False)
+
+            # Continue Loop
+            continue
+
+        # Check If Link Target Is Missing
+        if (not(os.path.lexists(target))):
+            # Check If Link Should Be Repaired
+            if (repair):
+                # Remove Dangling Link
+                os.remove(link_path)
+
+            # Report Dangling Link
+            report("dangling", link_path, f"target {target} is missing", repair)
+
+            # Continue Loop
+            continue
+
+        # Check If Entry Transfer Is Incomplete
+        if (os.path.exists(os.path.join(enc_path, journal.NAME))):
+            # Continue Loop
+            continue
+
+        # Check If Link Should Be Repaired
+        if (repair):
+            # Get Entry Size And File Count
+            size, files = get_dir_stats(target) if (os.path.isdir(target)) else (os.path.getsize(target), 1)
+
+            # Record Adopted Entry In Catalog
+            catalog_add(enc_path, link_path, "pack" if (pack.is_packed(enc_path)) else "dir" if (os.path.isdir(target)) else "file", size, files)
+
+        # Report Uncatalogued Link
+        report("uncatalogued", link_path, f"entry {os.path.basename(enc_path)} is missing from catalog", repair)
+
+def check_selected(link_dir, target, repair, report):
+    # Iterate Over Selected Files Of Entry
+    for (i, rel_path) in manifest.build(target, follow = False).regular():
+        # Form Paths To Link And Selected File
+        link_path, dst_file = os.path.join(link_dir, rel_path), os.path.join(target, rel_path)
+
+        # Check If Link Is Missing
+        if (not(os.path.lexists(link_path))):
+            # Determine If Link Can Be Repaired
+            fixed = repair and os.path.isdir(os.path.dirname(link_path))
+
+            # Check If Link Should Be Repaired
+            if (fixed):
+                # Recreate Symbolic Link
+                os.symlink(dst_file, link_path)
+
+            # Report Missing Link
+            report("unlinked", link_path, f"link to {dst_file} is missing", fixed)
+
+        # Check If Link Points Elsewhere
+        elif (not(os.path.islink(link_path)) or (read_link(link_path) != dst_file)):
+            # Report Foreign Link
+            report("foreign", link_path, f"path does not link to {dst_file}", False)
+
+def check_root(root, repair, scrub, report):
+    # Open AnnexFS Catalog
+    with catalog.Catalog(root) as ctlg:
+        # Get Entry And Scrub Records By UUID
+        entries, scrubs = {entry["uuid"]: entry for entry in ctlg.entries()}, ctlg.scrubs()
+
+    # Scan AnnexFS Root Entries
+    with os.scandir(root) as rt:
+        # Get Enclosing Directory Entries
+        enc_entries = [entry for entry in rt if (id.is_id(entry.name) and entry.is_dir(follow_symlinks = False))]
+
+    # Iterate Over Enclosing Directory Entries
+    for enc_entry in (enc_entries):
+        # Check If Enclosing Directory Is Catalogued
+        if (enc_entry.name in entries):
+            # Verify Enclosing Directory Writes Are Disabled
+            if (stat.S_IMODE(enc_entry.stat().st_mode) != 0o555):
+                # Check If Permissions Should Be Repaired
+                if (repair):
+                    # Disable Enclosing Directory Writes
+                    disable_write_perms(enc_entry.path)
+
+                # Report Permission Drift
+                report("perms", enc_entry.path, f"mode is {stat.S_IMODE(enc_entry.stat().st_mode):o}, expected 555", repair)
+
+        # Check If Enclosing Directory Holds An Incomplete Transfer
+        elif (os.path.exists(os.path.join(enc_entry.path, journal.NAME))):
+            # Report Incomplete Transfer
+            report("incomplete", enc_entry.path, "transfer journal exists, rerun transfer to resume", False)
+        else:
+            # Get Payload File Count
+            files = get_payload_files(enc_entry.path)
+
+            # Check If Empty Orphan Should Be Repaired
+            if (repair and files == 0):
+                # Enable Enclosing Directory Writes
+                enable_write_perms(enc_entry.path)
+
+                # Move Enclosing Directory To Trash
+                discard_path(enc_entry.path, root)
+
+            # Report Orphan Enclosing Directory
+            report("orphan", enc_entry.path, "holds no files" if (files == 0) else f"holds {files} file(s), relink them by running fsck with the link directory", repair and files == 0)
+
+    # Iterate Over Entry Records
+    for uuid, entry in entries.items():
+        # Form Paths To Enclosing Directory And Linked Target
+        enc_path = os.path.join(root, uuid)
+        target = entry_target(enc_path, entry)
+
+        # Get Link Path
+        link_path = entry["link_path"]
+
+        # Check If Linked Target Is Missing
+        if (not(os.path.lexists(target))):
+            # Check If Entry Should Be Repaired
+            if (repair):
+                # Check If Link Points To Missing Target
+                if (os.path.islink(link_path) and (read_link(link_path) == target)):
+                    # Remove Dangling Link
+                    os.remove(link_path)
+
+                # Remove Entry From Catalog
+                catalog_remove(enc_path)
+
+            # Report Dangling Entry
+            report("dangling", link_path, f"target {target} is missing", repair)
+
+        # Check If Entry Holds Selected Files
+        elif (entry["type"] == "select"):
+            # Check Links Of Selected Files
+            check_selected(link_path, target, repair, report)
+
+        # Check If Entry Is Linked
+        elif (entry["state"] == "linked"):
+            # Check If Link Is Missing
+            if (not(os.path.lexists(link_path))):
+                # Determine If Link Can Be Repaired
+                fixed = repair and os.path.isdir(os.path.dirname(link_path))
+
+                # Check If Link Should Be Repaired
+                if (fixed):
+                    # Recreate Symbolic Link
+                    os.symlink(target, link_path)
+
+                # Report Missing Link
+                report("unlinked", link_path, f"link to {target} is missing", fixed)
+
+            # Check If Link Points Elsewhere
+            elif (not(os.path.islink(link_path)) or (read_link(link_path) != target)):
+                # Report Foreign Link
+                report("foreign", link_path, f"path does not link to {target}", False)
+
+        # Check If Entry Failed Its Last Scrub And Is Not Scrubbed Again
+        if (not(scrub) and (uuid in scrubs) and (scrubs[uuid]["status"] == "corrupt")):
+            # Report Recorded Scrub Failure
+            report("scrub", link_path, f"last scrub found {scrubs[uuid]['errors']} corrupt or unreadable file(s)", False)
+
+def check_store(root, repair, report):
+    # Form Path To Store Directory
+    store_path = os.path.join(root, store.NAME)
+
+    # Verify Store Directory Exists
+    if (not(os.path.isdir(store_path))):
+        # Return
+        return
+
+    # Open AnnexFS Catalog
+    with catalog.Catalog(root) as ctlg:
+        # Get Blob Digests
+        blobs = {blob["digest"] for blob in ctlg.blobs()}
+
+    # Walk Store Directory Into Manifest
+    tree = manifest.build(store_path)
+
+    # Iterate Over Stored Blobs
+    for (i, rel_path) in (tree.regular()):
+        # Form Path To Blob And Get Blob Name
+        blob_path, name = os.path.join(store_path, rel_path), tree.name(i)
+
+        # Check If Blob Is Referenced
+        if (name in blobs):
+            # Mark Blob As Found
+            blobs.discard(name)
+
+            # Continue Loop
+            continue
+
+        # Check If Blob Is Being Stored By A Live Process
+        if (name.endswith(".tmp") and is_live_pid(name.split(".")[1])):
+            # Continue Loop
+            continue
+
+        # Check If Blob Should Be Repaired
+        if (repair):
+            # Remove Unreferenced Blob
+            os.remove(blob_path)
+
+        # Report Unreferenced Blob
+        report("blob", blob_path, "blob is not referenced by catalog", repair)
+
+    # Iterate Over Missing Blobs
+    for hex_digest in sorted(blobs):
+        # Report Missing Blob
+        report("blob", store.blob(root, hex_digest), "referenced blob is missing", False)
+
+def scrub_entry(enc_path, target, bucket):
+    # Initialize Scrubbed File Count And Failed Paths
+    files, errors = 0, []
+
+    # Check If Entry Is Packed
+    if (pack.is_packed(enc_path)):
+        # Get Packed File Count
+        files = sum(1 for record in pack.read_index(enc_path))
+
+        try:
+            # Verify Pack Members Against Index
+            if (not(pack.verify(enc_path, target, digest.new, bucket.consume))):
+                # Append Failed Pack Directory
+                errors.append(target)
+        except (OSError, EOFError, tarfile.TarError):
+            # Append Unreadable Pack Directory
+            errors.append(target)
+
+        # Return Scrub Result
+        return (enc_path, "corrupt" if (errors) else "verified", files, errors)
+
+    # Read Recorded Entry Digests
+    digests = digest.read(enc_path)
+
+    # Determine Scrub Status
+    status = "verified" if (digests) else "readable"
+
+    # Get Paths To Entry Files
+    paths = (os.path.join(target, rel_path) for (i, rel_path) in manifest.build(target).regular()) if (os.path.isdir(target)) else [target]
+
+    # Iterate Over Entry Files
+    for path in (paths):
+        # Update Scrubbed File Count
+        files += 1
+
+        # Get Recorded File Digest
+        expected = digests.pop(os.path.relpath(path, enc_path), None)
+
+        try:
+            # Compute Rate Limited File Digest
+            hex_digest = digest.file_digest(path, bucket.consume)
+        except OSError:
+            # Append Unreadable File
+            errors.append(path)
+
+            # Continue Loop
+            continue
+
+        # Verify File Digest Matches Record
+        if (not(expected is None) and (expected != hex_digest)):
+            # Append Corrupt File
+            errors.append(path)
+
+    # Append Recorded Files That Are Missing
+    errors.extend(os.path.join(enc_path, rel_path) for rel_path in sorted(digests))
+
+    # Return Scrub Result
+    return (enc_path, "corrupt" if (errors) else status, files, errors)
+
+def scrub_root(root, jobs, bucket, age, report):
+    # Get Current Time
+    now = time.time()
+
+    # Open AnnexFS Catalog
+    with catalog.Catalog(root) as ctlg:
+        # Get Entry And Scrub Records
+        entries, scrubs = ctlg.entries(), ctlg.scrubs()
+
+    # Initialize Due Entries
+    due = {}
+
+    # Iterate Over Entry Records
+    for entry in (entries):
+        # Get Scrub Record
+        record = scrubs.get(entry["uuid"])
+
+        # Verify Entry Changed Or Scrub Record Expired
+        if (not(record is None) and (record["updated"] == entry["updated"]) and (now - record["scrubbed"] < age * 24 * 60 * 60)):
+            # Continue Loop
+            continue
+
+        # Form Paths To Enclosing Directory And Linked Target
+        enc_path = os.path.join(root, entry["uuid"])
+        target = entry_target(enc_path, entry)
+
+        # Verify Linked Target Exists
+        if (os.path.lexists(target)):
+            # Add Due Entry
+            due[enc_path] = (entry, target)
+
+    # Initialize Scrub Results
+    results = []
+
+    # Scrub Due Entries Across Worker Pool
+    for enc_path, status, files, errors in pool.execute(scrub_entry, ((enc_path, target, bucket) for enc_path, (entry, target) in due.items()), resolve_jobs(jobs, root)):
+        # Get Entry Record
+        entry = due[enc_path][0]
+
+        # Open AnnexFS Catalog
+        with catalog.Catalog(root) as ctlg:
+            # Record Scrub Result
+            ctlg.record_scrub(entry["uuid"], entry["updated"], status, files, len(errors))
+
+        # Iterate Over Failed Paths
+        for path in (errors):
+            # Report Failed Path
+            report("scrub", path, f"content of {entry['link_path']} is corrupt or unreadable", False)
+
+        # Append Scrub Result
+        results.append((entry["link_path"], status, files))
+
+    # Return Scrub Results
+    return (results)
+
+@sanity_checks
+def fsck(scan_dir = None, repair = False, scrub = False, jobs = None, rate = None, age = None):
+    # Initialize Issue And Scrub Result Lists
+    issues, scrubbed = [], []
+
+    def report(kind, path, detail, fixed):
+        # Append Issue
+        issues.append((kind, path, detail, fixed))
+
+    # Check If Link Directory Is Specified
+    if (scan_dir):
+        # Expand Link Directory
+        scan_dir = expand_path(scan_dir)
+
+        # Verify Link Directory Is A Directory
+        if (not(os.path.isdir(scan_dir))):
+            # Return Error
+            return (issues, scrubbed, NotADirectoryError(f"link directory {cli.U}{scan_dir}{cli.N} is not a directory"))
+
+        # Check Links Under Link Directory
+        check_links(scan_dir, repair, report)
+
+    # Iterate Over AnnexFS Root Paths
+    for root in (__ANNEXFS_ROOT_PATHS):
+        # Check Enclosing Directories And Entry Links
+        check_root(root, repair, scrub, report)
+
+        # Check Deduplication Store
+        check_store(root, repair, report)
+
+    # Check If Entries Should Be Scrubbed
+    if (scrub):
+        # Initialize Shared Read Rate Limit
+        bucket = throttle.Bucket(__SCRUB_RATE if (rate is None) else rate)
+
+        # Iterate Over AnnexFS Root Paths
+        for root in (__ANNEXFS_ROOT_PATHS):
+            # Scrub Due Entries Of Root
+            scrubbed.extend(scrub_root(root, jobs, bucket, __SCRUB_AGE if (age is None) else age, report))
+
+    # Return Issues And Scrub Results
+    return (issues, scrubbed, None)
+
+# End Check Functions----------------------------------------------------------------------------------------------------------------------------------------------------
+
+@sanity_checks
+def reap(jobs = None, stats = None):
+    # Initialize Reaped Item List
+    reaped = []
+
+    # Check If Reap Statistics Are Specified
+    if (stats is None):
+        # Initialize Reap Statistics
+        stats = Stats()
+
+    # Start Reap Phase
+    stats.phase("reap")
+
+    # Initialize Expected Reap Totals
+    totals = [0, 0]
+
+    # Iterate Over AnnexFS Root Paths
+    for root in (__ANNEXFS_ROOT_PATHS):
+        # Acquire Reaper Lock Of Root
+        with trash.Lock(root) as locked:
+            # Verify Another Reaper Does Not Hold Root
+            if (not(locked)):
+                # Continue Loop
+                continue
+
+            # Open AnnexFS Catalog
+            with catalog.Catalog(root) as ctlg:
+                # Get Registered Trash Items And Registration Times
+                registered = dict(ctlg.trash())
+
+            # Form Trash Items With Unregistered Items Left In Root Trash Directory
+            item_paths = list(registered) + [item_path for item_path in trash.items(os.path.join(root, trash.NAME)) if not(item_path in registered)]
+
+            # Iterate Over Trash Items
+            for item_path in (item_paths):
+                try:
+                    # Remove Trash Item
+                    removed = reap_item(item_path, jobs, stats, totals)
+                except OSError as e:
+                    # Append Failed Item
+                    reaped.append((item_path, 0, e))
+
+                    # Continue Loop
+                    continue
+
+                # Check If Missing Item Was Registered Recently And May Still Be Moving Into Trash
+                if ((removed == 0) and (time.time() - registered.get(item_path, 0) < __TRASH_GRACE)):
+                    # Continue Loop
+                    continue
+
+                # Check If Item Is Registered
+                if (item_path in registered):
+                    # Open AnnexFS Catalog
+                    with catalog.Catalog(root) as ctlg:
+                        # Unregister Removed Or Stale Trash Item
+                        ctlg.remove_trash(item_path)
+
+                # Get Path To Trash Directory Of Item
+                trash_path = os.path.dirname(item_path)
+
+                # Check If Main Disk Trash Directory Is Empty
+                if ((trash_path != os.path.join(root, trash.NAME)) and os.path.isdir(trash_path) and not(os.listdir(trash_path))):
+                    # Remove Empty Trash Directory
+                    os.rmdir(trash_path)
+
+                # Append Reaped Item
+                reaped.append((item_path, removed, None))
+
+    # Return Reaped Items
+    return (reaped, None)
+
+# End Trash Functions----------------------------------------------------------------------------------------------------------------------------------------------------
+
+@sanity_checks
+def extract(link_path, member, out_path = None):
+    # Expand Symbolic Link Path
+    link_path = expand_path(link_path)
+
+    # Get Path To Packed Directory
+    dst_path = os.path.realpath(link_path)
+
+    # Verify Link Path Is An Internal Symbolic Link
+    if (not(os.path.islink(link_path) and owner_root(dst_path))):
+        # Return Error
+        return (ValueError(f"link path {cli.U}{link_path}{cli.N} is not an internal symbolic link"))
+
+    # Get Path To Enclosing Directory
+    enc_path = os.path.dirname(dst_path)
+
+    # Verify Entry Is Packed
+    if (not(pack.is_packed(enc_path))):
+        # Return Error
+        return (ValueError(f"annexfs entry {cli.U}{link_path}{cli.N} is not packed"))
+
+    # Normalize Member Path
+    member = os.path.normpath(member)
+
+    # Form Output Path
+    out_path = expand_path(out_path or os.path.basename(member))
+
+    # Verify Output Path Does Not Exist
+    if (os.path.lexists(out_path)):
+        # Return Error
+        return (FileExistsError(f"output path {cli.U}{out_path}{cli.N} exists"))
+
+    try:
+        # Extract Member Through Pack Index
+        pack.extract_member(enc_path, dst_path, member, out_path)
+    except FileNotFoundError:
+        # Return Error
+        return (FileNotFoundError(f"annexfs entry {cli.U}{link_path}{cli.N} has no member {cli.U}{member}{cli.N}"))
+
+    # Return Success
+    return (None)
+
+@sanity_checks
+def drop_shadow(src_path):
+    # Expand Source Path
+    src_path = expand_path(src_path)
+
+    # Find Shadow Entry Of Source Path
+    enc_path = find_shadow(src_path)
+
+    # Verify Shadow Entry Exists
+    if (enc_path is None):
+        # Return Error
+        return (FileNotFoundError(f"annexfs has no shadow of {cli.U}{src_path}{cli.N}"))
+
+    # Protect Shadow Removal From SIGINT
+    with SignalProtector(sig.SIGINT):
+        # Enable Enclosing Directory Writes
+        enable_write_perms(enc_path)
+
+        # Move Enclosing Directory To Trash
+        discard_path(enc_path, os.path.dirname(enc_path))
+
+        # Remove Entry From Catalog
+        catalog_remove(enc_path)
+
+    # Return Success
+    return (None)
+
+@sanity_checks
+def list_entries():
+    # Initialize Entry Records
+    entries = []
+
+    # Iterate Over AnnexFS Root Paths
+    for root in (__ANNEXFS_ROOT_PATHS):
+        # Open AnnexFS Catalog
+        with catalog.Catalog(root) as ctlg:
+            # Append Entry Records
+            entries.extend(ctlg.entries())
+
+    # Return Entry Records Ordered By Link Path
+    return (sorted(entries, key = lambda entry: entry["link_path"]))
+
+@sanity_checks
+def list_leases():
+    # Initialize Lease Records
+    leases = []
+
+    # Iterate Over Registry Roots Of Devices
+    for root in registry_roots().values():
+        # Append Lease Records Of Held Slots
+        leases.extend(lease.holders(root))
+
+    # Return Lease Records
+    return (leases)
+
+@sanity_checks
+def disk_usage(link_dir = None):
+    # Check If Link Directory Is Specified
+    if (not(link_dir is None)):
+        # Expand Link Directory
+        link_dir = expand_path(link_dir)
+
+    # Initialize Usage Totals
+    size = files = count = 0
+
+    # Iterate Over AnnexFS Root Paths
+    for root in (__ANNEXFS_ROOT_PATHS):
+        # Open AnnexFS Catalog
+        with catalog.Catalog(root) as ctlg:
+            # Get Root Usage Totals
+            root_size, root_files, root_count = ctlg.usage(link_dir)
+
+        # Update Usage Totals
+        size, files, count = size + root_size, files + root_files, count + root_count
+
+    # Return Usage Totals
+    return (size, files, count)
+
+@sanity_checks
+def where(link_path):
+    # Expand Symbolic Link Path
+    link_path = expand_path(link_path)
+
+    # Initialize Entry Records
+    entries = []
+
+    # Iterate Over AnnexFS Root Paths
+    for root in (__ANNEXFS_ROOT_PATHS):
+        # Open AnnexFS Catalog
+        with catalog.Catalog(root) as ctlg:
+            # Get Entry Record
+            entry = ctlg.lookup(link_path)
+
+        # Check If Entry Record Exists
+        if (not(entry is None)):
+            # Append Entry Record
+            entries.append(entry)
+
+    # Return Entry Record Preferring Linked Entries
+    return (min(entries, key = lambda entry: entry["state"] != "linked", default = None))
+
+# End Catalog Functions--------------------------------------------------------------------------------------------------------------------------------------------------
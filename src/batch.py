@@ -0,0 +1,218 @@
+# Developed By Nalin Ahuja, nalinahuja
+
+import os
+import sys
+import json
+import axfs
+import config
+import itertools
+import collections
+
+from util import cli
+from util import pool
+
+# End Imports-------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+# Batch Operation Functions
+__OPERATIONS = {
+    "create": axfs.create,
+    "delete": axfs.delete,
+    "transfer-from": axfs.transfer_from,
+    "transfer-to": axfs.transfer_to,
+}
+
+# Batch Operation Options
+__TRANSFER_OPTIONS = ("jobs", "verify")
+
+# Default Batch Workers
+__BATCH_JOBS = config.data.get("ANNEXFS_BATCH_JOBS", 4)
+
+# End Constants-----------------------------------------------------------------------------------------------------------------------------------------------------------
+
+def parse(line):
+    # Check If Line Is A JSON Object
+    if (line.startswith("{")):
+        # Decode JSON Operation
+        item = json.loads(line)
+
+        # Get Operation Name And Path
+        op, path = item.get("op"), item.get("path")
+
+        # Get Operation Options
+        opts = {key: item[key] for key in __TRANSFER_OPTIONS if (key in item)}
+    else:
+        # Split Operation Name And Path
+        op, _, path = line.partition(" ")
+
+        # Initialize Operation Options
+        opts = {}
+
+    # Return Checked Operation
+    return (check(op, path, opts))
+
+def check(op, path, opts):
+    # Normalize Operation Name
+    op = str(op).replace("_", "-").lstrip("-")
+
+    # Verify Operation Is Supported
+    if (not(op in __OPERATIONS)):
+        # Raise Error
+        raise ValueError(f"operation {cli.U}{op}{cli.N} is not supported")
+
+    # Verify Operation Path Is Specified
+    if (not(path)):
+        # Raise Error
+        raise ValueError(f"operation {cli.U}{op}{cli.N} has no path")
+
+    # Iterate Over Operation Options
+    for key in (opts):
+        # Verify Option Is Supported
+        if (not(key in __TRANSFER_OPTIONS)):
+            # Raise Error
+            raise ValueError(f"option {cli.U}{key}{cli.N} is not supported")
+
+    # Verify Options Apply To Operation
+    if (opts and not(op.startswith("transfer"))):
+        # Raise Error
+        raise ValueError(f"operation {cli.U}{op}{cli.N} does not accept options")
+
+    # Return Operation
+    return (op, path, opts)
+
+def load(file):
+    # Initialize Operation List
+    items = []
+
+    # Iterate Over Batch Lines
+    for line_no, line in enumerate(file, 1):
+        # Strip Line Whitespace
+        line = line.strip()
+
+        # Skip Blank And Comment Lines
+        if (not(line) or line.startswith("#")):
+            # Continue Loop
+            continue
+
+        try:
+            # Parse Batch Line
+            op, path, opts = parse(line)
+        except ValueError as e:
+            # Return Error With Line Number
+            return (items, ValueError(f"batch line {line_no}: {e}"))
+
+        # Append Operation To List
+        items.append((line_no, op, path, opts))
+
+    # Return Operation List
+    return (items, None)
+
+def lineage(path):
+    # Get Parent Path
+    parent = os.path.dirname(path)
+
+    # Iterate Until Filesystem Root Is Reached
+    while (parent != path):
+        # Yield Ancestor Path
+        yield (parent)
+
+        # Move To Next Ancestor
+        path, parent = parent, os.path.dirname(parent)
+
+def chains(items):
+    # Initialize Chain Parents Of Operations
+    parents = list(range(len(items)))
+
+    def find(i):
+        # Iterate Until Chain Root Is Reached
+        while (parents[i] != i):
+            # Compress Chain Path
+            parents[i] = parents[parents[i]]
+
+            # Move To Parent Operation
+            i = parents[i]
+
+        # Return Chain Root
+        return (i)
+
+    # Initialize Operations By Path And By Ancestor Path
+    by_path, by_ancestor = {}, collections.defaultdict(list)
+
+    # Iterate Over Operations
+    for i, (_, _, path, _) in enumerate(items):
+        # Expand Operation Path
+        path = axfs.expand_path(path)
+
+        # Get Ancestor Paths
+        ancestors = list(lineage(path))
+
+        # Iterate Over Operations On Same Path, Beneath Path, Or On Ancestor Paths
+        for j in itertools.chain((by_path[p] for p in ([path] + ancestors) if (p in by_path)), by_ancestor.get(path, ())):
+            # Join Chain Of Related Operation
+            parents[find(j)] = find(i)
+
+        # Record Operation Path
+        by_path[path] = i
+
+        # Iterate Over Ancestor Paths
+        for ancestor in (ancestors):
+            # Record Operation Beneath Ancestor Path
+            by_ancestor[ancestor].append(i)
+
+    # Initialize Operation Chains
+    groups = collections.defaultdict(list)
+
+    # Iterate Over Operations In Batch Order
+    for i, item in enumerate(items):
+        # Append Operation To Its Chain
+        groups[find(i)].append(item)
+
+    # Return Operation Chains
+    return (list(groups.values()))
+
+def execute(line_no, op, path, opts, defaults):
+    # Merge Default And Operation Options
+    opts = {**defaults, **opts} if (op.startswith("transfer")) else {}
+
+    try:
+        # Perform Operation
+        err = __OPERATIONS[op](path, **opts)
+    except Exception as e:
+        # Set Error
+        err = e
+
+    # Return Operation Result
+    return (line_no, op, path, err)
+
+def execute_chain(chain, defaults):
+    # Return Results Of Operations Performed In Batch Order
+    return ([execute(*item, defaults) for item in (chain)])
+
+def run(items, batch_jobs = None, **defaults):
+    # Check If Batch Worker Count Is Specified
+    if (batch_jobs is None):
+        # Set Batch Worker Count From Configuration
+        batch_jobs = __BATCH_JOBS
+
+    # Verify Batch Worker Count Is Positive
+    if (batch_jobs < 1):
+        # Raise Error
+        raise ValueError(f"batch worker count {cli.U}{batch_jobs}{cli.N} is not positive")
+
+    # Remove Unspecified Default Options
+    defaults = {key: value for key, value in defaults.items() if not(value is None)}
+
+    # Execute Chains Of Operations On Related Paths Across Worker Pool
+    for results in pool.execute(execute_chain, ((chain, defaults) for chain in chains(items)), batch_jobs):
+        # Yield Operation Results
+        yield from results
+
+def open_batch(path):
+    # Check If Batch Is Read From Standard Input
+    if (path == "-"):
+        # Return Standard Input
+        return (sys.stdin)
+
+    # Return Batch File
+    return (open(path, "r"))
+
+# End Batch Functions-----------------------------------------------------------------------------------------------------------------------------------------------------
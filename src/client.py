@@ -0,0 +1,179 @@
+# Developed By Nalin Ahuja, nalinahuja
+
+import os
+import sys
+import time
+
+from util import cli
+from util import ipc
+
+# End Imports-------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+# Job Status Poll Interval
+__POLL_INTERVAL = 0.5
+
+# Finished Job States
+__FINISHED_STATES = ("done", "failed", "cancelled")
+
+# Client Source Directory
+__SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# End Constants-----------------------------------------------------------------------------------------------------------------------------------------------------------
+
+def format_job(job):
+    # Get Job Timing Reference
+    start = job["started"] or job["submitted"]
+    end = job["finished"] or time.time()
+
+    # Form Job Description
+    desc = f"job {job['id']} {job['op']} {job['path']} {cli.RA} {job['state']} ({end - start:.1f}s)"
+
+    # Check If Job Has Progress
+    if (job.get("progress")):
+        # Append Job Progress
+        desc += f" {job['progress']}"
+
+    # Check If Job Has Error
+    if (job["error"]):
+        # Append Job Error
+        desc += f"{cli.NL}{cli.DA} {job['error']}"
+
+    # Return Job Description
+    return (desc)
+
+def request(message):
+    # Send Request To Daemon
+    response = ipc.request(message)
+
+    # Verify Response Was Received
+    if (response is None):
+        # Raise Error
+        raise ConnectionError("annexfs daemon closed connection")
+
+    # Verify Request Succeeded
+    if (not(response["ok"])):
+        # Raise Error
+        raise RuntimeError(response["error"])
+
+    # Return Response
+    return (response)
+
+def wait(job):
+    # Poll Until Job Finishes
+    while (not(job["state"] in __FINISHED_STATES)):
+        # Sleep Until Next Poll
+        time.sleep(__POLL_INTERVAL)
+
+        # Get Job Status
+        job = request({"request": "status", "job": job["id"]})["job"]
+
+    # Return Finished Job
+    return (job)
+
+# End Client Functions----------------------------------------------------------------------------------------------------------------------------------------------------
+
+if (__name__ == "__main__"):
+    # Initialize Argument Parser
+    parser = cli.Parser(prog = "annexfs")
+
+    # Initialize Action Arguments Group
+    action_arguments = parser.add_mutually_exclusive_group(required = True)
+
+    # Add Job Arguments
+    action_arguments.add_argument("--create", help = "create annexfs entry", type = str)
+    action_arguments.add_argument("--delete", help = "delete annexfs entry", type = str)
+    action_arguments.add_argument("--transfer-from", help = "transfer files from main to annexfs", type = str)
+    action_arguments.add_argument("--transfer-to", help = "transfer files to main from annexfs", type = str)
+
+    # Add Daemon Arguments
+    action_arguments.add_argument("--status", help = "show status of daemon job", type = int)
+    action_arguments.add_argument("--queue", help = "show all daemon jobs", action = "store_true")
+    action_arguments.add_argument("--shutdown", help = "stop annexfs daemon", action = "store_true")
+
+    # Add Job Option Arguments
+    parser.add_argument("--jobs", help = "number of parallel copy workers", type = int)
+    parser.add_argument("--verify", help = "transfer verification mode", choices = ("walk", "size", "hash"))
+    parser.add_argument("--wait", help = "wait for job to finish", action = "store_true")
+
+    # Parse Arguments
+    args = parser.parse_args()
+
+    # Initialize Exit Status
+    status = 0
+
+    # Declare Job Status
+    job = None
+
+    try:
+        # Determine Specified Action
+        if (args.queue):
+            # Iterate Over Daemon Jobs
+            for job in request({"request": "queue"})["jobs"]:
+                # Print Job Status
+                cli.write(format_job(job))
+        elif (not(args.status is None)):
+            # Get Job Status
+            job = request({"request": "status", "job": args.status})["job"]
+
+            # Check If Job Should Be Awaited
+            if (args.wait):
+                # Wait For Job
+                job = wait(job)
+
+            # Print Job Status
+            cli.write(format_job(job))
+        elif (args.shutdown):
+            # Request Daemon Shutdown
+            request({"request": "shutdown"})
+        else:
+            # Determine Job Operation And Path
+            op, path = next((op, path) for op, path in (("create", args.create), ("delete", args.delete), ("transfer-from", args.transfer_from), ("transfer-to", args.transfer_to)) if (path))
+
+            # Form Job Options
+            opts = {key: value for key, value in (("jobs", args.jobs), ("verify", args.verify)) if not(value is None)}
+
+            try:
+                # Submit Job With Expanded Path
+                job = request({"request": "submit", "op": op, "path": os.path.abspath(os.path.expanduser(path)), "opts": opts})["job"]
+            except (ConnectionRefusedError, FileNotFoundError):
+                # Print Stale Socket Status
+                cli.write(f"annexfs: daemon on {ipc.path()} is not running, running in process", file = sys.stderr)
+
+                # Run Program In Process
+                os.execv(sys.executable, [sys.executable, os.path.join(__SRC_DIR, "main.py")] + sys.argv[1:])
+
+            # Check If Job Should Be Awaited
+            if (args.wait):
+                # Wait For Job
+                job = wait(job)
+
+                # Print Job Status
+                cli.write(format_job(job))
+            else:
+                # Print Job Identifier
+                cli.write(f"annexfs: job {job['id']} {job['state']}")
+
+        # Check If Job Failed
+        if (args.wait and not(job is None) and (job["state"] != "done")):
+            # Set Exit Status
+            status = 1
+    except KeyboardInterrupt:
+        # Print Interrupt Status
+        cli.write(cli.nl(2) + f"annexfs: Program interrupted by user", file = sys.stderr)
+    except OSError as e:
+        # Print Connection Error
+        cli.write(f"annexfs: could not reach daemon on {ipc.path()} {cli.RA} {e}", file = sys.stderr)
+
+        # Set Exit Status
+        status = 1
+    except RuntimeError as e:
+        # Print Daemon Error
+        cli.write(f"annexfs: daemon request failed {cli.RA} {e}", file = sys.stderr)
+
+        # Set Exit Status
+        status = 1
+
+    # Exit With Status
+    sys.exit(status)
+
+# End Main Function-------------------------------------------------------------------------------------------------------------------------------------------------------
@@ -11,7 +11,7 @@ from util import cli
 __ANNEXFS_SRC = os.path.dirname(__file__)
 
 # AnnexFS Configuration File
-__ANNEXFS_CONFIG = os.path.join(__ANNEXFS_SRC, "../config.yml")
+__ANNEXFS_CONFIG = os.environ.get("ANNEXFS_CONFIG", os.path.join(__ANNEXFS_SRC, "../config.yml"))
 
 # End Constants-----------------------------------------------------------------------------------------------------------------------------------------------------------
 
@@ -26,6 +26,6 @@ with open(__ANNEXFS_CONFIG, "r") as file:
     # Verify Data Dictionary Integrity
     if (not(isinstance(data, dict))):
         # Raise Error
-        raise ValueError(f"configuration file {cli.U}{config}{cli.N} is malformed")
+        raise ValueError(f"configuration file {cli.U}{__ANNEXFS_CONFIG}{cli.N} is malformed")
 
 # End Configuration Loader------------------------------------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,413 @@
+# Developed By Nalin Ahuja, nalinahuja
+
+import os
+import axfs
+import time
+import batch
+import config
+import socket
+import signal
+import threading
+import socketserver
+import collections
+
+from util import cli
+from util import dev
+from util import ipc
+from util import roots
+
+from util.stats import Stats
+
+# End Imports-------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+# AnnexFS Root Paths
+__ANNEXFS_ROOT_PATHS = [root for root, weight in (roots.parse(config.data))]
+
+# Concurrent Jobs Per Device
+__DEVICE_JOBS = config.data.get("ANNEXFS_DEVICE_JOBS", 1)
+
+# Retained Finished Jobs
+__JOB_HISTORY = 1000
+
+# End Constants-----------------------------------------------------------------------------------------------------------------------------------------------------------
+
+class Job:
+    def __init__(self, id, op, path, opts, devices):
+        # Initialize Job Operation
+        self.id, self.op, self.path, self.opts = id, op, path, opts
+
+        # Initialize Job Devices
+        self.devices = devices
+
+        # Initialize Job State
+        self.state, self.error = "queued", None
+
+        # Initialize Job Timestamps
+        self.submitted, self.started, self.finished = time.time(), None, None
+
+        # Initialize Job Statistics
+        self.stats = Stats()
+
+    def to_dict(self):
+        # Return Job Fields
+        return ({
+            "id": self.id,
+            "op": self.op,
+            "path": self.path,
+            "state": self.state,
+            "error": self.error,
+            "submitted": self.submitted,
+            "started": self.started,
+            "finished": self.finished,
+            "progress": self.progress(),
+        })
+
+    def progress(self):
+        # Verify Job Is Running
+        if (self.state != "running"):
+            # Return No Progress
+            return (None)
+
+        # Get Current Phase
+        phase = self.stats.current or "start"
+
+        # Check If Copy Has Started
+        if (self.stats.copy_start is None):
+            # Return Phase Only
+            return (f"[{phase}]")
+
+        # Return Phase And Copy Progress
+        return (f"[{phase}] {self.stats.progress()}")
+
+class Scheduler:
+    def __init__(self, device_jobs, history):
+        # Initialize Device Concurrency Limit
+        self.device_jobs = device_jobs
+
+        # Initialize Retained Finished Jobs
+        self.history = history
+
+        # Initialize Scheduler Condition
+        self.cond = threading.Condition()
+
+        # Initialize Job Registry And Queue
+        self.jobs, self.queue = collections.OrderedDict(), []
+
+        # Initialize Active Jobs Per Device
+        self.active = collections.Counter()
+
+        # Initialize Job Identifier And Worker Threads
+        self.next_id, self.workers = 1, set()
+
+        # Initialize Stopping State
+        self.stopping = False
+
+        # Start Dispatcher Thread
+        self.dispatcher = threading.Thread(target = self.dispatch, daemon = True)
+        self.dispatcher.start()
+
+    def submit(self, op, path, opts):
+        # Check Operation
+        op, path, opts = batch.check(op, path, opts)
+
+        # Verify Operation Path Is Absolute
+        if (not(os.path.isabs(path))):
+            # Raise Error
+            raise ValueError(f"operation path {cli.U}{path}{cli.N} is not absolute")
+
+        # Protect Scheduler State
+        with self.cond:
+            # Verify Scheduler Is Accepting Jobs
+            if (self.stopping):
+                # Raise Error
+                raise RuntimeError("annexfs daemon is shutting down")
+
+            # Create Job
+            job = Job(self.next_id, op, path, opts, job_devices(path))
+
+            # Register And Queue Job
+            self.jobs[job.id] = job
+            self.queue.append(job)
+
+            # Update Job Identifier
+            self.next_id += 1
+
+            # Notify Dispatcher
+            self.cond.notify_all()
+
+        # Return Job
+        return (job)
+
+    def is_runnable(self, job):
+        # Return Device Capacity Status
+        return (all(self.active[device] < self.device_jobs for device in (job.devices)))
+
+    def dispatch(self):
+        # Protect Scheduler State
+        with self.cond:
+            # Dispatch Until Stopped
+            while (not(self.stopping)):
+                # Find First Runnable Job
+                job = next((job for job in (self.queue) if (self.is_runnable(job))), None)
+
+                # Check If No Job Is Runnable
+                if (job is None):
+                    # Wait For Scheduler Change
+                    self.cond.wait()
+
+                    # Continue Loop
+                    continue
+
+                # Remove Job From Queue
+                self.queue.remove(job)
+
+                # Iterate Over Job Devices
+                for device in (job.devices):
+                    # Update Active Jobs On Device
+                    self.active[device] += 1
+
+                # Set Job State
+                job.state, job.started = "running", time.time()
+
+                # Start Worker Thread
+                worker = threading.Thread(target = self.run, args = (job,), daemon = True)
+                self.workers.add(worker)
+                worker.start()
+
+    def run(self, job):
+        # Execute Job Operation
+        _, _, _, err = batch.execute(job.id, job.op, job.path, job.opts, {"stats": job.stats})
+
+        # Protect Scheduler State
+        with self.cond:
+            # Iterate Over Job Devices
+            for device in (job.devices):
+                # Update Active Jobs On Device
+                self.active[device] -= 1
+
+            # Set Job Result
+            job.state = "failed" if (err) else "done"
+            job.error = f"{type(err).__name__} - {err}" if (err) else None
+            job.finished = time.time()
+
+            # Remove Worker Thread
+            self.workers.discard(threading.current_thread())
+
+            # Prune Finished Job History
+            self.prune()
+
+            # Notify Dispatcher
+            self.cond.notify_all()
+
+        # Check If Trash Should Be Reaped After Jobs
+        if (axfs.REAP_MODE == "after"):
+            # Reap Trash Left By Job
+            axfs.reap()
+
+    def prune(self):
+        # Get Finished Jobs
+        finished = [id for id, job in self.jobs.items() if not(job.finished is None)]
+
+        # Iterate Over Excess Finished Jobs
+        for id in finished[:max(0, len(finished) - self.history)]:
+            # Remove Job From Registry
+            del self.jobs[id]
+
+    def status(self, id = None):
+        # Protect Scheduler State
+        with self.cond:
+            # Check If Job Is Specified
+            if (id is None):
+                # Return All Jobs
+                return ([job.to_dict() for job in self.jobs.values()])
+
+            # Verify Job Exists
+            if (not(id in self.jobs)):
+                # Raise Error
+                raise KeyError(f"job {id} does not exist")
+
+            # Return Job
+            return (self.jobs[id].to_dict())
+
+    def stop(self):
+        # Protect Scheduler State
+        with self.cond:
+            # Set Stopping State
+            self.stopping = True
+
+            # Iterate Over Queued Jobs
+            for job in (self.queue):
+                # Set Job State
+                job.state, job.finished = "cancelled", time.time()
+
+            # Clear Job Queue
+            self.queue.clear()
+
+            # Get Worker Threads
+            workers = list(self.workers)
+
+            # Notify Dispatcher
+            self.cond.notify_all()
+
+        # Iterate Over Worker Threads
+        for worker in (workers):
+            # Wait For Worker Thread
+            worker.join()
+
+# End Daemon Classes------------------------------------------------------------------------------------------------------------------------------------------------------
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        # Iterate Over Request Messages
+        while (True):
+            try:
+                # Receive Request Message
+                message = ipc.recv(self.rfile)
+            except ValueError:
+                # Send Error Response
+                ipc.send(self.connection, {"ok": False, "error": "malformed request"})
+
+                # Continue Loop
+                continue
+
+            # Check For Closed Connection
+            if (message is None):
+                # Break Loop
+                break
+
+            try:
+                # Send Response Message
+                ipc.send(self.connection, {"ok": True, **self.server.handle_message(message)})
+            except Exception as e:
+                # Send Error Response
+                ipc.send(self.connection, {"ok": False, "error": f"{type(e).__name__} - {e}"})
+
+            # Check If Shutdown Was Requested
+            if (self.server.stopping):
+                # Shutdown Server From Separate Thread
+                threading.Thread(target = self.server.shutdown, daemon = True).start()
+
+                # Break Loop
+                break
+
+class Server(socketserver.ThreadingUnixStreamServer):
+    # Server Threads Do Not Block Exit
+    daemon_threads = True
+
+    def __init__(self, sock_path, scheduler):
+        # Initialize Scheduler
+        self.scheduler = scheduler
+
+        # Initialize Stopping State
+        self.stopping = False
+
+        # Initialize Unix Stream Server
+        super().__init__(sock_path, RequestHandler)
+
+    def handle_message(self, message):
+        # Get Request Type
+        request = message.get("request")
+
+        # Determine Request Handling
+        if (request == "submit"):
+            # Submit Job
+            job = self.scheduler.submit(message.get("op"), message.get("path"), message.get("opts") or {})
+
+            # Return Job
+            return ({"job": job.to_dict()})
+        elif (request == "status"):
+            # Return Job Status
+            return ({"job": self.scheduler.status(message.get("job"))})
+        elif (request == "queue"):
+            # Return All Jobs
+            return ({"jobs": self.scheduler.status()})
+        elif (request == "shutdown"):
+            # Set Stopping State
+            self.stopping = True
+
+            # Return Empty Response
+            return ({})
+        else:
+            # Raise Error
+            raise ValueError(f"request {request} is not supported")
+
+# End Server Classes------------------------------------------------------------------------------------------------------------------------------------------------------
+
+def job_devices(path):
+    try:
+        # Get Root Owning Symbolic Link Target
+        root = roots.owner(__ANNEXFS_ROOT_PATHS, os.path.realpath(path)) if (os.path.islink(path)) else None
+
+        # Check If Path Is Not An Existing Entry
+        if (root is None):
+            # Return Device Of Path Directory Leaving Root Placement To Transfer
+            return (frozenset((dev.device(os.path.dirname(path)),)))
+
+        # Return Devices Of Path Directory And Owning AnnexFS Root
+        return (frozenset((dev.device(os.path.dirname(path)), dev.device(root))))
+    except OSError:
+        # Return No Devices
+        return (frozenset())
+
+def is_running(sock_path):
+    # Open Socket Connection
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        try:
+            # Connect To Socket
+            conn.connect(sock_path)
+        except OSError:
+            # Return Not Running
+            return (False)
+
+    # Return Running
+    return (True)
+
+def serve(sock_path = None):
+    # Get Socket Path
+    sock_path = sock_path or ipc.path()
+
+    # Check If Socket Path Exists
+    if (os.path.exists(sock_path)):
+        # Verify Daemon Is Not Running
+        if (is_running(sock_path)):
+            # Return Error
+            return (RuntimeError(f"annexfs daemon is already running on {cli.U}{sock_path}{cli.N}"))
+
+        # Remove Stale Socket
+        os.remove(sock_path)
+
+    # Initialize Job Scheduler
+    scheduler = Scheduler(__DEVICE_JOBS, __JOB_HISTORY)
+
+    # Initialize Socket Server
+    server = Server(sock_path, scheduler)
+
+    # Restrict Socket To Owner
+    os.chmod(sock_path, 0o600)
+
+    # Handle SIGTERM As Interrupt
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    try:
+        # Print Daemon Status
+        cli.write(f"annexfs: daemon listening on {sock_path}")
+
+        # Serve Requests
+        server.serve_forever()
+    except KeyboardInterrupt:
+        # Print Daemon Status
+        cli.write(cli.nl() + f"annexfs: daemon interrupted, waiting for running jobs")
+    finally:
+        # Stop Job Scheduler
+        scheduler.stop()
+
+        # Close Socket Server
+        server.server_close()
+
+        # Remove Socket
+        os.remove(sock_path)
+
+    # Return Success
+    return (None)
+
+# End Daemon Functions----------------------------------------------------------------------------------------------------------------------------------------------------
@@ -1,9 +1,17 @@
 # Developed By Nalin Ahuja, nalinahuja
 
+import os
 import sys
+import json
+import math
+import time
 import traceback
 
 from util import cli
+from util import profile
+from util import selection
+
+from util.stats import Stats
 
 # End Imports-------------------------------------------------------------------------------------------------------------------------------------------------------------
 
@@ -21,17 +29,104 @@ if (__name__ == "__main__"):
     # Add Transfer Arguments
     action_arguments.add_argument("--transfer-from", help = "transfer files from main to annexfs", type = str)
     action_arguments.add_argument("--transfer-to", help = "transfer files to main from annexfs", type = str)
+    action_arguments.add_argument("--extract", help = "extract member of packed annexfs entry", nargs = 2, metavar = ("LINK", "MEMBER"))
+    action_arguments.add_argument("--drop-shadow", help = "delete shadow copy kept by transfer to main", type = str)
+    action_arguments.add_argument("--plan", help = "report size, capacity, and duration of transfer to annexfs without copying", type = str)
+
+    # Add Eviction Arguments
+    action_arguments.add_argument("--evict-until", help = "transfer coldest entries of directory to annexfs until free space target (bytes or %%) is met", nargs = 2, metavar = ("DIR", "TARGET"))
+
+    # Add Check Arguments
+    action_arguments.add_argument("--fsck", help = "check annexfs health and links under optional directory", nargs = "?", const = "", metavar = "DIR", type = str)
+
+    # Add Trash Arguments
+    action_arguments.add_argument("--reap", help = "remove trash left by earlier deletions and transfers", action = "store_true")
+
+    # Add Catalog Arguments
+    action_arguments.add_argument("--list", help = "list annexfs entries", action = "store_true")
+    action_arguments.add_argument("--du", help = "show annexfs usage under directory", nargs = "?", const = "", type = str)
+    action_arguments.add_argument("--where", help = "show annexfs entry of link path", type = str)
+    action_arguments.add_argument("--leases", help = "list transfers holding device leases", action = "store_true")
+
+    # Add Batch Arguments
+    action_arguments.add_argument("--batch", help = "run operations listed in file (- for stdin)", type = str)
+
+    # Add Daemon Arguments
+    action_arguments.add_argument("--serve", help = "run annexfs daemon", action = "store_true")
+
+    # Add Transfer Option Arguments
+    parser.add_argument("--jobs", help = "number of parallel copy workers", type = int)
+    parser.add_argument("--verify", help = "transfer verification mode", choices = ("walk", "size", "hash"), default = "walk")
+    parser.add_argument("--keep-shadow", help = "keep annexfs copy after transfer to main for delta sync", action = "store_true")
+    parser.add_argument("--pack", help = "store directory as pack files with optional compression", nargs = "?", const = "none", choices = ("none", "gz", "bz2", "xz"))
+    parser.add_argument("--output", help = "output path of extracted member", type = str)
+    parser.add_argument("--dedup", help = "store transferred files once by content digest", action = "store_true", default = None)
+    parser.add_argument("--min-size", help = "transfer only files of directory at least this size", type = cli.parse_size)
+    parser.add_argument("--include", help = "transfer only files of directory matching glob (repeatable)", action = "append")
+    parser.add_argument("--exclude", help = "skip files of directory matching glob (repeatable)", action = "append")
+    parser.add_argument("--older-than", help = "transfer only files of directory unmodified for this many days", type = float)
+    parser.add_argument("--delta-hash", help = "compare files by digest during delta sync", action = "store_true")
+    parser.add_argument("--dry-run", help = "plan transfers and list eviction candidates without transferring them", action = "store_true")
+    parser.add_argument("--repair", help = "repair issues found by fsck where safe", action = "store_true")
+    parser.add_argument("--scrub", help = "verify content digests of entries due for scrubbing during fsck", action = "store_true")
+    parser.add_argument("--scrub-rate", help = "maximum scrub read rate per second", type = cli.parse_size)
+    parser.add_argument("--scrub-age", help = "days before scrubbed entries are scrubbed again", type = float)
+    parser.add_argument("--defer-reap", help = "leave removed trees in trash for a later reap", action = "store_true")
+    parser.add_argument("--bwlimit", help = "maximum transfer copy rate per second", type = cli.parse_size)
+    parser.add_argument("--file-limit", help = "maximum files transferred per second", type = float)
+    parser.add_argument("--batch-jobs", help = "number of concurrent batch operations", type = int)
+    parser.add_argument("--stats", help = "print transfer statistics on exit", choices = ("json",))
+    parser.add_argument("--verbose", help = "report copy methods used by transfers", action = "store_true")
+    parser.add_argument("--profile", help = "write per phase timing span report to json file", type = str, default = os.environ.get("ANNEXFS_PROFILE"))
+    parser.add_argument("--profile-hooks", help = "comma separated profile hooks to run per phase (cpu, memory)", type = str, default = os.environ.get("ANNEXFS_PROFILE_HOOKS", ""))
 
     # Parse Arguments
     args = parser.parse_args()
 
+    # Get Requested Profile Hooks
+    profile_hooks = [hook for hook in args.profile_hooks.split(",") if (hook)]
+
+    # Iterate Over Requested Profile Hooks
+    for hook in (profile_hooks):
+        # Verify Profile Hook Is Supported
+        if (not(hook in profile.HOOKS)):
+            # Exit With Usage Error
+            parser.error(f"profile hook {hook} is not supported")
+
+    # Check If Any Selection Filter Is Specified
+    if (any(not(value is None) for value in (args.min_size, args.include, args.exclude, args.older_than))):
+        # Verify Selection Filters Apply To Action
+        if (not(args.transfer_from or args.plan)):
+            # Exit With Usage Error
+            parser.error("selection filters apply only to --transfer-from and --plan")
+
+        # Initialize File Selection
+        select = selection.Selection(args.min_size, args.include, args.exclude, args.older_than)
+    else:
+        # Set No File Selection
+        select = None
+
     # Declare Error Return
     err = None
 
+    # Initialize Exit Status
+    status = 0
+
+    # Initialize Transfer Statistics
+    stats = Stats(display = sys.stderr.isatty())
+
+    # Check If Operations Should Be Profiled
+    if (args.profile):
+        # Start Profiler
+        profile.start(args.profile, profile_hooks)
+
     try:
         # Import AnnexFS Module
         import axfs
 
+        # Set Transfer Rate Limits Over Configuration
+        axfs.set_limits(args.bwlimit, args.file_limit)
+
         # Complete Specified Action
         if (args.create):
             # Create AnnexFS Entry
@@ -39,15 +134,227 @@ if (__name__ == "__main__"):
         elif (args.delete):
             # Delete AnnexFS Entry
             err = axfs.delete(args.delete)
+        elif (args.plan or (args.transfer_from and args.dry_run)):
+            # Plan Transfer To AnnexFS
+            entry_plan, err = axfs.plan_transfer(args.plan or args.transfer_from, dedup = args.dedup, pack_mode = args.pack, select = select)
+
+            # Verify Transfer Was Planned
+            if (err is None):
+                # Print Planned Source, Root, And Method
+                cli.write(f"annexfs: plan {entry_plan.src_path} {cli.RA} {entry_plan.root()} ({entry_plan.method})")
+
+                # Print Source Totals
+                cli.write(f"{cli.DA} {cli.size(entry_plan.size)} in {entry_plan.files} file(s) and {entry_plan.dirs} directory(s)")
+
+                # Iterate Over Largest Files
+                for rel_path, size in (entry_plan.largest):
+                    # Print Largest File
+                    cli.write(f"{cli.DA} {cli.size(size):>10}  {rel_path}")
+
+                # Print Required And Available Capacity
+                cli.write(f"{cli.DA} needs {'' if (entry_plan.exact) else 'at most '}{cli.size(entry_plan.need_bytes)} and {entry_plan.need_inodes} inode(s), {cli.size(entry_plan.free_bytes)} and {'unlimited' if (entry_plan.free_inodes is None) else entry_plan.free_inodes} inode(s) free")
+
+                # Check If Duration Is Estimated
+                if (entry_plan.seconds is None):
+                    # Print Unknown Duration
+                    cli.write(f"{cli.DA} duration unknown, no throughput measured from this device")
+                else:
+                    # Print Estimated Duration
+                    cli.write(f"{cli.DA} estimated {time.strftime('%H:%M:%S', time.gmtime(math.ceil(entry_plan.seconds)))}" + ("" if (entry_plan.rate is None) else f" at {cli.size(entry_plan.rate)}/s"))
+
+                # Print Capacity Verdict
+                cli.write(f"{cli.DA} " + ("fits" if (entry_plan.fits()) else "does not fit" if (entry_plan.exact) else "may not fit"))
+
+                # Check If Transfer Does Not Fit
+                if (entry_plan.exact and not(entry_plan.fits())):
+                    # Set Exit Status
+                    status = 1
         elif (args.transfer_from):
             # Transfer Files To AnnexFS
-            err = axfs.transfer_from(args.transfer_from)
+            err = axfs.transfer_from(args.transfer_from, jobs = args.jobs, verify = args.verify, stats = stats, delta_hash = args.delta_hash, dedup = args.dedup, pack_mode = args.pack, select = select)
         elif (args.transfer_to):
             # Transfer Files From AnnexFS
-            err = axfs.transfer_to(args.transfer_to)
+            err = axfs.transfer_to(args.transfer_to, jobs = args.jobs, verify = args.verify, stats = stats, keep_shadow = args.keep_shadow)
+        elif (args.extract):
+            # Extract Member Of Packed Entry
+            err = axfs.extract(*args.extract, out_path = args.output)
+        elif (args.drop_shadow):
+            # Delete AnnexFS Shadow Entry
+            err = axfs.drop_shadow(args.drop_shadow)
+        elif (args.evict_until):
+            # Transfer Coldest Entries To AnnexFS
+            evicted, err = axfs.evict_until(*args.evict_until, dry_run = args.dry_run, jobs = args.jobs, verify = args.verify, stats = stats)
+
+            # Iterate Over Evicted Entries
+            for path, usage, atime, item_err in (evicted):
+                # Form Entry Status
+                status_msg = "planned" if (args.dry_run) else "ok" if (item_err is None) else f"{type(item_err).__name__} - {item_err}"
+
+                # Print Evicted Entry
+                cli.write(f"annexfs: {cli.size(usage):>10}  {time.strftime('%Y-%m-%d', time.localtime(atime))}  {path} {cli.RA} {status_msg}")
+
+                # Check If Entry Failed
+                if (not(item_err is None)):
+                    # Set Exit Status
+                    status = 1
+        elif (not(args.fsck is None)):
+            # Check AnnexFS Health
+            issues, scrubbed, err = axfs.fsck(args.fsck or None, repair = args.repair, scrub = args.scrub, jobs = args.jobs, rate = args.scrub_rate, age = args.scrub_age)
+
+            # Iterate Over Scrubbed Entries
+            for link_path, scrub_status, files in (scrubbed):
+                # Print Scrubbed Entry
+                cli.write(f"annexfs: scrub {scrub_status:8}  {files:>8}  {link_path}")
+
+            # Iterate Over Issues
+            for kind, path, detail, fixed in (issues):
+                # Print Issue
+                cli.write(f"annexfs: {kind:12}  {path} {cli.RA} {detail}" + (" (repaired)" if (fixed) else ""))
+
+            # Get Unrepaired Issue Count
+            unrepaired = sum(1 for issue in (issues) if not(issue[3]))
+
+            # Print Check Summary
+            cli.write(f"annexfs: {len(issues)} issue(s), {len(issues) - unrepaired} repaired, {len(scrubbed)} entry(s) scrubbed")
+
+            # Check If Any Issue Remains
+            if (unrepaired):
+                # Set Exit Status
+                status = 1
+        elif (args.list):
+            # Iterate Over AnnexFS Entries
+            for entry in axfs.list_entries():
+                # Print Entry Record
+                cli.write(f"{entry['uuid']}  {entry['type']:4}  {entry['state']:6}  {cli.size(entry['size']):>10}  {entry['files']:>8}  {entry['link_path']}")
+        elif (not(args.du is None)):
+            # Get AnnexFS Usage
+            size, files, entries = axfs.disk_usage(args.du or None)
+
+            # Print Usage Totals
+            cli.write(f"{cli.size(size)} in {files} file(s) across {entries} entry(s)")
+        elif (args.where):
+            # Get AnnexFS Entry
+            entry = axfs.where(args.where)
+
+            # Verify Entry Exists
+            if (entry is None):
+                # Set Error
+                err = FileNotFoundError(f"annexfs has not stored {cli.U}{args.where}{cli.N}")
+            else:
+                # Print Entry Record
+                cli.write(f"{entry['link_path']} {cli.RA} {entry['uuid']} ({entry['type']}, {entry['state']}, {cli.size(entry['size'])}, {entry['files']} file(s))")
+        elif (args.leases):
+            # Iterate Over Lease Records
+            for record in axfs.list_leases():
+                # Check If Lease Record Is Being Written
+                if (not(record)):
+                    # Continue Loop
+                    continue
+
+                # Print Lease Record
+                cli.write(f"{record['device']}  slot {record['slot']}  pid {record['pid']}@{record['host']}  {record['op']:13}  {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(record['started']))}  {record['path']}")
+        elif (args.batch):
+            # Import Batch Module
+            import batch
+
+            # Load Batch Operations
+            with batch.open_batch(args.batch) as file:
+                # Parse Batch Operations
+                items, err = batch.load(file)
+
+            # Verify Batch Operations Were Parsed
+            if (err is None):
+                # Initialize Failure Count
+                failures = 0
+
+                # Iterate Over Batch Results
+                for line_no, op, path, item_err in batch.run(items, args.batch_jobs, jobs = args.jobs, verify = args.verify):
+                    # Check If Operation Failed
+                    if (not(item_err is None)):
+                        # Update Failure Count
+                        failures += 1
+
+                        # Print Operation Failure
+                        cli.write(f"annexfs: [{line_no}] {op} {path} {cli.RA} {type(item_err).__name__} - {item_err}", file = sys.stderr)
+                    else:
+                        # Print Operation Success
+                        cli.write(f"annexfs: [{line_no}] {op} {path} {cli.RA} ok")
+
+                # Print Batch Summary
+                cli.write(f"annexfs: {len(items) - failures} succeeded, {failures} failed")
+
+                # Check If Any Operation Failed
+                if (failures):
+                    # Set Exit Status
+                    status = 1
+        elif (args.serve):
+            # Import Daemon Module
+            import daemon
+
+            # Serve Daemon Requests
+            err = daemon.serve()
+
+        # Finish Transfer Statistics
+        stats.finish()
+
+        # Check If Statistics Should Be Printed
+        if (args.stats == "json"):
+            # Print Statistics As JSON
+            cli.write(json.dumps({**stats.to_dict(), "copy_methods": dict(axfs.copy_report), "error": None if (err is None) else str(err)}, indent = 2))
+
+        # Check If Copy Methods Should Be Reported
+        if (args.verbose):
+            # Iterate Over Copy Methods
+            for method, count in axfs.copy_report.most_common():
+                # Print Copy Method Count
+                cli.write(f"annexfs: {method} {cli.RA} {count} file(s)")
+
+        # Determine If Operation Moved Trees To Trash
+        trashed = not(args.dry_run) and any((args.transfer_from, args.transfer_to, args.delete, args.drop_shadow, args.evict_until, args.batch))
+
+        # Check If Trash Should Be Reaped
+        if (args.reap or (trashed and not(args.defer_reap) and (axfs.REAP_MODE == "after"))):
+            # Initialize Reap Statistics
+            reap_stats = Stats(display = sys.stderr.isatty())
+
+            try:
+                # Reap Trash Items
+                reaped, reap_err = axfs.reap(jobs = args.jobs, stats = reap_stats)
+            except KeyboardInterrupt:
+                # Print Deferred Reap Status
+                cli.write(cli.nl(2) + f"annexfs: reaping interrupted, remaining trash is reaped by the next run", file = sys.stderr)
+
+                # Reset Reaped Items
+                reaped, reap_err = [], None
+
+            # Finish Reap Statistics
+            reap_stats.finish()
+
+            # Iterate Over Reaped Items
+            for item_path, removed, item_err in (reaped):
+                # Check If Item Failed
+                if (not(item_err is None)):
+                    # Print Item Failure
+                    cli.write(f"annexfs: reap {item_path} {cli.RA} {type(item_err).__name__} - {item_err}", file = sys.stderr)
+
+                    # Set Exit Status
+                    status = 1
+
+            # Check If Reap Was Requested Or Verbose Output Removed Items
+            if (args.reap or (args.verbose and reaped)):
+                # Print Reap Summary
+                cli.write(f"annexfs: reaped {sum(1 for item in (reaped) if (item[2] is None))} trash item(s), {sum(item[1] for item in (reaped))} path(s) removed")
+
+            # Check If Reap Failed
+            if (err is None):
+                # Set Error
+                err = reap_err
     except KeyboardInterrupt:
         # Print Interrupt Status
         cli.write(cli.nl(2) + f"annexfs: Program interrupted by user", file = sys.stderr)
+
+        # Set Exit Status
+        status = 130
     except Exception:
         # Get Error Information
         err_type, err_msg, err_tb = sys.exc_info()
@@ -61,6 +368,17 @@ if (__name__ == "__main__"):
         # Print Error Traceback
         traceback.print_tb(err_tb)
 
+        # Set Exit Status
+        status = 1
+
+    # Check If Operations Were Profiled
+    if (args.profile):
+        # Write Profile Reports
+        profile.finish()
+
+        # Print Profile Report Path
+        cli.write(f"annexfs: profile written to {args.profile}", file = sys.stderr)
+
     # Check Error Status Value
     if (not(err is None)):
         # Print Error Status
@@ -69,4 +387,10 @@ if (__name__ == "__main__"):
         # Print Error Information
         cli.write(f"{cli.DA} {type(err).__name__} - {err}", file = sys.stderr)
 
+        # Set Exit Status
+        status = 1
+
+    # Exit With Status
+    sys.exit(status)
+
 # End Main Function-------------------------------------------------------------------------------------------------------------------------------------------------------
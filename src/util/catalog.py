@@ -0,0 +1,218 @@
+# Developed By Nalin Ahuja, nalinahuja
+
+import os
+import time
+import sqlite3
+
+# End Imports-------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+# Catalog File Name
+NAME = ".annexfs.db"
+
+# Catalog Lock Timeout
+TIMEOUT = 30
+
+# Catalog Schema
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    uuid TEXT PRIMARY KEY,
+    link_path TEXT NOT NULL,
+    type TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    files INTEGER NOT NULL,
+    created REAL NOT NULL,
+    updated REAL NOT NULL,
+    state TEXT NOT NULL DEFAULT 'linked',
+    dedup INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS entries_link_path ON entries (link_path);
+CREATE TABLE IF NOT EXISTS blobs (
+    digest TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    refs INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS blobs_size ON blobs (size);
+CREATE TABLE IF NOT EXISTS scrubs (
+    uuid TEXT PRIMARY KEY,
+    scrubbed REAL NOT NULL,
+    updated REAL NOT NULL,
+    status TEXT NOT NULL,
+    files INTEGER NOT NULL,
+    errors INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS trash (
+    path TEXT PRIMARY KEY,
+    created REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS throughput (
+    device TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    bytes_per_second REAL NOT NULL,
+    files_per_second REAL NOT NULL,
+    samples INTEGER NOT NULL,
+    updated REAL NOT NULL,
+    PRIMARY KEY (device, mode)
+);
+"""
+
+# Throughput History Smoothing Weight
+WEIGHT = 0.3
+
+# Catalog Column Migrations
+MIGRATIONS = {
+    "state": "ALTER TABLE entries ADD COLUMN state TEXT NOT NULL DEFAULT 'linked'",
+    "dedup": "ALTER TABLE entries ADD COLUMN dedup INTEGER NOT NULL DEFAULT 0",
+}
+
+# End Constants-----------------------------------------------------------------------------------------------------------------------------------------------------------
+
+class Catalog:
+    def __init__(self, root_path):
+        # Initialize Catalog Path
+        self.path = os.path.join(root_path, NAME)
+
+        # Declare Catalog Connection
+        self.conn = None
+
+    def __enter__(self):
+        # Open Catalog Connection
+        self.conn = sqlite3.connect(self.path, timeout = TIMEOUT)
+
+        # Set Row Factory
+        self.conn.row_factory = sqlite3.Row
+
+        # Create Catalog Schema
+        self.conn.executescript(SCHEMA)
+
+        # Get Existing Entry Columns
+        columns = {row["name"] for row in self.conn.execute("PRAGMA table_info(entries)")}
+
+        # Iterate Over Column Migrations
+        for column, statement in MIGRATIONS.items():
+            # Check If Column Is Missing
+            if (not(column in columns)):
+                # Add Missing Column
+                self.conn.execute(statement)
+
+        # Return Catalog
+        return (self)
+
+    def __exit__(self, exc_type, *args):
+        # Check If Transaction Succeeded
+        if (exc_type is None):
+            # Commit Transaction
+            self.conn.commit()
+        else:
+            # Rollback Transaction
+            self.conn.rollback()
+
+        # Close Catalog Connection
+        self.conn.close()
+
+    def add(self, uuid, link_path, type, size, files, state = "linked", dedup = False):
+        # Get Current Time
+        now = time.time()
+
+        # Insert Entry Record
+        self.conn.execute("INSERT OR REPLACE INTO entries (uuid, link_path, type, size, files, created, updated, state, dedup) VALUES (?, ?, ?, ?, ?, COALESCE((SELECT created FROM entries WHERE uuid = ?), ?), ?, ?, ?)", (uuid, link_path, type, size, files, uuid, now, now, state, int(dedup)))
+
+    def get(self, uuid):
+        # Return Entry Record For UUID
+        return (self.conn.execute("SELECT * FROM entries WHERE uuid = ?", (uuid,)).fetchone())
+
+    def acquire(self, blobs):
+        # Iterate Over Blob Digests, Sizes, And Reference Counts
+        for hex_digest, size, refs in (blobs):
+            # Increment Blob References
+            self.conn.execute("INSERT INTO blobs VALUES (?, ?, ?) ON CONFLICT (digest) DO UPDATE SET refs = refs + excluded.refs", (hex_digest, size, refs))
+
+    def release(self, blobs):
+        # Iterate Over Blob Digests And Reference Counts
+        for hex_digest, refs in (blobs):
+            # Decrement Blob References
+            self.conn.execute("UPDATE blobs SET refs = refs - ? WHERE digest = ?", (refs, hex_digest))
+
+        # Get Unreferenced Blob Digests
+        freed = [row["digest"] for row in self.conn.execute("SELECT digest FROM blobs WHERE refs <= 0")]
+
+        # Delete Unreferenced Blob Records
+        self.conn.execute("DELETE FROM blobs WHERE refs <= 0")
+
+        # Return Unreferenced Blob Digests
+        return (freed)
+
+    def blobs(self):
+        # Return Blob Records
+        return (self.conn.execute("SELECT * FROM blobs").fetchall())
+
+    def blob_sizes(self):
+        # Return Distinct Blob Sizes
+        return ({row["size"] for row in self.conn.execute("SELECT DISTINCT size FROM blobs")})
+
+    def drop_blob(self, hex_digest):
+        # Delete Blob Record
+        self.conn.execute("DELETE FROM blobs WHERE digest = ?", (hex_digest,))
+
+    def scrubs(self):
+        # Return Scrub Records By UUID
+        return ({row["uuid"]: row for row in self.conn.execute("SELECT * FROM scrubs")})
+
+    def record_scrub(self, uuid, updated, status, files, errors):
+        # Insert Scrub Record
+        self.conn.execute("INSERT OR REPLACE INTO scrubs VALUES (?, ?, ?, ?, ?, ?)", (uuid, time.time(), updated, status, files, errors))
+
+    def add_trash(self, path):
+        # Insert Trash Item Record
+        self.conn.execute("INSERT OR REPLACE INTO trash VALUES (?, ?)", (path, time.time()))
+
+    def trash(self):
+        # Return Trash Item Paths And Registration Times Ordered By Age
+        return ([(row["path"], row["created"]) for row in self.conn.execute("SELECT path, created FROM trash ORDER BY created")])
+
+    def remove_trash(self, path):
+        # Delete Trash Item Record
+        self.conn.execute("DELETE FROM trash WHERE path = ?", (path,))
+
+    def throughput(self, device, mode):
+        # Return Throughput Record Of Source Device And Transfer Mode
+        return (self.conn.execute("SELECT * FROM throughput WHERE device = ? AND mode = ?", (device, mode)).fetchone())
+
+    def record_throughput(self, device, mode, bytes_per_second, files_per_second):
+        # Insert Throughput Record Or Smooth Existing Rates Toward Sample
+        self.conn.execute("INSERT INTO throughput VALUES (?, ?, ?, ?, 1, ?) ON CONFLICT (device, mode) DO UPDATE SET bytes_per_second = bytes_per_second * (1 - ?) + excluded.bytes_per_second * ?, files_per_second = files_per_second * (1 - ?) + excluded.files_per_second * ?, samples = samples + 1, updated = excluded.updated", (device, mode, bytes_per_second, files_per_second, time.time(), WEIGHT, WEIGHT, WEIGHT, WEIGHT))
+
+    def set_state(self, uuid, state):
+        # Update Entry State
+        self.conn.execute("UPDATE entries SET state = ?, updated = ? WHERE uuid = ?", (state, time.time(), uuid))
+
+    def remove(self, uuid):
+        # Delete Entry And Scrub Records
+        self.conn.execute("DELETE FROM entries WHERE uuid = ?", (uuid,))
+        self.conn.execute("DELETE FROM scrubs WHERE uuid = ?", (uuid,))
+
+    def lookup(self, link_path, state = None):
+        # Check If Entry State Is Specified
+        if (not(state is None)):
+            # Return Entry Record For Link Path In State
+            return (self.conn.execute("SELECT * FROM entries WHERE link_path = ? AND state = ?", (link_path, state)).fetchone())
+
+        # Return Entry Record For Link Path Preferring Linked Entries
+        return (self.conn.execute("SELECT * FROM entries WHERE link_path = ? ORDER BY state = 'linked' DESC", (link_path,)).fetchone())
+
+    def entries(self):
+        # Return Entry Records Ordered By Link Path
+        return (self.conn.execute("SELECT * FROM entries ORDER BY link_path").fetchall())
+
+    def usage(self, link_dir = None):
+        # Check If Link Directory Is Specified
+        if (link_dir is None):
+            # Return Total Usage
+            return (self.conn.execute("SELECT COALESCE(SUM(size), 0), COALESCE(SUM(files), 0), COUNT(*) FROM entries").fetchone())
+
+        # Form Link Path Bounds Under Directory
+        lower, upper = link_dir.rstrip("/") + "/", link_dir.rstrip("/") + "0"
+
+        # Return Usage Under Link Directory
+        return (self.conn.execute("SELECT COALESCE(SUM(size), 0), COALESCE(SUM(files), 0), COUNT(*) FROM entries WHERE link_path = ? OR (link_path >= ? AND link_path < ?)", (link_dir, lower, upper)).fetchone())
+
+# End Catalog Classes-----------------------------------------------------------------------------------------------------------------------------------------------------
@@ -27,6 +27,33 @@ def cl(ln = 1):
     # Write Clear Line Sequence
     write((UP + CL) * ln, end = "", file = sys.stdout)
 
+def size(n):
+    # Iterate Over Size Units
+    for unit in ("B", "KiB", "MiB", "GiB", "TiB"):
+        # Check If Size Fits Unit
+        if (abs(n) < 1024 or unit == "TiB"):
+            # Return Formatted Size
+            return (f"{n:.1f} {unit}" if (unit != "B") else f"{n} {unit}")
+
+        # Scale Size To Next Unit
+        n /= 1024
+
+def parse_size(text):
+    # Split Size Number And Unit
+    number, unit = text.strip().rstrip("Bb").rstrip("i"), ""
+
+    # Check If Size Has A Unit Suffix
+    if (number[-1:].upper() in ("K", "M", "G", "T")):
+        # Split Unit Suffix
+        number, unit = number[:-1], number[-1].upper()
+
+    try:
+        # Return Size In Bytes
+        return (int(float(number) * (1024 ** ("_KMGT".index(unit) if (unit) else 0))))
+    except ValueError:
+        # Raise Error
+        raise ValueError(f"size {U}{text}{N} is not valid")
+
 def write(*args, **kwargs):
     # Write To Command Line
     print(*args, **kwargs, flush = True)
@@ -0,0 +1,61 @@
+# Developed By Nalin Ahuja, nalinahuja
+
+import os
+
+# End Imports-------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+# Block Device Information Directory
+__SYS_DEV_BLOCK = "/sys/dev/block"
+
+# Worker Limits By Device Type
+__ROTATIONAL_JOBS, __MAX_JOBS = 2, 32
+
+# End Constants-----------------------------------------------------------------------------------------------------------------------------------------------------------
+
+def device(path):
+    # Get Path Statistics
+    path_stat = os.stat(path)
+
+    # Return Path Device
+    return (path_stat.st_dev)
+
+def is_rotational(path):
+    # Get Path Device
+    path_dev = device(path)
+
+    # Form Path To Block Device Information
+    dev_path = os.path.join(__SYS_DEV_BLOCK, f"{os.major(path_dev)}:{os.minor(path_dev)}")
+
+    # Verify Block Device Information Exists
+    if (not(os.path.exists(dev_path))):
+        # Return Non-Rotational
+        return (False)
+
+    # Resolve Block Device Information Path
+    dev_path = os.path.realpath(dev_path)
+
+    # Iterate Over Device And Parent Device Queues
+    for queue_dir in (dev_path, os.path.dirname(dev_path)):
+        # Form Path To Rotational Flag
+        flag_path = os.path.join(queue_dir, "queue", "rotational")
+
+        # Verify Rotational Flag Exists
+        if (os.path.exists(flag_path)):
+            # Read Rotational Flag
+            with open(flag_path, "r") as file:
+                # Return Rotational Status
+                return (file.read().strip() == "1")
+
+    # Return Non-Rotational
+    return (False)
+
+def default_jobs(*paths):
+    # Check If Any Path Resides On A Rotational Device
+    if (any(is_rotational(path) for path in (paths))):
+        # Return Rotational Worker Count
+        return (__ROTATIONAL_JOBS)
+
+    # Return Processor Scaled Worker Count
+    return (min(__MAX_JOBS, (os.cpu_count() or 1) * 4))
+
+# End Device Functions----------------------------------------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,84 @@
+# Developed By Nalin Ahuja, nalinahuja
+
+import os
+import hashlib
+
+# End Imports-------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+# Digest File Name
+NAME = ".axfs-digests"
+
+# Digest Read Chunk Size
+__CHUNK = 1024 * 1024
+
+# End Constants-----------------------------------------------------------------------------------------------------------------------------------------------------------
+
+def new():
+    # Return Streaming Digest
+    return (hashlib.blake2b())
+
+def file_digest(path, progress = None):
+    # Initialize Streaming Digest
+    hash = new()
+
+    # Open File For Reading
+    with open(path, "rb") as file:
+        # Read Until End Of File
+        for chunk in iter(lambda: file.read(__CHUNK), b""):
+            # Update Streaming Digest
+            hash.update(chunk)
+
+            # Check If Progress Callback Is Specified
+            if (not(progress is None)):
+                # Report Read Bytes
+                progress(len(chunk))
+
+    # Return Hex Digest
+    return (hash.hexdigest())
+
+def write(enc_path, digests):
+    # Form Path To Digest File
+    digest_path = os.path.join(enc_path, NAME)
+
+    # Write Digest File
+    with open(digest_path, "w") as file:
+        # Iterate Over Sorted Digests
+        for rel_path, hex_digest in sorted(digests.items()):
+            # Write Digest Line
+            file.write(f"{hex_digest}  {rel_path}\n")
+
+def read(enc_path):
+    # Initialize Digests
+    digests = {}
+
+    # Form Path To Digest File
+    digest_path = os.path.join(enc_path, NAME)
+
+    # Verify Digest File Exists
+    if (not(os.path.isfile(digest_path))):
+        # Return Empty Digests
+        return (digests)
+
+    # Read Digest File
+    with open(digest_path, "r") as file:
+        # Iterate Over Digest Lines
+        for line in (file):
+            # Split Digest Line
+            hex_digest, rel_path = line.rstrip("\n").split("  ", 1)
+
+            # Add Digest
+            digests[rel_path] = hex_digest
+
+    # Return Digests
+    return (digests)
+
+def remove(enc_path):
+    # Form Path To Digest File
+    digest_path = os.path.join(enc_path, NAME)
+
+    # Check If Digest File Exists
+    if (os.path.exists(digest_path)):
+        # Remove Digest File
+        os.remove(digest_path)
+
+# End Digest Functions----------------------------------------------------------------------------------------------------------------------------------------------------
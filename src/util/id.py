@@ -17,4 +17,8 @@ def generate(s):
     # Return Hex String
     return (h)
 
+def is_id(s):
+    # Return Whether String Is A Hex Identifier
+    return (len(s) == 32 and all(c in "0123456789abcdef" for c in (s)))
+
 # End Identifier Functions------------------------------------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,51 @@
+# Developed By Nalin Ahuja, nalinahuja
+
+import os
+import json
+import socket
+
+# End Imports-------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+def path():
+    # Check If Socket Path Is Set In Environment
+    if ("ANNEXFS_SOCKET" in os.environ):
+        # Return Environment Socket Path
+        return (os.environ["ANNEXFS_SOCKET"])
+
+    # Get Runtime Directory
+    run_dir = os.environ.get("XDG_RUNTIME_DIR", "/tmp")
+
+    # Return Default Socket Path
+    return (os.path.join(run_dir, f"annexfs-{os.getuid()}.sock"))
+
+def send(conn, message):
+    # Write Message As JSON Line
+    conn.sendall((json.dumps(message) + "\n").encode("utf-8"))
+
+def recv(file):
+    # Read JSON Line
+    line = file.readline()
+
+    # Check For Closed Connection
+    if (not(line)):
+        # Return Empty Message
+        return (None)
+
+    # Return Decoded Message
+    return (json.loads(line))
+
+def request(message, sock_path = None):
+    # Open Socket Connection
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        # Connect To Socket
+        conn.connect(sock_path or path())
+
+        # Send Request Message
+        send(conn, message)
+
+        # Open Socket Reader
+        with conn.makefile("r", encoding = "utf-8") as file:
+            # Return Response Message
+            return (recv(file))
+
+# End IPC Functions-------------------------------------------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,169 @@
+# Developed By Nalin Ahuja, nalinahuja
+
+import os
+import json
+import threading
+
+# End Imports-------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+# Journal File Name
+NAME = ".axfs-journal"
+
+# End Constants-----------------------------------------------------------------------------------------------------------------------------------------------------------
+
+class Journal:
+    def __init__(self, enc_path):
+        # Initialize Journal Path
+        self.path = os.path.join(enc_path, NAME)
+
+        # Initialize Source Path
+        self.source = None
+
+        # Initialize Deduplication State And Pack Mode
+        self.dedup, self.pack = False, None
+
+        # Initialize Selective Transfer State
+        self.select = False
+
+        # Initialize Completed Entries
+        self.entries = {}
+
+        # Initialize Completed Entry Digests
+        self.digests = {}
+
+        # Initialize Journal Lock
+        self.lock = threading.Lock()
+
+        # Declare Journal File
+        self.file = None
+
+    def create(self, src_path, dedup = False, pack = None, select = False):
+        # Set Source Path, Deduplication State, Pack Mode, And Selective Transfer State
+        self.source, self.dedup, self.pack, self.select = src_path, dedup, pack, select
+
+        # Write Journal Header
+        with open(self.path, "w") as file:
+            # Write Source Path, Deduplication State, Pack Mode, And Selective Transfer State
+            file.write(json.dumps({"source": src_path, "dedup": dedup, "pack": pack, "select": select}) + "\n")
+
+    def load(self):
+        # Read Journal Records
+        with open(self.path, "r") as file:
+            # Iterate Over Journal Lines
+            for line in (file):
+                try:
+                    # Decode Journal Record
+                    record = json.loads(line)
+                except ValueError:
+                    # Skip Partially Written Record
+                    continue
+
+                # Check For Journal Header
+                if ("source" in record):
+                    # Set Source Path, Deduplication State, Pack Mode, And Selective Transfer State
+                    self.source, self.dedup, self.pack, self.select = record["source"], record.get("dedup", False), record.get("pack"), record.get("select", False)
+                else:
+                    # Add Completed Entry
+                    self.entries[record["path"]] = (record["size"], record["mtime"])
+
+                    # Check For Completed Entry Digest
+                    if ("digest" in record):
+                        # Add Completed Entry Digest
+                        self.digests[record["path"]] = record["digest"]
+
+        # Return Journal
+        return (self)
+
+    def is_complete(self, rel_path, src_stat, dst_path):
+        # Get Completed Entry
+        entry = self.entries.get(rel_path)
+
+        # Verify Entry Matches Source Statistics
+        if (entry != (src_stat.st_size, src_stat.st_mtime_ns)):
+            # Return Incomplete
+            return (False)
+
+        # Verify Destination Exists With Matching Size
+        return (os.path.isfile(dst_path) and (os.stat(dst_path).st_size == src_stat.st_size))
+
+    def record(self, rel_path, src_stat, hex_digest = None):
+        # Form Completed Entry Record
+        record = {"path": rel_path, "size": src_stat.st_size, "mtime": src_stat.st_mtime_ns}
+
+        # Check If Digest Is Specified
+        if (not(hex_digest is None)):
+            # Add Digest To Record
+            record["digest"] = hex_digest
+
+        # Protect Journal Writes
+        with self.lock:
+            # Check If Journal File Is Open
+            if (self.file is None):
+                # Open Journal File For Appending
+                self.file = open(self.path, "a")
+
+            # Update Completed Entries
+            self.entries[rel_path] = (src_stat.st_size, src_stat.st_mtime_ns)
+
+            # Check If Digest Is Specified
+            if (not(hex_digest is None)):
+                # Update Completed Entry Digests
+                self.digests[rel_path] = hex_digest
+
+            # Write Completed Entry
+            self.file.write(json.dumps(record) + "\n")
+
+            # Flush Completed Entry
+            self.file.flush()
+
+    def close(self):
+        # Check If Journal File Is Open
+        if (not(self.file is None)):
+            # Close Journal File
+            self.file.close()
+
+            # Reset Journal File
+            self.file = None
+
+    def remove(self):
+        # Close Journal File
+        self.close()
+
+        # Check If Journal File Exists
+        if (os.path.exists(self.path)):
+            # Remove Journal File
+            os.remove(self.path)
+
+# End Journal Classes-----------------------------------------------------------------------------------------------------------------------------------------------------
+
+def find(root_paths, src_path):
+    # Iterate Over Root Paths
+    for root_path in (root_paths):
+        # Iterate Over Root Entries
+        with os.scandir(root_path) as rt:
+            # Iterate Over Enclosing Directories
+            for entry in (rt):
+                # Form Path To Journal File
+                journal_path = os.path.join(entry.path, NAME)
+
+                # Verify Journal File Exists
+                if (not(entry.is_dir(follow_symlinks = False) and os.path.isfile(journal_path))):
+                    # Skip Entry
+                    continue
+
+                try:
+                    # Load Journal
+                    jrnl = Journal(entry.path).load()
+                except (OSError, ValueError):
+                    # Skip Unreadable Journal
+                    continue
+
+                # Verify Journal Source Matches
+                if (jrnl.source == src_path):
+                    # Return Journal
+                    return (jrnl)
+
+    # Return Not Found
+    return (None)
+
+# End Journal Functions---------------------------------------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,201 @@
+# Developed By Nalin Ahuja, nalinahuja
+
+import os
+import json
+import time
+import fcntl
+import socket
+import threading
+
+# End Imports-------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+# Lease Registry Directory Name
+NAME = ".annexfs-leases"
+
+# Lease Slot Poll Interval
+POLL = 0.5
+
+# Leases Held By Process
+held = {}
+
+# Held Leases Lock
+lock = threading.Lock()
+
+# End Constants-----------------------------------------------------------------------------------------------------------------------------------------------------------
+
+class Lease:
+    def __init__(self, root_path, device, slots, op, path, on_wait = None):
+        # Initialize Registry Path, Device, And Slot Count
+        self.path, self.device, self.slots = os.path.join(root_path, NAME), device, max(1, slots)
+
+        # Initialize Lease Record
+        self.record = {"device": device, "pid": os.getpid(), "host": socket.gethostname(), "op": op, "path": path}
+
+        # Initialize Wait Callback
+        self.on_wait = on_wait or (lambda waiting: None)
+
+        # Initialize Held Lease Key
+        self.key = (self.path, device)
+
+    def share(self):
+        # Protect Held Leases Access
+        with lock:
+            # Verify Process Holds Lease On Device
+            if (not(self.key in held)):
+                # Return Failure
+                return (False)
+
+            # Increment Lease Holders
+            held[self.key][1] += 1
+
+        # Return Success
+        return (True)
+
+    def take(self):
+        # Iterate Over Device Slots
+        for slot in range(self.slots):
+            # Open Slot File
+            file = open(os.path.join(self.path, slot_name(self.device, slot)), "a+")
+
+            try:
+                # Acquire Exclusive Lock Without Waiting
+                fcntl.flock(file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                # Close Slot File
+                file.close()
+
+                # Continue Loop
+                continue
+
+            # Clear Stale Lease Record
+            file.truncate(0)
+
+            # Write Lease Record
+            json.dump({**self.record, "slot": slot, "started": time.time()}, file)
+
+            # Flush Lease Record
+            file.flush()
+
+            # Return Slot File
+            return (file)
+
+        # Return No Free Slot
+        return (None)
+
+    def __enter__(self):
+        # Create Lease Registry
+        os.makedirs(self.path, exist_ok = True)
+
+        # Initialize Wait Status
+        waiting = False
+
+        # Iterate Until Lease Is Held
+        while (not(self.share())):
+            # Take Free Device Slot
+            file = self.take()
+
+            # Check If Slot Was Taken
+            if (not(file is None)):
+                # Protect Held Leases Update
+                with lock:
+                    # Check If Another Thread Took Lease Meanwhile
+                    if (self.key in held):
+                        # Increment Lease Holders
+                        held[self.key][1] += 1
+                    else:
+                        # Record Held Lease
+                        held[self.key], file = [file, 1], None
+
+                # Check If Slot Is Unused
+                if (not(file is None)):
+                    # Release Unused Slot
+                    release(file)
+
+                # Break Loop
+                break
+
+            # Check If Wait Was Not Reported
+            if (not(waiting)):
+                # Report Wait For Slot
+                self.on_wait(True)
+
+                # Set Wait Status
+                waiting = True
+
+            # Wait Before Polling Slots
+            time.sleep(POLL)
+
+        # Check If Wait Was Reported
+        if (waiting):
+            # Report Slot Acquired
+            self.on_wait(False)
+
+        # Return Lease
+        return (self)
+
+    def __exit__(self, *args):
+        # Declare Released Slot File
+        file = None
+
+        # Protect Held Leases Update
+        with lock:
+            # Decrement Lease Holders
+            held[self.key][1] -= 1
+
+            # Check If Lease Has No Holders
+            if (held[self.key][1] == 0):
+                # Remove Held Lease
+                file = held.pop(self.key)[0]
+
+        # Check If Slot Should Be Released
+        if (not(file is None)):
+            # Release Slot
+            release(file)
+
+# End Lease Classes-------------------------------------------------------------------------------------------------------------------------------------------------------
+
+def slot_name(device, slot):
+    # Return Slot File Name Of Device
+    return (f"{device}-{slot}.lock")
+
+def release(file):
+    # Release Slot Lock
+    fcntl.flock(file, fcntl.LOCK_UN)
+
+    # Close Slot File
+    file.close()
+
+def holders(root_path):
+    # Form Path To Lease Registry
+    path = os.path.join(root_path, NAME)
+
+    # Verify Lease Registry Exists
+    if (not(os.path.isdir(path))):
+        # Return No Holders
+        return ([])
+
+    # Initialize Lease Records
+    records = []
+
+    # Iterate Over Slot Files
+    for name in sorted(os.listdir(path)):
+        # Open Slot File
+        with open(os.path.join(path, name), "r") as file:
+            try:
+                # Acquire Shared Lock Without Waiting
+                fcntl.flock(file, fcntl.LOCK_SH | fcntl.LOCK_NB)
+            except BlockingIOError:
+                try:
+                    # Read Lease Record Of Holder
+                    record = json.loads(file.read())
+                except ValueError:
+                    # Set Record Being Written
+                    record = {}
+
+                # Append Lease Record
+                records.append(record)
+
+    # Return Lease Records
+    return (records)
+
+# End Lease Functions-----------------------------------------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,349 @@
+# Developed By Nalin Ahuja, nalinahuja
+
+import os
+import sys
+import stat
+import array
+import errno
+import collections
+
+from util import pool
+
+# End Imports-------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+# Entry Is A Followed Symbolic Link
+LINK = 1
+
+# Entry Resides Beneath A Followed Directory Link
+INNER = 2
+
+# Entry Is A File With Several Hard Links
+HARDLINK = 4
+
+# Directory Path Cache Limit
+CACHE_LIMIT = 4096
+
+# Lightweight File Statistics
+Stat = collections.namedtuple("Stat", ("st_size", "st_mtime_ns", "st_mode", "st_ino", "st_blocks"))
+
+# End Constants-----------------------------------------------------------------------------------------------------------------------------------------------------------
+
+class Manifest:
+    def __init__(self, root):
+        # Initialize Tree Root
+        self.root = root
+
+        # Initialize Packed Entry Names And Name Offsets
+        self.names, self.offsets = bytearray(), array.array("Q")
+
+        # Initialize Entry Parents
+        self.parents = array.array("i")
+
+        # Initialize Entry Sizes, Modification Times, Modes, And Inodes
+        self.sizes, self.mtimes, self.modes, self.inodes = array.array("q"), array.array("q"), array.array("I"), array.array("Q")
+
+        # Initialize Entry Allocated Block Counts
+        self.blocks = array.array("q")
+
+        # Initialize Entry Flags
+        self.flags = array.array("B")
+
+        # Initialize Tree Size And File Count
+        self.size = self.files = 0
+
+        # Initialize Directory Path Cache
+        self.cache = {}
+
+    def __len__(self):
+        # Return Entry Count
+        return (len(self.parents))
+
+    def append(self, parent, name, entry_stat, flags):
+        # Append Entry Name Offset And Name
+        self.offsets.append(len(self.names))
+        self.names += name
+
+        # Append Entry Parent And Flags
+        self.parents.append(parent)
+        self.flags.append(flags)
+
+        # Append Entry Statistics
+        self.sizes.append(entry_stat.st_size)
+        self.mtimes.append(entry_stat.st_mtime_ns)
+        self.modes.append(entry_stat.st_mode)
+        self.inodes.append(entry_stat.st_ino)
+        self.blocks.append(entry_stat.st_blocks)
+
+        # Check If Entry Is A File
+        if (not(stat.S_ISDIR(entry_stat.st_mode))):
+            # Update Tree Size And File Count
+            self.size, self.files = self.size + entry_stat.st_size, self.files + 1
+
+        # Return Entry Index
+        return (len(self.parents) - 1)
+
+    def name(self, index):
+        # Get Name Bounds
+        start, end = self.offsets[index], self.offsets[index + 1] if (index + 1 < len(self.offsets)) else len(self.names)
+
+        # Return Decoded Entry Name
+        return (os.fsdecode(bytes(self.names[start:end])))
+
+    def is_dir(self, index):
+        # Return Directory Status
+        return (stat.S_ISDIR(self.modes[index]))
+
+    def rel(self, index):
+        # Check If Entry Is The Tree Root
+        if (index == 0):
+            # Return Root Relative Path
+            return (os.curdir)
+
+        # Get Parent Index
+        parent = self.parents[index]
+
+        # Get Parent Relative Path
+        parent_rel = None if (parent == 0) else self.cache.get(parent)
+
+        # Check If Parent Path Is Not Cached
+        if (parent_rel is None and parent != 0):
+            # Initialize Uncached Ancestor Chain
+            chain = []
+
+            # Walk Up To A Cached Ancestor Or The Tree Root
+            while (parent != 0 and not(parent in self.cache)):
+                # Append Uncached Ancestor
+                chain.append(parent)
+
+                # Move To Next Ancestor
+                parent = self.parents[parent]
+
+            # Get Path Of Cached Ancestor
+            parent_rel = None if (parent == 0) else self.cache[parent]
+
+            # Iterate Over Uncached Ancestors From The Top
+            for ancestor in reversed(chain):
+                # Form Ancestor Relative Path
+                parent_rel = self.name(ancestor) if (parent_rel is None) else os.path.join(parent_rel, self.name(ancestor))
+
+                # Check If Cache Is Full
+                if (len(self.cache) >= CACHE_LIMIT):
+                    # Clear Cache
+                    self.cache.clear()
+
+                # Cache Ancestor Relative Path
+                self.cache[ancestor] = parent_rel
+
+        # Return Entry Relative Path
+        return (self.name(index) if (parent_rel is None) else os.path.join(parent_rel, self.name(index)))
+
+    def path(self, index):
+        # Return Absolute Entry Path
+        return (self.root if (index == 0) else os.path.join(self.root, self.rel(index)))
+
+    def stat(self, index):
+        # Return Lightweight Entry Statistics
+        return (Stat(self.sizes[index], self.mtimes[index], self.modes[index], self.inodes[index], self.blocks[index]))
+
+    def dirs(self):
+        # Return Directory Indices In Walk Order
+        return (i for i in range(len(self)) if (self.is_dir(i)))
+
+    def regular(self):
+        # Return File Indices And Relative Paths In Walk Order
+        return ((i, self.rel(i)) for i in range(len(self)) if not(self.is_dir(i)))
+
+    def children(self):
+        # Initialize Child Index Ranges Of Directories
+        ranges = {}
+
+        # Iterate Over Entries Below Tree Root
+        for i in range(1, len(self)):
+            # Get Entry Parent
+            parent = self.parents[i]
+
+            # Extend Child Range Of Parent To Entry
+            ranges[parent] = (ranges[parent][0] if (parent in ranges) else i, i + 1)
+
+        # Return Child Index Ranges
+        return (ranges)
+
+    def subset(self, indices):
+        # Initialize Subset With Tree Root
+        tree = Manifest(self.root)
+
+        # Initialize Kept Entries
+        keep = {0}
+
+        # Iterate Over Selected Entry Indices
+        for i in (indices):
+            # Walk Up Until A Kept Ancestor Is Reached
+            while (not(i in keep)):
+                # Keep Entry
+                keep.add(i)
+
+                # Move To Parent Entry
+                i = self.parents[i]
+
+        # Initialize Subset Indices Of Kept Entries
+        index = {-1: -1}
+
+        # Iterate Over Kept Entries In Walk Order
+        for i in sorted(keep):
+            # Append Entry Beneath Its Subset Parent
+            index[i] = tree.append(index[self.parents[i]], os.fsencode(self.name(i)), self.stat(i), self.flags[i])
+
+        # Return Subset Manifest
+        return (tree)
+
+    def nbytes(self):
+        # Return Memory Held By Entry Storage
+        return (len(self.names) + sum(a.itemsize * len(a) for a in (self.offsets, self.parents, self.sizes, self.mtimes, self.modes, self.inodes, self.blocks, self.flags)))
+
+    def verify(self, dst_dir):
+        # Iterate Over File Indices
+        for (i, rel_path) in (self.regular()):
+            try:
+                # Verify Destination File Size Matches Manifest
+                if (os.stat(os.path.join(dst_dir, rel_path)).st_size != self.sizes[i]):
+                    # Return Failure
+                    return (False)
+            except FileNotFoundError:
+                # Return Failure
+                return (False)
+
+        # Return Success
+        return (True)
+
+    def unchanged(self):
+        # Iterate Over Directory Indices
+        for i in (self.dirs()):
+            try:
+                # Verify Directory Entries Were Not Added Or Removed Since Walk
+                if (os.stat(self.path(i)).st_mtime_ns != self.mtimes[i]):
+                    # Return Failure
+                    return (False)
+            except FileNotFoundError:
+                # Return Failure
+                return (False)
+
+        # Return Success
+        return (True)
+
+    def is_tree_dir(self, index):
+        # Return Whether Entry Is A Directory Removed After Its Contents
+        return (self.is_dir(index) and not(self.flags[index] & LINK))
+
+    def discard(self, index, path, onerror, progress = None):
+        # Determine Removal Function
+        func = os.rmdir if (self.is_tree_dir(index)) else os.remove
+
+        try:
+            # Remove Entry
+            func(path)
+        except FileNotFoundError:
+            # Return Nothing Removed
+            return (0)
+        except OSError as e:
+            # Check If Directory Gained Entries Since Walk
+            if (e.errno == errno.ENOTEMPTY):
+                # Raise Error
+                raise
+
+            # Handle Removal Error
+            onerror(func, path, sys.exc_info())
+
+        # Check If Progress Callback Is Specified
+        if (not(progress is None) and not(self.is_tree_dir(index))):
+            # Report Removed File
+            progress(self.sizes[index], 1)
+
+        # Return Entry Removed
+        return (1)
+
+    def remove(self, onerror, jobs = 1, progress = None):
+        # Get Removable Entry Indices Outside Followed Directory Links
+        indices = [i for i in range(len(self)) if not(self.flags[i] & INNER)]
+
+        # Remove Files And Links Across Worker Pool
+        removed = sum(pool.execute(self.discard, ((i, self.path(i), onerror, progress) for i in (indices) if not(self.is_tree_dir(i))), jobs))
+
+        # Iterate Over Directories Deepest First
+        for i in reversed([i for i in (indices) if (self.is_tree_dir(i))]):
+            # Remove Directory
+            removed += self.discard(i, self.path(i), onerror)
+
+        # Return Removed Entry Count
+        return (removed)
+
+# End Manifest Classes----------------------------------------------------------------------------------------------------------------------------------------------------
+
+def entry_type(entry):
+    # Get Entry Mode From Directory Entry Type Without Statistics
+    mode = stat.S_IFLNK if (entry.is_symlink()) else stat.S_IFDIR if (entry.is_dir(follow_symlinks = False)) else stat.S_IFREG
+
+    # Return Lightweight Entry Statistics Holding Type And Inode
+    return (Stat(0, 0, mode, entry.inode(), 0))
+
+def build(root, follow = True, types = False):
+    # Initialize Manifest With Tree Root
+    tree = Manifest(root)
+
+    # Append Tree Root Entry
+    tree.append(-1, b"", os.stat(root, follow_symlinks = follow), 0)
+
+    # Initialize Directory Stack
+    stack = [0]
+
+    # Initialize Followed Directory Links
+    followed = set()
+
+    # Iterate Until Directory Stack Is Exhausted
+    while (stack):
+        # Pop Next Directory Index
+        parent = stack.pop()
+
+        # Get Flags Inherited By Directory Entries
+        inherited = INNER if (tree.flags[parent] & (LINK | INNER)) else 0
+
+        # Initialize Subdirectory Indices
+        subdirs = []
+
+        # Scan Directory Entries In Name Order
+        with os.scandir(tree.path(parent)) as ft:
+            # Sort Directory Entries
+            entries = sorted(ft, key = lambda entry: entry.name)
+
+        # Iterate Over Directory Entries
+        for entry in (entries):
+            # Get Entry Type Or Statistics Following Symbolic Links If Requested
+            entry_stat = entry_type(entry) if (types) else entry.stat(follow_symlinks = follow)
+
+            # Get Entry Flags
+            flags = inherited | (LINK if (entry.is_symlink()) else 0) | (HARDLINK if (not(types) and entry_stat.st_nlink > 1 and not(stat.S_ISDIR(entry_stat.st_mode))) else 0)
+
+            # Append Entry To Manifest
+            index = tree.append(parent, os.fsencode(entry.name), entry_stat, flags)
+
+            # Check If Entry Is A Directory
+            if (stat.S_ISDIR(entry_stat.st_mode)):
+                # Check If Entry Is A Directory Link
+                if (flags & LINK):
+                    # Verify Directory Link Was Not Already Followed
+                    if ((entry_stat.st_dev, entry_stat.st_ino) in followed):
+                        # Continue Loop
+                        continue
+
+                    # Record Followed Directory Link
+                    followed.add((entry_stat.st_dev, entry_stat.st_ino))
+
+                # Append Subdirectory Index
+                subdirs.append(index)
+
+        # Push Subdirectories In Reverse For Name Ordered Walk
+        stack.extend(reversed(subdirs))
+
+    # Return Manifest
+    return (tree)
+
+# End Manifest Functions--------------------------------------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,248 @@
+# Developed By Nalin Ahuja, nalinahuja
+
+import os
+import json
+import shutil
+import tarfile
+
+# End Imports-------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+# Pack Index File Name
+INDEX = ".axfs-pack-index"
+
+# Pack Compression Modes
+MODES = ("none", "gz", "bz2", "xz")
+
+# Pack Stream Chunk Size
+__CHUNK = 1024 * 1024
+
+# End Constants-----------------------------------------------------------------------------------------------------------------------------------------------------------
+
+class Reader:
+    def __init__(self, file, progress, hash = None):
+        # Initialize Wrapped File, Progress Callback, And Streaming Digest
+        self.file, self.progress, self.hash = file, progress, hash
+
+    def read(self, size = -1):
+        # Read Chunk From Wrapped File
+        chunk = self.file.read(size)
+
+        # Check If Streaming Digest Is Specified
+        if (not(self.hash is None)):
+            # Update Streaming Digest
+            self.hash.update(chunk)
+
+        # Report Read Bytes
+        self.progress(len(chunk))
+
+        # Return Chunk
+        return (chunk)
+
+class Writer:
+    def __init__(self, enc_path, dst_dir, pack_size, mode):
+        # Initialize Enclosing And Destination Directories
+        self.enc_path, self.dst_dir = enc_path, dst_dir
+
+        # Initialize Pack Size Limit
+        self.pack_size = pack_size
+
+        # Initialize Pack File Mode And Suffix
+        self.mode, self.suffix = ("w", ".tar") if (mode == "none") else (f"w:{mode}", f".tar.{mode}")
+
+        # Initialize Pack Index
+        self.index = []
+
+        # Declare Current Pack
+        self.tar = self.name = None
+
+        # Initialize Pack Count And Current Pack Size
+        self.count = self.written = 0
+
+    def __enter__(self):
+        # Return Pack Writer
+        return (self)
+
+    def __exit__(self, exc_type, *args):
+        # Close Current Pack
+        self.close_pack()
+
+        # Check If Packing Succeeded
+        if (exc_type is None):
+            # Write Pack Index
+            with open(os.path.join(self.enc_path, INDEX), "w") as file:
+                # Iterate Over Index Records
+                for record in (self.index):
+                    # Write Index Record
+                    file.write(json.dumps(record) + "\n")
+
+    def close_pack(self):
+        # Check If Current Pack Is Open
+        if (not(self.tar is None)):
+            # Close Current Pack
+            self.tar.close()
+
+            # Reset Current Pack
+            self.tar = None
+
+    def open_pack(self):
+        # Close Current Pack
+        self.close_pack()
+
+        # Form Name Of Next Pack
+        self.name = f"pack-{self.count:04d}{self.suffix}"
+
+        # Open Next Pack Following Symbolic Links
+        self.tar = tarfile.open(os.path.join(self.dst_dir, self.name), self.mode, dereference = True)
+
+        # Update Pack Count And Reset Current Pack Size
+        self.count, self.written = self.count + 1, 0
+
+    def add(self, src_path, rel_path, progress, hash = None):
+        # Check If Current Pack Is Missing Or Full
+        if (self.tar is None or self.written >= self.pack_size):
+            # Open Next Pack
+            self.open_pack()
+
+        # Get Member Information
+        info = self.tar.gettarinfo(src_path, arcname = rel_path)
+
+        # Get Member Offset
+        offset = self.tar.offset
+
+        # Check If Member Is A Regular File
+        if (info.isreg()):
+            # Open Source File
+            with open(src_path, "rb") as file:
+                # Add Member With Data
+                self.tar.addfile(info, Reader(file, progress, hash))
+
+            # Update Current Pack Size
+            self.written += info.size
+
+            # Append Index Record
+            self.index.append({"path": rel_path, "pack": self.name, "offset": offset, "size": info.size, "digest": None if (hash is None) else hash.hexdigest()})
+        else:
+            # Add Member Without Data
+            self.tar.addfile(info)
+
+        # Return Member Size
+        return (info.size if (info.isreg()) else 0)
+
+# End Pack Classes--------------------------------------------------------------------------------------------------------------------------------------------------------
+
+def is_packed(enc_path):
+    # Return Pack Index Existence
+    return (os.path.isfile(os.path.join(enc_path, INDEX)))
+
+def read_index(enc_path):
+    # Read Pack Index
+    with open(os.path.join(enc_path, INDEX), "r") as file:
+        # Return Index Records
+        return ([json.loads(line) for line in (file)])
+
+def packs(dst_dir):
+    # Return Pack Paths In Write Order
+    return ([os.path.join(dst_dir, name) for name in sorted(os.listdir(dst_dir)) if (name.startswith("pack-"))])
+
+def extract_all(dst_dir, out_dir, progress):
+    # Initialize Directory Members
+    dirs = []
+
+    # Iterate Over Packs In Write Order
+    for pack_path in (packs(dst_dir)):
+        # Open Pack As Sequential Stream
+        with tarfile.open(pack_path, "r|*") as tar:
+            # Iterate Over Pack Members
+            for info in (tar):
+                # Check If Member Is A Directory
+                if (info.isdir()):
+                    # Append Directory Member
+                    dirs.append(info)
+
+                # Extract Member Deferring Directory Attributes
+                tar.extract(info, out_dir, set_attrs = not(info.isdir()), filter = tarfile.fully_trusted_filter)
+
+                # Report Extracted Member
+                progress(info.size if (info.isreg()) else 0, 1 if (info.isreg()) else 0)
+
+    # Iterate Over Directory Members Deepest First
+    for info in sorted(dirs, key = lambda info: info.name, reverse = True):
+        # Form Path To Extracted Directory
+        dir_path = os.path.join(out_dir, info.name)
+
+        # Set Directory Mode
+        os.chmod(dir_path, info.mode)
+
+        # Set Directory Timestamps
+        os.utime(dir_path, (info.mtime, info.mtime))
+
+def extract_member(enc_path, dst_dir, rel_path, out_path):
+    # Find Index Record Of Member
+    record = next((record for record in read_index(enc_path) if (record["path"] == rel_path)), None)
+
+    # Verify Member Exists
+    if (record is None):
+        # Raise Error
+        raise FileNotFoundError(rel_path)
+
+    # Open Pack Holding Member
+    with tarfile.open(os.path.join(dst_dir, record["pack"]), "r") as tar:
+        # Seek To Member Header
+        tar.fileobj.seek(record["offset"])
+
+        # Read Member Information
+        info = tarfile.TarInfo.fromtarfile(tar)
+
+        # Open Member Data And Output File
+        with tar.extractfile(info) as src, open(out_path, "wb") as dst:
+            # Copy Member Data
+            shutil.copyfileobj(src, dst, __CHUNK)
+
+    # Set Output File Mode
+    os.chmod(out_path, info.mode)
+
+    # Set Output File Timestamps
+    os.utime(out_path, (info.mtime, info.mtime))
+
+def verify(enc_path, dst_dir, new_hash, progress = None):
+    # Get Expected Member Digests
+    expected = {record["path"]: record["digest"] for record in read_index(enc_path)}
+
+    # Iterate Over Packs In Write Order
+    for pack_path in (packs(dst_dir)):
+        # Open Pack As Sequential Stream
+        with tarfile.open(pack_path, "r|*") as tar:
+            # Iterate Over Regular Pack Members
+            for info in (info for info in tar if (info.isreg())):
+                # Initialize Streaming Digest
+                hash = new_hash()
+
+                # Open Member Data
+                with tar.extractfile(info) as src:
+                    # Read Until End Of Member
+                    for chunk in iter(lambda: src.read(__CHUNK), b""):
+                        # Update Streaming Digest
+                        hash.update(chunk)
+
+                        # Check If Progress Callback Is Specified
+                        if (not(progress is None)):
+                            # Report Read Bytes
+                            progress(len(chunk))
+
+                # Verify Member Is Indexed
+                if (not(info.name in expected)):
+                    # Return Failure
+                    return (False)
+
+                # Get Indexed Member Digest
+                member_digest = expected.pop(info.name)
+
+                # Verify Member Digest Matches Index If Recorded
+                if (not(member_digest is None) and (member_digest != hash.hexdigest())):
+                    # Return Failure
+                    return (False)
+
+    # Return Success If Every Member Was Verified
+    return (not(expected))
+
+# End Pack Functions------------------------------------------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,146 @@
+# Developed By Nalin Ahuja, nalinahuja
+
+import os
+import heapq
+
+from util import manifest
+
+# End Imports-------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+# Largest Files Reported By Plans
+LARGEST = 5
+
+# Minimum Copy Duration Recorded As Throughput
+SAMPLE_SECONDS = 0.5
+
+# Pack Member Block Size
+PACK_BLOCK = 512
+
+# Entry Metadata Inodes Written Beside Payload
+META_INODES = 2
+
+# End Constants-----------------------------------------------------------------------------------------------------------------------------------------------------------
+
+class Plan:
+    def __init__(self, src_path, enc_path, method):
+        # Initialize Source Path, Enclosing Path, And Transfer Method
+        self.src_path, self.enc_path, self.method = src_path, enc_path, method
+
+        # Initialize Journal, Shadow Entry, And Pack Mode
+        self.jrnl = self.shadow_path = self.pack_mode = None
+
+        # Initialize Deduplication State
+        self.dedup = False
+
+        # Declare Source Manifest
+        self.tree = None
+
+        # Initialize Source Size, File Count, And Directory Count
+        self.size = self.files = self.dirs = 0
+
+        # Initialize Largest Source Files
+        self.largest = []
+
+        # Initialize Required Space And Inodes
+        self.need_bytes = self.need_inodes = 0
+
+        # Initialize Available Space And Inodes
+        self.free_bytes, self.free_inodes = 0, None
+
+        # Initialize Requirement Exactness
+        self.exact = True
+
+        # Declare Measured Rate And Estimated Duration
+        self.rate = self.seconds = None
+
+    def root(self):
+        # Return AnnexFS Root Of Enclosing Directory
+        return (os.path.dirname(self.enc_path))
+
+    def fits(self):
+        # Return Whether Required Space And Inodes Are Available
+        return ((self.need_bytes <= self.free_bytes) and (self.free_inodes is None or self.need_inodes <= self.free_inodes))
+
+# End Plan Classes--------------------------------------------------------------------------------------------------------------------------------------------------------
+
+def device_key(path):
+    # Get Path Device
+    path_dev = os.stat(path).st_dev
+
+    # Return Stable Device Number
+    return (f"{os.major(path_dev)}:{os.minor(path_dev)}")
+
+def capacity(path):
+    # Get File System Statistics
+    fs_stat = os.statvfs(path)
+
+    # Return Block Size, Available Space, And Available Inodes If Reported
+    return (fs_stat.f_frsize or fs_stat.f_bsize, fs_stat.f_bavail * fs_stat.f_frsize, fs_stat.f_favail if (fs_stat.f_files) else None)
+
+def has_room(path, need_bytes, need_inodes):
+    # Get Available Space And Inodes
+    _, free_bytes, free_inodes = capacity(path)
+
+    # Return Whether Required Space And Inodes Are Available
+    return ((need_bytes <= free_bytes) and (free_inodes is None or need_inodes <= free_inodes))
+
+def blocks(size, block):
+    # Return Size Rounded Up To Whole Blocks
+    return (-(-size // block) * block)
+
+def allocated(size, st_blocks, block):
+    # Return Allocated Or Logical Blocks Of File, Whichever Is Smaller
+    return (min(blocks(size, block), blocks(st_blocks * 512, block)))
+
+def footprint(tree, block):
+    # Initialize Required Space And Inodes
+    need_bytes = need_inodes = 0
+
+    # Initialize Seen Hardlinked Inodes
+    linked = set()
+
+    # Iterate Over Manifest Entries
+    for i in range(len(tree)):
+        # Check If Entry Is A Hardlink Of A Counted Inode
+        if (tree.flags[i] & manifest.HARDLINK):
+            # Verify Inode Was Not Counted
+            if (tree.inodes[i] in linked):
+                # Continue Loop
+                continue
+
+            # Record Counted Inode
+            linked.add(tree.inodes[i])
+
+        # Update Required Space By Directory Block Or File Allocation
+        need_bytes += block if (tree.is_dir(i)) else allocated(tree.sizes[i], tree.blocks[i], block)
+
+        # Update Required Inodes
+        need_inodes += 1
+
+    # Return Required Space And Inodes
+    return (need_bytes, need_inodes)
+
+def packed(tree, block, pack_size):
+    # Get Archive Size Of Manifest Members With Headers
+    archive = sum(PACK_BLOCK + (blocks(tree.sizes[i], PACK_BLOCK) if not(tree.is_dir(i)) else 0) for i in range(len(tree)))
+
+    # Return Space And Inodes Of Pack Files
+    return (blocks(archive, block), max(1, -(-tree.size // pack_size)))
+
+def largest(tree, count = LARGEST):
+    # Get Largest File Indices
+    indices = heapq.nlargest(count, (i for i in range(len(tree)) if not(tree.is_dir(i))), key = tree.sizes.__getitem__)
+
+    # Return Relative Paths And Sizes Of Largest Files
+    return ([(tree.rel(i), tree.sizes[i]) for i in (indices)])
+
+def estimate(need_bytes, need_inodes, rates):
+    # Verify Throughput History Exists
+    if (rates is None):
+        # Return Unknown Rate And Duration
+        return (None, None)
+
+    # Return Byte Rate And Duration Bound By Slower Of Byte And File Rates
+    return (rates["bytes_per_second"], max(need_bytes / rates["bytes_per_second"], need_inodes / rates["files_per_second"]))
+
+# End Plan Functions------------------------------------------------------------------------------------------------------------------------------------------------------
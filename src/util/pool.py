@@ -0,0 +1,58 @@
+# Developed By Nalin Ahuja, nalinahuja
+
+import itertools
+
+from util import profile
+
+from concurrent import futures
+
+# End Imports-------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+# Pending Tasks Per Worker
+__TASKS_PER_WORKER = 4
+
+# End Constants-----------------------------------------------------------------------------------------------------------------------------------------------------------
+
+def execute(func, items, jobs):
+    # Initialize Item Iterator
+    items = iter(items)
+
+    # Profile Function In Workers Under Submitting Span
+    func = profile.wrap(func)
+
+    # Initialize Worker Pool
+    pool = futures.ThreadPoolExecutor(max_workers = jobs)
+
+    # Initialize Pending Task Set
+    pending = set()
+
+    try:
+        # Iterate Until Items And Tasks Are Exhausted
+        while (True):
+            # Submit Tasks Until Pending Limit Is Reached
+            for item in itertools.islice(items, (jobs * __TASKS_PER_WORKER) - len(pending)):
+                # Submit Task To Worker Pool
+                pending.add(pool.submit(func, *item))
+
+            # Verify Tasks Are Pending
+            if (not(pending)):
+                # Break Loop
+                break
+
+            # Wait For Task Completion
+            done, pending = futures.wait(pending, return_when = futures.FIRST_COMPLETED)
+
+            # Iterate Over Completed Tasks
+            for task in (done):
+                # Yield Task Result
+                yield (task.result())
+    finally:
+        # Cancel Pending Tasks
+        for task in (pending):
+            # Cancel Task
+            task.cancel()
+
+        # Shutdown Worker Pool
+        pool.shutdown(wait = True)
+
+# End Pool Functions------------------------------------------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,365 @@
+# Developed By Nalin Ahuja, nalinahuja
+
+import os
+import sys
+import json
+import time
+import pstats
+import cProfile
+import resource
+import threading
+import functools
+import tracemalloc
+
+# End Imports-------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+# Profile Hooks
+HOOKS = ("cpu", "memory")
+
+# Active Profiler
+active = None
+
+# End Constants-----------------------------------------------------------------------------------------------------------------------------------------------------------
+
+class Span:
+    def __init__(self, name, kind, index):
+        # Initialize Span Name, Kind, And Index
+        self.name, self.kind, self.index = name, kind, index
+
+        # Initialize Child Spans
+        self.children = []
+
+        # Initialize Thread Profiles
+        self.profiles = {}
+
+        # Initialize Peak Allocation
+        self.peak = 0
+
+        # Declare Span Results
+        self.seconds = self.user = self.system = self.syscalls = self.pstats = None
+
+        # Get Starting Counters
+        self.start, self.usage, self.io = time.perf_counter(), resource.getrusage(resource.RUSAGE_SELF), read_io_syscalls()
+
+    def finish(self):
+        # Get Ending Counters
+        end, usage, io = time.perf_counter(), resource.getrusage(resource.RUSAGE_SELF), read_io_syscalls()
+
+        # Set Span Duration And Processor Times
+        self.seconds, self.user, self.system = end - self.start, usage.ru_utime - self.usage.ru_utime, usage.ru_stime - self.usage.ru_stime
+
+        # Set Span IO Syscall Count If Known
+        self.syscalls = None if (io is None or self.io is None) else io - self.io
+
+    def to_dict(self, memory):
+        # Return Span Fields
+        return ({
+            "name": self.name,
+            "kind": self.kind,
+            "seconds": self.seconds,
+            "user_seconds": self.user,
+            "system_seconds": self.system,
+            "io_syscalls": self.syscalls,
+            "peak_bytes": self.peak if (memory) else None,
+            "pstats": self.pstats,
+            "children": [child.to_dict(memory) for child in (self.children)],
+        })
+
+class Profiler:
+    def __init__(self, path, hooks = ()):
+        # Initialize Report Path And Hooks
+        self.path, self.hooks = path, tuple(hooks)
+
+        # Initialize Span Index
+        self.count = 0
+
+        # Initialize Profiler Lock
+        self.lock = threading.Lock()
+
+        # Initialize Thread Span Stacks
+        self.local = threading.local()
+
+        # Check If Memory Should Be Traced
+        if ("memory" in self.hooks):
+            # Start Tracing Allocations
+            tracemalloc.start()
+
+        # Initialize Run Span
+        self.root = Span("annexfs", "run", self.next_index())
+
+    def next_index(self):
+        # Protect Span Index Update
+        with self.lock:
+            # Update Span Index
+            self.count += 1
+
+            # Return Span Index
+            return (self.count - 1)
+
+    def stack(self):
+        # Check If Thread Has No Span Stack
+        if (not(hasattr(self.local, "stack"))):
+            # Initialize Thread Span Stack
+            self.local.stack = [self.root]
+
+        # Return Thread Span Stack
+        return (self.local.stack)
+
+    def top(self):
+        # Return Innermost Span Of Thread
+        return (self.stack()[-1])
+
+    def thread_profile(self, span):
+        # Protect Thread Profiles Access
+        with self.lock:
+            # Return Profile Of Thread Within Span
+            return (span.profiles.setdefault(threading.get_ident(), cProfile.Profile()))
+
+    def suspend(self, span):
+        # Get Profile Of Thread Within Span
+        prof = span.profiles.get(threading.get_ident())
+
+        # Check If Profile Exists
+        if (not(prof is None)):
+            # Disable Profile
+            prof.disable()
+
+    def resume(self, span):
+        # Check If Processor Should Be Profiled Outside Run Span
+        if ("cpu" in self.hooks and span is not self.root):
+            try:
+                # Enable Profile Of Thread Within Span
+                self.thread_profile(span).enable()
+            except ValueError:
+                # Skip Thread Already Profiled Elsewhere
+                pass
+
+    def open(self, name, kind):
+        # Get Thread Span Stack
+        stack = self.stack()
+
+        # Get Parent Span
+        parent = stack[-1]
+
+        # Check If Memory Is Traced
+        if (tracemalloc.is_tracing()):
+            # Record Parent Peak Before Reset
+            parent.peak = max(parent.peak, tracemalloc.get_traced_memory()[1])
+
+            # Reset Peak Allocation
+            tracemalloc.reset_peak()
+
+        # Suspend Parent Profile
+        self.suspend(parent)
+
+        # Initialize Child Span
+        span = Span(name, kind, self.next_index())
+
+        # Protect Child Spans Update
+        with self.lock:
+            # Append Child Span
+            parent.children.append(span)
+
+        # Push Child Span
+        stack.append(span)
+
+        # Resume Child Profile
+        self.resume(span)
+
+    def close(self, kind):
+        # Get Thread Span Stack
+        stack = self.stack()
+
+        # Verify Span Of Kind Is Open
+        if (not(any(span.kind == kind for span in (stack[1:])))):
+            # Return
+            return
+
+        # Iterate Until Span Of Kind Is Closed
+        while (True):
+            # Pop Innermost Span
+            span = stack.pop()
+
+            # Suspend Span Profile
+            self.suspend(span)
+
+            # Finish Span
+            span.finish()
+
+            # Check If Memory Is Traced
+            if (tracemalloc.is_tracing()):
+                # Record Span Peak
+                span.peak = max(span.peak, tracemalloc.get_traced_memory()[1])
+
+            # Propagate Span Peak To Parent
+            stack[-1].peak = max(stack[-1].peak, span.peak)
+
+            # Check If Span Of Kind Was Closed
+            if (span.kind == kind):
+                # Break Loop
+                break
+
+        # Resume Parent Profile
+        self.resume(stack[-1])
+
+    def phase(self, name):
+        # Check If Phase Is Open
+        if (self.top().kind == "phase"):
+            # Close Open Phase
+            self.close("phase")
+
+        # Open Phase Span
+        self.open(name, "phase")
+
+    def dump(self, span, base):
+        # Check If Span Was Profiled
+        if (span.profiles):
+            # Form Path To Span Profile
+            span.pstats = f"{base}.{span.index}.{span.name}.pstats"
+
+            # Write Merged Thread Profiles Of Span
+            pstats.Stats(*span.profiles.values()).dump_stats(span.pstats)
+
+        # Iterate Over Child Spans
+        for child in (span.children):
+            # Write Child Profiles
+            self.dump(child, base)
+
+    def finish(self):
+        # Close Operation Spans Open On Thread
+        self.close("op")
+
+        # Close Phase Spans Open On Thread
+        self.close("phase")
+
+        # Finish Run Span
+        self.root.finish()
+
+        # Check If Memory Is Traced
+        if (tracemalloc.is_tracing()):
+            # Record Run Peak
+            self.root.peak = max(self.root.peak, tracemalloc.get_traced_memory()[1])
+
+            # Stop Tracing Allocations
+            tracemalloc.stop()
+
+        # Write Span Profiles Beside Report
+        self.dump(self.root, os.path.splitext(self.path)[0])
+
+        # Write Span Tree Report
+        with open(self.path, "w") as file:
+            # Write Report As JSON
+            json.dump({"created": time.time(), "argv": sys.argv, "hooks": list(self.hooks), "spans": self.root.to_dict("memory" in self.hooks)}, file, indent = 2)
+
+# End Profile Classes-----------------------------------------------------------------------------------------------------------------------------------------------------
+
+def read_io_syscalls():
+    # Initialize IO Syscall Count
+    syscalls = 0
+
+    try:
+        # Read Process IO Accounting
+        with open("/proc/self/io", "r") as file:
+            # Iterate Over Accounting Lines
+            for line in (file):
+                # Split Accounting Field
+                key, _, value = line.partition(":")
+
+                # Check For Syscall Counters
+                if (key in ("syscr", "syscw")):
+                    # Update IO Syscall Count
+                    syscalls += int(value)
+    except OSError:
+        # Return Unknown Count
+        return (None)
+
+    # Return IO Syscall Count
+    return (syscalls)
+
+def start(path, hooks = ()):
+    # Declare Active Profiler Global
+    global active
+
+    # Set Active Profiler
+    active = Profiler(path, hooks)
+
+def finish():
+    # Declare Active Profiler Global
+    global active
+
+    # Check If Profiler Is Active
+    if (not(active is None)):
+        # Write Profile Reports
+        active.finish()
+
+        # Reset Active Profiler
+        active = None
+
+def phase(name):
+    # Check If Profiler Is Active
+    if (not(active is None)):
+        # Open Phase Span
+        active.phase(name)
+
+def end_phase():
+    # Check If Profiler Is Active
+    if (not(active is None)):
+        # Close Phase Span
+        active.close("phase")
+
+def traced(func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        # Check If Profiler Is Inactive
+        if (active is None):
+            # Return Function Result
+            return (func(*args, **kwargs))
+
+        # Get Active Profiler
+        profiler = active
+
+        # Open Operation Span
+        profiler.open(func.__name__, "op")
+
+        try:
+            # Return Function Result
+            return (func(*args, **kwargs))
+        finally:
+            # Close Operation Span
+            profiler.close("op")
+
+    # Return Traced Function
+    return (wrapper)
+
+def wrap(func):
+    # Check If Processor Is Not Profiled
+    if (active is None or not("cpu" in active.hooks)):
+        # Return Function
+        return (func)
+
+    # Get Active Profiler And Span Of Submitting Thread
+    profiler, span = active, active.top()
+
+    @functools.wraps(func)
+    def wrapper(*args):
+        # Get Profile Of Worker Within Span
+        prof = profiler.thread_profile(span)
+
+        try:
+            # Enable Worker Profile
+            prof.enable()
+        except ValueError:
+            # Return Unprofiled Function Result
+            return (func(*args))
+
+        try:
+            # Return Function Result
+            return (func(*args))
+        finally:
+            # Disable Worker Profile
+            prof.disable()
+
+    # Return Profiled Function
+    return (wrapper)
+
+# End Profile Functions---------------------------------------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,116 @@
+# Developed By Nalin Ahuja, nalinahuja
+
+import os
+import threading
+import collections
+
+from util import cli
+
+# End Imports-------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+# Default Root Weight
+WEIGHT = 1.0
+
+# End Constants-----------------------------------------------------------------------------------------------------------------------------------------------------------
+
+class Load:
+    def __init__(self):
+        # Initialize Active Transfers Per Root
+        self.counts = collections.Counter()
+
+        # Initialize Active Transfers Lock
+        self.lock = threading.Lock()
+
+    def count(self, root):
+        # Protect Active Transfers Access
+        with self.lock:
+            # Return Active Transfers Of Root
+            return (self.counts[root])
+
+    def track(self, root):
+        # Return Active Transfer Tracker
+        return (Tracker(self, root))
+
+class Tracker:
+    def __init__(self, load, root):
+        # Initialize Tracked Load And Root
+        self.load, self.root = load, root
+
+    def __enter__(self):
+        # Protect Active Transfers Update
+        with self.load.lock:
+            # Increment Active Transfers Of Root
+            self.load.counts[self.root] += 1
+
+    def __exit__(self, *args):
+        # Protect Active Transfers Update
+        with self.load.lock:
+            # Decrement Active Transfers Of Root
+            self.load.counts[self.root] -= 1
+
+# End Root Classes--------------------------------------------------------------------------------------------------------------------------------------------------------
+
+def parse(data):
+    # Get Configured Roots
+    roots = data.get("ANNEXFS_ROOTS")
+
+    # Check If Multiple Roots Are Not Configured
+    if (roots is None):
+        # Get Configured Root
+        root = data.get("ANNEXFS_ROOT")
+
+        # Verify Root Is Configured
+        if (root is None):
+            # Raise Error
+            raise ValueError(f"annexfs root is {cli.U}{root}{cli.N}")
+
+        # Set Single Root
+        roots = [root]
+
+    # Verify Configured Roots Form A List
+    if (not(isinstance(roots, list) and roots)):
+        # Raise Error
+        raise ValueError(f"annexfs roots {cli.U}{roots}{cli.N} are not a list")
+
+    # Initialize Parsed Roots
+    parsed = []
+
+    # Iterate Over Configured Roots
+    for root in (roots):
+        # Check If Root Is A Plain Path
+        if (isinstance(root, str)):
+            # Set Root Path And Weight
+            path, weight = root, WEIGHT
+
+        # Check If Root Is A Weighted Path
+        elif (isinstance(root, dict) and isinstance(root.get("path"), str)):
+            # Set Root Path And Weight
+            path, weight = root["path"], root.get("weight", WEIGHT)
+
+        else:
+            # Raise Error
+            raise ValueError(f"annexfs root {cli.U}{root}{cli.N} is malformed")
+
+        # Verify Root Weight Is Positive
+        if (not(isinstance(weight, (int, float)) and weight > 0)):
+            # Raise Error
+            raise ValueError(f"weight of annexfs root {cli.U}{path}{cli.N} is not positive")
+
+        # Append Parsed Root
+        parsed.append((os.path.realpath(os.path.expanduser(path)), float(weight)))
+
+    # Return Parsed Roots
+    return (parsed)
+
+def owner(paths, path):
+    # Iterate Over Root Paths
+    for root in (paths):
+        # Verify Path Resides Under Root
+        if (path.startswith(os.path.join(root, ""))):
+            # Return Owning Root
+            return (root)
+
+    # Return Not Found
+    return (None)
+
+# End Root Functions------------------------------------------------------------------------------------------------------------------------------------------------------
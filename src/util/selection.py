@@ -0,0 +1,57 @@
+# Developed By Nalin Ahuja, nalinahuja
+
+import os
+import stat
+import time
+import fnmatch
+
+from util import manifest
+
+# End Imports-------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+# Seconds Per Day Of File Age
+DAY = 24 * 60 * 60
+
+# End Constants-----------------------------------------------------------------------------------------------------------------------------------------------------------
+
+class Selection:
+    def __init__(self, min_size = 0, include = (), exclude = (), older_than = None):
+        # Initialize Minimum File Size
+        self.min_size = min_size or 0
+
+        # Initialize Included And Excluded Globs
+        self.include, self.exclude = tuple(include or ()), tuple(exclude or ())
+
+        # Initialize Maximum Modification Time Of Selected Files
+        self.cutoff = None if (older_than is None) else int((time.time() - older_than * DAY) * 1e9)
+
+    def matches(self, rel_path, size, mtime_ns):
+        # Verify File Meets Minimum Size
+        if (size < self.min_size):
+            # Return Failure
+            return (False)
+
+        # Verify File Is Old Enough
+        if (not(self.cutoff is None) and (mtime_ns > self.cutoff)):
+            # Return Failure
+            return (False)
+
+        # Verify File Matches An Included Glob If Any Are Specified
+        if (self.include and not(any(match(rel_path, pattern) for pattern in (self.include)))):
+            # Return Failure
+            return (False)
+
+        # Return Whether File Matches No Excluded Glob
+        return (not(any(match(rel_path, pattern) for pattern in (self.exclude))))
+
+    def select(self, tree):
+        # Return Indices Of Matching Regular Files Outside Hardlink Groups
+        return ([i for (i, rel_path) in tree.regular() if (stat.S_ISREG(tree.modes[i]) and not(tree.flags[i] & manifest.HARDLINK) and self.matches(rel_path, tree.sizes[i], tree.mtimes[i]))])
+
+# End Selection Classes---------------------------------------------------------------------------------------------------------------------------------------------------
+
+def match(rel_path, pattern):
+    # Return Whether Relative Path Or Name Matches Glob Without Separators
+    return (fnmatch.fnmatchcase(rel_path, pattern) or (not(os.sep in pattern) and fnmatch.fnmatchcase(os.path.basename(rel_path), pattern)))
+
+# End Selection Functions-------------------------------------------------------------------------------------------------------------------------------------------------
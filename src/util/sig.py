@@ -1,5 +1,7 @@
 # Developed By Nalin Ahuja, nalinahuja
 
+import threading
+
 from signal import *
 
 # End Imports-------------------------------------------------------------------------------------------------------------------------------------------------------------
@@ -13,11 +15,15 @@ class SignalProtector:
         self.sigmask = None
 
     def __enter__(self):
-        # Save Signal Mask
-        self.sigmask = signal(self.sigtype, SIG_IGN)
+        # Verify Signal Handlers Can Be Set From This Thread
+        if (threading.current_thread() is threading.main_thread()):
+            # Save Signal Mask
+            self.sigmask = signal(self.sigtype, SIG_IGN)
 
     def __exit__(self, *args):
-        # Restore Signal Mask
-        signal(self.sigtype, self.sigmask)
+        # Verify Signal Mask Was Saved
+        if (not(self.sigmask is None)):
+            # Restore Signal Mask
+            signal(self.sigtype, self.sigmask)
 
 # End Signal Classes------------------------------------------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,138 @@
+# Developed By Nalin Ahuja, nalinahuja
+
+import sys
+import time
+import threading
+import collections
+
+from util import cli
+from util import profile
+
+# End Imports-------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+# Progress Render Interval
+RENDER_INTERVAL = 0.25
+
+# End Constants-----------------------------------------------------------------------------------------------------------------------------------------------------------
+
+class Stats:
+    def __init__(self, display = False):
+        # Initialize Progress Display State
+        self.display, self.rendered = display, 0
+
+        # Initialize Phase Timings
+        self.phases = collections.OrderedDict()
+
+        # Initialize Current Phase
+        self.current = self.current_start = None
+
+        # Initialize Operation Start Time
+        self.started = time.monotonic()
+
+        # Initialize Expected And Completed Totals
+        self.total_bytes = self.total_files = self.done_bytes = self.done_files = 0
+
+        # Declare Copy Start Time
+        self.copy_start = None
+
+        # Initialize Statistics Lock
+        self.lock = threading.Lock()
+
+    def phase(self, name):
+        # Close Current Phase
+        self.close()
+
+        # Start New Phase
+        self.current, self.current_start = name, time.monotonic()
+
+        # Open Profiled Phase Span
+        profile.phase(name)
+
+    def close(self):
+        # Check If Phase Is Active
+        if (not(self.current is None)):
+            # Accumulate Phase Timing
+            self.phases[self.current] = self.phases.get(self.current, 0) + (time.monotonic() - self.current_start)
+
+            # Reset Current Phase
+            self.current = self.current_start = None
+
+            # Close Profiled Phase Span
+            profile.end_phase()
+
+    def expect(self, total_bytes, total_files):
+        # Protect Statistics Update
+        with self.lock:
+            # Set Expected Totals
+            self.total_bytes, self.total_files = total_bytes, total_files
+
+            # Set Copy Start Time
+            self.copy_start = time.monotonic()
+
+    def update(self, done_bytes = 0, done_files = 0):
+        # Protect Statistics Update
+        with self.lock:
+            # Update Completed Totals
+            self.done_bytes += done_bytes
+            self.done_files += done_files
+
+            # Check If Progress Should Be Rendered
+            if (self.display and (time.monotonic() - self.rendered >= RENDER_INTERVAL)):
+                # Render Progress
+                cli.write(cli.CL + self.progress(), end = "", file = sys.stderr)
+
+                # Update Render Time
+                self.rendered = time.monotonic()
+
+    def rates(self):
+        # Get Copy Elapsed Time
+        elapsed = (time.monotonic() - self.copy_start) if (self.copy_start) else 0
+
+        # Check If Time Has Elapsed
+        if (elapsed <= 0):
+            # Return Zero Rates
+            return (0, 0, None)
+
+        # Compute Byte And File Rates
+        byte_rate, file_rate = self.done_bytes / elapsed, self.done_files / elapsed
+
+        # Compute Estimated Time Remaining
+        eta = ((self.total_bytes - self.done_bytes) / byte_rate) if (byte_rate > 0) else None
+
+        # Return Rates
+        return (byte_rate, file_rate, eta)
+
+    def progress(self):
+        # Get Transfer Rates
+        byte_rate, file_rate, eta = self.rates()
+
+        # Format Estimated Time Remaining
+        eta = time.strftime("%H:%M:%S", time.gmtime(max(0, eta))) if not(eta is None) else "--:--:--"
+
+        # Return Progress Line
+        return (f"{cli.size(self.done_bytes)} / {cli.size(self.total_bytes)}, {self.done_files} / {self.total_files} file(s), {cli.size(byte_rate)}/s, {file_rate:.1f} file(s)/s, ETA {eta}")
+
+    def finish(self):
+        # Close Current Phase
+        self.close()
+
+        # Check If Progress Was Rendered
+        if (self.display and self.rendered):
+            # Render Final Progress
+            cli.write(cli.CL + self.progress(), file = sys.stderr)
+
+    def to_dict(self):
+        # Get Transfer Rates
+        byte_rate, file_rate, _ = self.rates()
+
+        # Return Statistics Fields
+        return ({
+            "phases": dict(self.phases),
+            "total_seconds": time.monotonic() - self.started,
+            "bytes": self.done_bytes,
+            "files": self.done_files,
+            "bytes_per_second": byte_rate,
+            "files_per_second": file_rate,
+        })
+
+# End Statistics Classes--------------------------------------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,85 @@
+# Developed By Nalin Ahuja, nalinahuja
+
+import os
+import json
+import threading
+
+# End Imports-------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+# Store Directory Name
+NAME = ".annexfs-store"
+
+# Entry Metadata File Name
+META = ".axfs-dedup"
+
+# End Constants-----------------------------------------------------------------------------------------------------------------------------------------------------------
+
+def blob(root_path, hex_digest):
+    # Return Path To Blob Of Digest
+    return (os.path.join(root_path, NAME, hex_digest[:2], hex_digest))
+
+def put(root_path, copy):
+    # Form Path To Store Directory
+    store_path = os.path.join(root_path, NAME)
+
+    # Create Store Directory
+    os.makedirs(store_path, exist_ok = True)
+
+    # Form Path To Temporary Blob
+    tmp_path = os.path.join(store_path, f".{os.getpid()}.{threading.get_ident()}.tmp")
+
+    try:
+        # Copy Content To Temporary Blob And Get Its Digest
+        hex_digest = copy(tmp_path)
+
+        # Form Path To Blob
+        blob_path = blob(root_path, hex_digest)
+
+        # Check If Blob Is Already Stored
+        if (os.path.exists(blob_path)):
+            # Return Existing Blob
+            return (blob_path, hex_digest, False)
+
+        # Create Blob Directory
+        os.makedirs(os.path.dirname(blob_path), exist_ok = True)
+
+        # Disable Blob Writes
+        os.chmod(tmp_path, 0o444)
+
+        try:
+            # Publish Temporary Blob At Content Address
+            os.link(tmp_path, blob_path)
+        except FileExistsError:
+            # Return Concurrently Stored Blob
+            return (blob_path, hex_digest, False)
+    finally:
+        # Check If Temporary Blob Exists
+        if (os.path.exists(tmp_path)):
+            # Remove Temporary Blob
+            os.remove(tmp_path)
+
+    # Return Stored Blob
+    return (blob_path, hex_digest, True)
+
+def remove(root_path, hex_digest):
+    # Form Path To Blob
+    blob_path = blob(root_path, hex_digest)
+
+    # Check If Blob Exists
+    if (os.path.exists(blob_path)):
+        # Remove Blob
+        os.remove(blob_path)
+
+def write_meta(enc_path, meta):
+    # Write Entry Metadata File
+    with open(os.path.join(enc_path, META), "w") as file:
+        # Write Metadata Of Deduplicated Files
+        json.dump(meta, file)
+
+def read_meta(enc_path):
+    # Read Entry Metadata File
+    with open(os.path.join(enc_path, META), "r") as file:
+        # Return Metadata Of Deduplicated Files
+        return (json.load(file))
+
+# End Store Functions-----------------------------------------------------------------------------------------------------------------------------------------------------
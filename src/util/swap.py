@@ -0,0 +1,50 @@
+# Developed By Nalin Ahuja, nalinahuja
+
+import os
+import errno
+import ctypes
+
+# End Imports-------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+# Current Working Directory Descriptor
+__AT_FDCWD = -100
+
+# Rename Exchange Flag
+__RENAME_EXCHANGE = 2
+
+# Rename Exchange Unsupported Errors
+__UNSUPPORTED_ERRORS = (errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP)
+
+# C Library Rename Function With Flags
+__RENAMEAT2 = getattr(ctypes.CDLL(None, use_errno = True), "renameat2", None)
+
+# Check If Rename Function Is Available
+if (not(__RENAMEAT2 is None)):
+    # Set Rename Function Argument Types
+    __RENAMEAT2.argtypes = (ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_uint)
+
+# End Constants-----------------------------------------------------------------------------------------------------------------------------------------------------------
+
+def exchange(path_a, path_b):
+    # Verify Rename Function Is Available
+    if (__RENAMEAT2 is None):
+        # Return Failure
+        return (False)
+
+    # Exchange Paths Atomically
+    if (__RENAMEAT2(__AT_FDCWD, os.fsencode(path_a), __AT_FDCWD, os.fsencode(path_b), __RENAME_EXCHANGE) == 0):
+        # Return Success
+        return (True)
+
+    # Get Exchange Error
+    err = ctypes.get_errno()
+
+    # Check If Exchange Is Unsupported By Kernel Or File System
+    if (err in __UNSUPPORTED_ERRORS):
+        # Return Failure
+        return (False)
+
+    # Raise Error
+    raise OSError(err, os.strerror(err), path_a, None, path_b)
+
+# End Swap Functions------------------------------------------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,44 @@
+# Developed By Nalin Ahuja, nalinahuja
+
+import time
+import threading
+
+# End Imports-------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+class Bucket:
+    def __init__(self, rate, burst = None):
+        # Initialize Refill Rate And Bucket Capacity
+        self.rate, self.burst = rate, burst or rate
+
+        # Initialize Available Tokens And Refill Time
+        self.tokens, self.stamp = self.burst, time.monotonic()
+
+        # Initialize Bucket Lock
+        self.lock = threading.Lock()
+
+    def consume(self, count):
+        # Verify Rate Is Limited
+        if (not(self.rate)):
+            # Return Immediately
+            return
+
+        # Protect Bucket Update
+        with self.lock:
+            # Get Current Time
+            now = time.monotonic()
+
+            # Refill Tokens Up To Bucket Capacity
+            self.tokens, self.stamp = min(self.burst, self.tokens + (now - self.stamp) * self.rate), now
+
+            # Take Tokens Allowing Debt
+            self.tokens -= count
+
+            # Compute Delay Until Debt Is Repaid
+            delay = -self.tokens / self.rate if (self.tokens < 0) else 0
+
+        # Check If Caller Should Wait
+        if (delay > 0):
+            # Wait For Debt Repayment
+            time.sleep(delay)
+
+# End Throttle Classes----------------------------------------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,83 @@
+# Developed By Nalin Ahuja, nalinahuja
+
+import os
+import fcntl
+
+# End Imports-------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+# Trash Directory Name
+NAME = ".annexfs-trash"
+
+# Reaper Lock File Name
+LOCK = ".annexfs-trash.lock"
+
+# End Constants-----------------------------------------------------------------------------------------------------------------------------------------------------------
+
+class Lock:
+    def __init__(self, root_path):
+        # Initialize Lock Path
+        self.path = os.path.join(root_path, LOCK)
+
+        # Declare Lock File
+        self.file = None
+
+    def __enter__(self):
+        # Open Lock File
+        self.file = open(self.path, "a")
+
+        try:
+            # Acquire Exclusive Lock Without Waiting
+            fcntl.flock(self.file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            # Close Lock File
+            self.file.close()
+
+            # Reset Lock File
+            self.file = None
+
+        # Return Lock Status
+        return (not(self.file is None))
+
+    def __exit__(self, *args):
+        # Check If Lock Is Held
+        if (not(self.file is None)):
+            # Release Lock
+            fcntl.flock(self.file, fcntl.LOCK_UN)
+
+            # Close Lock File
+            self.file.close()
+
+            # Reset Lock File
+            self.file = None
+
+# End Trash Classes-------------------------------------------------------------------------------------------------------------------------------------------------------
+
+def mount_point(path):
+    # Get Absolute Path
+    path = os.path.abspath(path)
+
+    # Iterate Until Mount Point Is Reached
+    while (not(os.path.ismount(path))):
+        # Move To Parent Directory
+        path = os.path.dirname(path)
+
+    # Return Mount Point
+    return (path)
+
+def is_owned(path):
+    # Get Path Statistics
+    path_stat = os.stat(path)
+
+    # Return Whether Path Is Owned And Writable By User
+    return ((path_stat.st_uid == os.getuid()) and os.access(path, os.W_OK))
+
+def items(trash_path):
+    # Verify Trash Directory Exists
+    if (not(os.path.isdir(trash_path))):
+        # Return No Items
+        return ([])
+
+    # Return Paths To Trash Items
+    return ([os.path.join(trash_path, name) for name in os.listdir(trash_path)])
+
+# End Trash Functions-----------------------------------------------------------------------------------------------------------------------------------------------------